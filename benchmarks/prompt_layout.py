@@ -0,0 +1,108 @@
+"""Compare Ollama prompt evaluation cost of the agent prompt layouts.
+
+Runs the same debate once per ``PromptLayout`` against a local Ollama server
+and reports, per layout, the prompt tokens Ollama actually evaluated and the
+total ``prompt_eval_duration``. Tokens served from the server's prompt (KV)
+cache are not evaluated again, so the shared-prefix layout should show
+fewer evaluated tokens and a shorter prompt-eval time.
+
+Usage:
+    python benchmarks/prompt_layout.py --model llama3.2 --rounds 2
+"""
+
+import argparse
+
+import ollama
+
+from vindicta_oracle.agents import PromptLayout
+from vindicta_oracle.engine import DebateEngine
+from vindicta_oracle.events import NullSink
+from vindicta_oracle.models import DebateContext
+from vindicta_oracle.ollama_client import OllamaConfig
+
+CONTEXT = DebateContext(
+    player1_faction="Space Marines",
+    player1_list="Captain in Gravis Armour, 2x 5 Intercessors, Redemptor "
+    "Dreadnought, 3 Eradicators, 5 Hellblasters",
+    player2_faction="Tyranids",
+    player2_list="Hive Tyrant, 2x 10 Termagants, Neurotyrant, 2 Carnifexes, "
+    "3 Zoanthropes",
+    mission="Take and Hold (Leviathan)",
+    terrain="Mixed urban ruins with scatter terrain",
+)
+
+
+class MeasuringClient:
+    """Blocking Ollama client that records prompt-eval stats per request."""
+
+    def __init__(self, config: OllamaConfig):
+        self.config = config
+        self._client = ollama.Client(host=config.host)
+        self.samples: list[tuple[int, int]] = []
+
+    def generate(self, system_prompt: str, user_prompt: str) -> str:
+        """Generate a response and record its prompt-eval count and time."""
+        options = {
+            "temperature": self.config.temperature,
+            "num_predict": self.config.max_tokens,
+        }
+        if self.config.seed is not None:
+            options["seed"] = self.config.seed
+        response = self._client.chat(
+            model=self.config.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            options=options,
+            keep_alive=self.config.keep_alive,
+        )
+        self.samples.append(
+            (
+                response.get("prompt_eval_count") or 0,
+                response.get("prompt_eval_duration") or 0,
+            )
+        )
+        return response["message"]["content"]
+
+
+def run(layout: PromptLayout, config: OllamaConfig, rounds: int) -> list:
+    """Run one debate with ``layout`` and return its prompt-eval samples."""
+    client = MeasuringClient(config)
+    engine = DebateEngine(
+        config=config, num_rounds=rounds, sink=NullSink(), prompt_layout=layout
+    )
+    for agent in engine.agents:
+        agent.client = client
+    engine.run_debate(CONTEXT)
+    return client.samples
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="llama3.2")
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep-alive", default="10m")
+    args = parser.parse_args()
+
+    config = OllamaConfig(model=args.model, seed=args.seed, keep_alive=args.keep_alive)
+    # Load the model first so neither run pays the load time
+    ollama.Client(host=config.host).chat(
+        model=config.model, messages=[], keep_alive=config.keep_alive
+    )
+
+    print(f"{'layout':<15}{'turns':>7}{'eval tokens':>13}{'eval s':>9}{'ms/turn':>9}")
+    for layout in PromptLayout:
+        samples = run(layout, config, args.rounds)
+        tokens = sum(count for count, _ in samples)
+        seconds = sum(duration for _, duration in samples) / 1e9
+        print(
+            f"{layout.value:<15}{len(samples):>7}{tokens:>13}"
+            f"{seconds:>9.2f}{seconds * 1000 / len(samples):>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
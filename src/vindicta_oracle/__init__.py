@@ -6,10 +6,23 @@ from vindicta_oracle.models import (
     ArgumentType,
     DebateContext,
     DebateTranscript,
+    RoutingTable,
     Vote,
 )
+from vindicta_oracle.cache import ResponseCache
 from vindicta_oracle.engine import DebateEngine
-from vindicta_oracle.ollama_client import OllamaClient, OllamaConfig
+from vindicta_oracle.events import (
+    ConsoleSink,
+    EventSink,
+    LoggingSink,
+    NullSink,
+    QueueSink,
+)
+from vindicta_oracle.ollama_client import (
+    AsyncOllamaClient,
+    OllamaClient,
+    OllamaConfig,
+)
 
 __all__ = [
     "AgentRole",
@@ -17,8 +30,16 @@ __all__ = [
     "ArgumentType",
     "DebateContext",
     "DebateTranscript",
+    "RoutingTable",
     "Vote",
     "DebateEngine",
+    "EventSink",
+    "ConsoleSink",
+    "LoggingSink",
+    "NullSink",
+    "QueueSink",
+    "ResponseCache",
+    "AsyncOllamaClient",
     "OllamaClient",
     "OllamaConfig",
 ]
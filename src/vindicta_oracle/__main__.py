@@ -1,10 +1,17 @@
 """Meta-Oracle CLI - Run AI council debates locally."""
 
 import argparse
+import logging
+from pathlib import Path
 
-from vindicta_oracle.models import DebateContext
+from vindicta_oracle.agents import PromptLayout
+from vindicta_oracle.agents.base import DEFAULT_STOP_SEQUENCES
+from vindicta_oracle.cache import ResponseCache
+from vindicta_oracle.models import DebateContext, RoutingTable
 from vindicta_oracle.engine import DebateEngine
+from vindicta_oracle.events import ConsoleSink, LoggingSink, NullSink
 from vindicta_oracle.ollama_client import OllamaConfig
+from vindicta_oracle.vote_reader import VoteLimits
 
 
 def main():
@@ -16,6 +23,7 @@ def main():
 Examples:
   python -m vindicta_oracle
   python -m vindicta_oracle --model mistral --rounds 2
+  python -m vindicta_oracle --concurrency 5
   python -m vindicta_oracle --p1-faction "Orks" --p2-faction "Imperial Knights"
         """,
     )
@@ -42,16 +50,154 @@ Examples:
         "--temperature", type=float, default=0.7, help="LLM temperature (default: 0.7)"
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Agent turns generated in parallel per round (default: 1)",
+    )
+    parser.add_argument(
+        "--vote-timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for each agent's vote before it abstains",
+    )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        metavar="PATH",
+        help="SQLite file caching LLM responses across runs (default: off)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="LLM sampling seed (default: random)"
+    )
+    parser.add_argument(
+        "--history-budget",
+        type=int,
+        default=None,
+        metavar="TOKENS",
+        help="Condense older rounds to keep each prompt's history under this",
+    )
+    parser.add_argument(
+        "--summarize",
+        action="store_true",
+        help="Prompt agents with a rolling summary plus the latest round only",
+    )
+    parser.add_argument(
+        "--prompt-layout",
+        choices=[layout.value for layout in PromptLayout],
+        default=PromptLayout.CLASSIC.value,
+        help="shared_prefix lets Ollama reuse the prompt cache across agents",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        default=None,
+        help="How long Ollama keeps the model loaded, e.g. 30m (default: server)",
+    )
+    parser.add_argument(
+        "--council-mode",
+        action="store_true",
+        help="Generate all five turns of a round in a single request",
+    )
+    parser.add_argument(
+        "--fuse-votes",
+        action="store_true",
+        help="Collect votes with the final round instead of a vote phase",
+    )
+    parser.add_argument(
+        "--structured-votes",
+        action="store_true",
+        help="Request votes as schema-validated JSON",
+    )
+    parser.add_argument(
+        "--vote-sentences",
+        type=int,
+        help="Stop each vote once its reasoning has this many sentences",
+    )
+    parser.add_argument(
+        "--vote-chars",
+        type=int,
+        help="Stop each vote once its reasoning has this many characters",
+    )
+    parser.add_argument(
+        "--stop-sequences",
+        action="store_true",
+        help="Stop agents that go on to write other council members' turns",
+    )
+    parser.add_argument(
+        "--adaptive",
+        action="store_true",
+        help="Stop before --rounds once the council agrees",
+    )
+    parser.add_argument(
+        "--min-agreement",
+        type=float,
+        default=1.0,
+        help="Share of agents that must agree to stop early (default: 1.0)",
+    )
+    parser.add_argument(
+        "--min-confidence",
+        type=float,
+        default=0.7,
+        help="Mean confidence the agreeing agents need (default: 0.7)",
+    )
+    parser.add_argument(
+        "--routing",
+        metavar="JSON",
+        help=(
+            "Model and budget per role and phase, as JSON or a path to a JSON "
+            """file, e.g. '{"chaos.*": {"model": "llama3.2:1b"}, """
+            """"*.vote": {"max_tokens": 128}}'"""
+        ),
+    )
+    parser.add_argument(
+        "--events",
+        choices=["console", "log", "none"],
+        default="console",
+        help="How debate progress is reported (default: console)",
+    )
+
     args = parser.parse_args()
 
     # Configure Ollama
     config = OllamaConfig(
         model=args.model,
         temperature=args.temperature,
+        seed=args.seed,
+        keep_alive=args.keep_alive,
     )
 
+    if args.events == "log":
+        logging.basicConfig(level=logging.INFO)
+    sinks = {"console": ConsoleSink, "log": LoggingSink, "none": NullSink}
+
+    vote_limits = None
+    if args.vote_sentences or args.vote_chars:
+        vote_limits = VoteLimits(
+            max_sentences=args.vote_sentences, max_chars=args.vote_chars
+        )
+
     # Create debate engine
-    engine = DebateEngine(config=config, num_rounds=args.rounds)
+    engine = DebateEngine(
+        config=config,
+        num_rounds=args.rounds,
+        max_concurrency=args.concurrency,
+        vote_timeout=args.vote_timeout,
+        cache=ResponseCache(path=args.cache) if args.cache else None,
+        sink=sinks[args.events](),
+        history_budget=args.history_budget,
+        summarize=args.summarize,
+        prompt_layout=PromptLayout(args.prompt_layout),
+        adaptive_rounds=args.adaptive,
+        council_mode=args.council_mode,
+        fuse_votes=args.fuse_votes,
+        structured_votes=args.structured_votes,
+        min_agreement=args.min_agreement,
+        min_confidence=args.min_confidence,
+        stop_sequences=DEFAULT_STOP_SEQUENCES if args.stop_sequences else None,
+        vote_limits=vote_limits,
+        routing=_load_routing(args.routing) if args.routing else None,
+    )
 
     # Set up the matchup context
     context = DebateContext(
@@ -73,6 +219,14 @@ Examples:
     print(f"\n📄 Full transcript saved to {args.output}")
 
 
+def _load_routing(value: str) -> RoutingTable:
+    """Parse ``--routing`` given inline or as a path to a JSON file."""
+    path = Path(value)
+    if not value.lstrip().startswith("{") and path.is_file():
+        value = path.read_text()
+    return RoutingTable.model_validate_json(value)
+
+
 def _get_sample_list(faction: str) -> str:
     """Return a sample army list for a given faction."""
     lists = {
@@ -1,6 +1,6 @@
 """Meta-Oracle council agents and stubs."""
 
-from vindicta_oracle.agents.base import BaseAgent
+from vindicta_oracle.agents.base import BaseAgent, PromptLayout
 from vindicta_oracle.agents.home import HomeAgent
 from vindicta_oracle.agents.adversary import AdversaryAgent
 from vindicta_oracle.agents.arbiter import ArbiterAgent
@@ -51,6 +51,7 @@ class StubAgent(BaseOracleAgent):
 
 __all__ = [
     "BaseAgent",
+    "PromptLayout",
     "HomeAgent",
     "AdversaryAgent",
     "ArbiterAgent",
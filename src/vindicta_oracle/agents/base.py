@@ -2,6 +2,10 @@
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from enum import Enum
+
+from pydantic import ValidationError
 
 from vindicta_oracle.models import (
     AgentRole,
@@ -10,13 +14,79 @@ from vindicta_oracle.models import (
     DebateContext,
     DebateTranscript,
     Vote,
+    VoteBallot,
+    role_name,
 )
 from vindicta_oracle.ollama_client import OllamaClient
+from vindicta_oracle.telemetry import collect_telemetry
+from vindicta_oracle.vote_reader import VoteLimits, VoteReader, read_vote_fields
+
+
+class PromptLayout(str, Enum):
+    """How an agent arranges its prompts."""
+
+    # Agent system prompt first, round details interleaved before the history
+    CLASSIC = "classic"
+    # One council-wide system prompt and a shared matchup/history prefix,
+    # with the agent's role and task at the tail, so every agent in a round
+    # sends the same leading tokens and Ollama can reuse their KV cache
+    SHARED_PREFIX = "shared_prefix"
+
+
+SHARED_SYSTEM_PROMPT = """You are a member of the Meta-Oracle council, five AI agents debating the outcome of a Warhammer 40K matchup.
+
+Each request gives the matchup and the debate so far, followed by your individual role and task. Stay strictly in that role."""
+
+VOTE_FORMAT = """You MUST respond in this EXACT format:
+WINNER: [Player 1 or Player 2 or Draw]
+PROBABILITY: [number between 0 and 100]%
+REASONING: [your reasoning in 2-3 sentences]"""
+
+STANCE_FORMAT = """End your response with one line in this EXACT format:
+STANCE: [Player 1 or Player 2 or Draw] [number between 0 and 100]%"""
+
+VOTE_TRAILER = f"""This is the final round. After your argument, cast your final vote: write a line containing only VOTE: and then the vote.
+
+{VOTE_FORMAT}"""
+
+STRUCTURED_VOTE_FORMAT = """Respond with a JSON object with these fields:
+- prediction: "Player 1 wins", "Player 2 wins" or "Draw"
+- win_probability: how likely your predicted outcome is, from 0 to 1
+- reasoning: your reasoning in 2-3 sentences"""
+
+# JSON votes are short and predictable, so they get a tight token cap
+VOTE_MAX_TOKENS = 192
+
+# Stop sequences for each phase ("respond" or "vote"). Models sometimes go on
+# to write the other council members' turns after their own; these end the
+# generation at the first such turn.
+DEFAULT_STOP_SEQUENCES: dict[str, list[str]] = {
+    phase: [f"\n[{role_name(role)}]:" for role in AgentRole]
+    for phase in ("respond", "vote")
+}
+
+_VOTE_MARKER = re.compile(r"^\W*VOTE\W*$", re.IGNORECASE | re.MULTILINE)
+_WINNER_LINE = re.compile(r"^\W*WINNER\b", re.IGNORECASE | re.MULTILINE)
+
+_STANCE_LINE = re.compile(r"^\W*STANCE\b(?P<stance>.*)$", re.IGNORECASE | re.MULTILINE)
 
 
 class BaseAgent(ABC):
     """Abstract base class for all council agents."""
 
+    layout: PromptLayout = PromptLayout.CLASSIC
+    # Ask for a trailing STANCE line on each argument (see _extract_stance)
+    report_stance: bool = False
+    # Request votes as schema-constrained JSON (see _structured_vote)
+    structured_votes: bool = False
+    vote_retries: int = 1
+    # Per-phase stop sequences, keyed "respond" or "vote"
+    stop_sequences: dict[str, list[str]] | None = None
+    # Cut votes off once their reasoning reaches these limits
+    vote_limits: VoteLimits | None = None
+    # Clients for phases routed away from ``client``, keyed by phase
+    phase_clients: dict[str, OllamaClient] | None = None
+
     def __init__(self, client: OllamaClient | None = None):
         self.client = client or OllamaClient()
 
@@ -54,12 +124,66 @@ Terrain: {context.terrain or "Mixed"}
 Provide your initial analysis based on your role. Be specific about units and tactics."""
         return self.client.generate(self.system_prompt, prompt)
 
-    def respond(self, transcript: DebateTranscript, round_num: int) -> Argument:
-        """Generate a response based on debate history."""
+    def respond(
+        self,
+        transcript: DebateTranscript,
+        round_num: int,
+        on_token: Callable[[str], None] | None = None,
+    ) -> Argument:
+        """Generate a response based on debate history.
+
+        If ``on_token`` is given, the response is streamed to it chunk by
+        chunk as it is generated.
+        """
+        return self._respond(transcript, round_num, on_token)
+
+    def respond_and_vote(
+        self,
+        transcript: DebateTranscript,
+        round_num: int,
+        on_token: Callable[[str], None] | None = None,
+    ) -> tuple[Argument, Vote | None]:
+        """Final-round turn that also casts the agent's vote.
+
+        The vote is requested as a trailer after the argument, saving a
+        separate full-debate vote request. Returns ``None`` for the vote
+        if the trailer is missing, so the caller can fall back to ``vote``.
+        """
+        argument = self._respond(transcript, round_num, on_token, VOTE_TRAILER)
+        marker = _VOTE_MARKER.search(argument.content) or _WINNER_LINE.search(
+            argument.content
+        )
+        if marker is None:
+            return argument, None
+        trailer = argument.content[marker.start() :]
+        argument.content = argument.content[: marker.start()].strip()
+        return argument, self._parse_vote(trailer)
+
+    def _respond(
+        self,
+        transcript: DebateTranscript,
+        round_num: int,
+        on_token: Callable[[str], None] | None = None,
+        trailer: str = "",
+    ) -> Argument:
+        """Generate a turn, with ``trailer`` appended to its instructions."""
         history = self._format_history(transcript, round_num)
         context = transcript.context
+        # A trailer ends the debate, so no interim stance is needed with it
+        extra = ""
+        if trailer:
+            extra = f"\n\n{trailer}"
+        elif self.report_stance:
+            extra = f"\n\n{STANCE_FORMAT}"
 
-        prompt = f"""Round {round_num} of the council debate.
+        if self.layout == PromptLayout.SHARED_PREFIX:
+            task = f"""Round {round_num} of the council debate. Now speak according to your role.
+Be specific about units, abilities, and tactical implications.
+Keep your response focused and under 200 words.{extra}"""
+            prompt = self._shared_prompt(context, history, task)
+            system_prompt = SHARED_SYSTEM_PROMPT
+        else:
+            prompt = f"""Round {round_num} of the council debate.
 
 MATCHUP:
 - Player 1: {context.player1_faction}
@@ -70,22 +194,48 @@ Previous arguments this debate:
 {history}
 
 Now speak according to your role. Be specific about units, abilities, and tactical implications.
-Keep your response focused and under 200 words."""
+Keep your response focused and under 200 words.{extra}"""
+            system_prompt = None
 
-        content = self.client.generate(self.system_prompt, prompt)
-        return Argument(
+        with collect_telemetry(self.role, "respond", round_num) as calls:
+            content = self._generate(
+                prompt,
+                on_token,
+                system_prompt=system_prompt,
+                stop=self._stop("respond"),
+            )
+
+        argument = Argument(
             agent_role=self.role,
             round=round_num,
             argument_type=ArgumentType.CLAIM,
             content=content,
+            telemetry=calls,
         )
+        if self.report_stance:
+            self._extract_stance(argument)
+        return argument
 
-    def vote(self, transcript: DebateTranscript) -> Vote:
+    def vote(
+        self,
+        transcript: DebateTranscript,
+        on_token: Callable[[str], None] | None = None,
+    ) -> Vote:
         """Cast final prediction vote after debate."""
         summary = self._format_full_debate(transcript)
         context = transcript.context
 
-        prompt = f"""The council debate has concluded.
+        instructions = STRUCTURED_VOTE_FORMAT if self.structured_votes else VOTE_FORMAT
+
+        system_prompt = None
+        if self.layout == PromptLayout.SHARED_PREFIX:
+            system_prompt = SHARED_SYSTEM_PROMPT
+            task = f"""The council debate has concluded. Now cast your final vote.
+
+{instructions}"""
+            prompt = self._shared_prompt(context, summary, task)
+        else:
+            prompt = f"""The council debate has concluded.
 
 MATCHUP: {context.player1_faction} vs {context.player2_faction}
 
@@ -94,48 +244,230 @@ Full debate transcript:
 
 Now cast your final vote.
 
-You MUST respond in this EXACT format:
-WINNER: [Player 1 or Player 2 or Draw]
-PROBABILITY: [number between 0 and 100]%
-REASONING: [your reasoning in 2-3 sentences]"""
+{instructions}"""
+
+        with collect_telemetry(self.role, "vote") as calls:
+            vote = self._cast_vote(prompt, on_token, system_prompt)
+        vote.telemetry = calls
+        return vote
+
+    def _cast_vote(
+        self,
+        prompt: str,
+        on_token: Callable[[str], None] | None = None,
+        system_prompt: str | None = None,
+    ) -> Vote:
+        """Generate and parse the vote in the configured format."""
+        if self.structured_votes:
+            return self._structured_vote(prompt, on_token, system_prompt)
+        if self.vote_limits is None:
+            response = self._generate(
+                prompt,
+                on_token,
+                system_prompt=system_prompt,
+                stop=self._stop("vote"),
+                phase="vote",
+            )
+            return self._parse_vote(response)
+
+        # Stream the vote and stop once its fields and reasoning are complete
+        reader = VoteReader(self.vote_limits)
+        self._generate(
+            prompt,
+            on_token,
+            system_prompt=system_prompt,
+            stop=self._stop("vote"),
+            until=reader.feed,
+            phase="vote",
+        )
+        return self._parse_vote(reader.text)
+
+    def _structured_vote(
+        self,
+        prompt: str,
+        on_token: Callable[[str], None] | None = None,
+        system_prompt: str | None = None,
+    ) -> Vote:
+        """Request the vote as schema-constrained JSON and validate it.
+
+        Invalid output is retried up to ``vote_retries`` times, telling the
+        model what was wrong (which also keeps a response cache from
+        replaying the bad answer). If every attempt fails, the last response
+        goes through the free-text parser instead.
+        """
+        schema = VoteBallot.model_json_schema()
+        max_tokens = VOTE_MAX_TOKENS
+        if self.phase_clients and "vote" in self.phase_clients:
+            # A routed vote budget can only tighten the JSON vote cap
+            routed = self.phase_clients["vote"].config.max_tokens
+            max_tokens = min(max_tokens, routed)
+        if self.vote_limits is not None and self.vote_limits.max_chars is not None:
+            schema["properties"]["reasoning"]["maxLength"] = self.vote_limits.max_chars
+        response = ""
+        for _ in range(self.vote_retries + 1):
+            response = self._generate(
+                prompt,
+                on_token,
+                system_prompt=system_prompt,
+                format=schema,
+                max_tokens=max_tokens,
+                stop=self._stop("vote"),
+                phase="vote",
+            )
+            try:
+                ballot = VoteBallot.model_validate_json(response)
+            except ValidationError as e:
+                error = e.errors()[0]["msg"] if e.errors() else str(e)
+                prompt = f"""{prompt}
 
-        response = self.client.generate(self.system_prompt, prompt)
+Your previous answer was invalid ({error}). Reply with only the JSON object."""
+                continue
+            return Vote(agent_role=self.role, confidence=0.7, **ballot.model_dump())
         return self._parse_vote(response)
 
+    def _shared_prompt(self, context: DebateContext, history: str, task: str) -> str:
+        """User prompt for the shared-prefix layout.
+
+        Everything before the role section is identical for every agent
+        reading the same rounds (as is ``SHARED_SYSTEM_PROMPT``).
+        """
+        return f"""MATCHUP:
+- Player 1: {context.player1_faction}
+{context.player1_list}
+- Player 2: {context.player2_faction}
+{context.player2_list}
+- Mission: {context.mission or "Standard"}
+- Terrain: {context.terrain or "Mixed"}
+
+DEBATE SO FAR:
+{history}
+
+YOUR ROLE:
+{self.system_prompt}
+
+YOUR TASK:
+{task}"""
+
+    def _generate(
+        self,
+        prompt: str,
+        on_token: Callable[[str], None] | None = None,
+        system_prompt: str | None = None,
+        format: dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+        until: Callable[[str], bool] | None = None,
+        phase: str = "respond",
+    ) -> str:
+        """Generate with the agent's system prompt, optionally streaming.
+
+        ``format``, ``max_tokens`` and ``stop`` are only sent when set. If
+        ``until`` is given the response is streamed and each chunk is passed
+        to it; the generation is stopped as soon as it returns True. The
+        request goes to the client routed for ``phase``.
+        """
+        client = self._client_for(phase)
+        system_prompt = system_prompt or self.system_prompt
+        options = {
+            name: value
+            for name, value in (
+                ("format", format),
+                ("max_tokens", max_tokens),
+                ("stop", stop),
+            )
+            if value is not None
+        }
+        if on_token is None and until is None:
+            return client.generate(system_prompt, prompt, **options)
+
+        chunks = []
+        stream = client.stream(system_prompt, prompt, **options)
+        for chunk in stream:
+            chunks.append(chunk)
+            if on_token is not None:
+                on_token(chunk)
+            if until is not None and until(chunk):
+                break
+        # Closing the stream early cancels the rest of the generation
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+        return "".join(chunks)
+
+    def _client_for(self, phase: str) -> OllamaClient:
+        """Client routed for ``phase``, or the agent's own client."""
+        if self.phase_clients and phase in self.phase_clients:
+            return self.phase_clients[phase]
+        return self.client
+
+    def _stop(self, phase: str) -> list[str] | None:
+        """Stop sequences configured for ``phase``, if any."""
+        if self.stop_sequences is None:
+            return None
+        return self.stop_sequences.get(phase) or None
+
     def _format_history(self, transcript: DebateTranscript, round_num: int) -> str:
-        """Format debate history up to current round."""
-        lines = []
-        for round_args in transcript.rounds[:round_num]:
-            for arg in round_args:
-                role_name = arg.agent_role.value.upper().replace("_", "-")
-                lines.append(f"[{role_name}]: {arg.content}")
-        return (
-            "\n\n".join(lines)
-            if lines
-            else "No arguments yet - you are opening the debate."
-        )
+        """Format debate history up to current round.
+
+        Rendering is shared through the transcript's history, so each round
+        is formatted once per debate rather than once per agent turn.
+        """
+        return transcript.history.render(transcript.rounds, round_num)
 
     def _format_full_debate(self, transcript: DebateTranscript) -> str:
         """Format the complete debate transcript."""
         return self._format_history(transcript, len(transcript.rounds) + 1)
 
-    def _parse_vote(self, response: str) -> Vote:
-        """Parse vote from LLM response."""
-        # Determine prediction
-        response_lower = response.lower()
-        if "player 2" in response_lower:
-            prediction = "Player 2 wins"
-        elif "draw" in response_lower:
-            prediction = "Draw"
+    def _extract_stance(self, argument: Argument) -> None:
+        """Move the trailing STANCE line of an argument into its fields.
+
+        Sets ``stance`` to a vote-style prediction and ``confidence`` to the
+        stated percentage, and strips the line from the content. Arguments
+        without a readable stance line are left unchanged.
+        """
+        matches = list(_STANCE_LINE.finditer(argument.content))
+        if not matches:
+            return
+        match = matches[-1]
+        text = match["stance"].lower()
+        percent = re.search(r"(\d+)\W*%", text)
+        side = text[: percent.start()] if percent else text
+        if "player 2" in side:
+            argument.stance = "Player 2 wins"
+        elif "draw" in side:
+            argument.stance = "Draw"
+        elif "player 1" in side:
+            argument.stance = "Player 1 wins"
         else:
-            prediction = "Player 1 wins"
-
-        # Extract probability
-        probability = 0.5
-        prob_match = re.search(r"(\d+)%", response)
-        if prob_match:
-            probability = int(prob_match.group(1)) / 100
-            probability = max(0.0, min(1.0, probability))
+            return
+        if percent:
+            argument.confidence = max(0.0, min(1.0, int(percent.group(1)) / 100))
+        argument.content = (
+            argument.content[: match.start()] + argument.content[match.end() :]
+        ).strip()
+
+    def _parse_vote(self, response: str) -> Vote:
+        """Parse vote from LLM response.
+
+        The WINNER and PROBABILITY fields are read first; the keyword
+        heuristics only fill in fields the response doesn't have.
+        """
+        prediction, probability = read_vote_fields(response)
+
+        if prediction is None:
+            response_lower = response.lower()
+            if "player 2" in response_lower:
+                prediction = "Player 2 wins"
+            elif "draw" in response_lower:
+                prediction = "Draw"
+            else:
+                prediction = "Player 1 wins"
+
+        if probability is None:
+            probability = 0.5
+            prob_match = re.search(r"(\d+)%", response)
+            if prob_match:
+                probability = max(0.0, min(1.0, int(prob_match.group(1)) / 100))
 
         return Vote(
             agent_role=self.role,
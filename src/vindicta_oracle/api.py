@@ -1,23 +1,110 @@
 """Meta-Oracle API - REST interface for list grading and council debates."""
 
-from fastapi import FastAPI, APIRouter, HTTPException, Depends
+import asyncio
+import json
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from uuid import UUID
 
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from vindicta_oracle.cache import ResponseCache
+from vindicta_oracle.executor import GradingQueueFullError
 from vindicta_oracle.grader import ListGrader
-from vindicta_oracle.models import GradeRequest, GradeResponse
+from vindicta_oracle.jobs import FINISHED, JobRunner, JobStore
+from vindicta_oracle.models import DebateEvent, GradeJob, GradeRequest, GradeResponse
+from vindicta_oracle.pool import (
+    EnginePool,
+    UnknownRoutingProfileError,
+    load_routing_profiles,
+)
+
+# How often the progress stream checks the job store for new events
+SSE_POLL_INTERVAL = 0.5
+
+# Where state such as the job store lives unless ORACLE_DATA_DIR says otherwise
+DEFAULT_DATA_DIR = "oracle_data"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Own the engine pool and job runner for the app's lifetime."""
+    # ORACLE_CACHE_PATH adds a persistent tier behind the in-memory LRU;
+    # ORACLE_ROUTING_PROFILES (inline JSON or a file) names the routing
+    # tables requests may select
+    profiles = os.environ.get("ORACLE_ROUTING_PROFILES")
+    pool = EnginePool(
+        cache=ResponseCache(path=os.environ.get("ORACLE_CACHE_PATH")),
+        routing_profiles=load_routing_profiles(profiles) if profiles else None,
+    )
+    app.state.engine_pool = pool
+    # Jobs survive restarts and unfinished ones resume. ORACLE_JOBS_PATH
+    # overrides the file (":memory:" keeps them in memory, for tests)
+    data_dir = Path(os.environ.get("ORACLE_DATA_DIR", DEFAULT_DATA_DIR))
+    store = JobStore(path=os.environ.get("ORACLE_JOBS_PATH", data_dir / "jobs.db"))
+    runner = JobRunner(store, max_running=pool.executor.max_workers)
+    app.state.job_runner = runner
+    runner.resume(pool.grader_for)
+    # Warm up in the background so the server starts accepting probes, and
+    # keep trying if Ollama isn't reachable yet
+    warm_up = asyncio.create_task(pool.warm_up_until_ready())
+    try:
+        yield
+    finally:
+        warm_up.cancel()
+        await runner.close()
+        store.close()
+        pool.close()
+        del app.state.job_runner, app.state.engine_pool
+
 
 app = FastAPI(
     title="Meta-Oracle API",
     description="AI council debate engine for competitive wargaming.",
     version="0.3.0",
+    lifespan=lifespan,
 )
 
 router = APIRouter(prefix="/api/v1")
 
 
-def get_grader() -> ListGrader:
-    """Dependency provider for ListGrader."""
-    # Custom config could be injected here
-    return ListGrader()
+def get_engine_pool(request: Request) -> EnginePool:
+    """Dependency provider for the app's EnginePool."""
+    state = request.app.state
+    if not hasattr(state, "engine_pool"):
+        # Lifespan didn't run (e.g. mounted without startup events)
+        state.engine_pool = EnginePool()
+    return state.engine_pool
+
+
+def get_grader(
+    request: GradeRequest, pool: EnginePool = Depends(get_engine_pool)
+) -> ListGrader:
+    """Dependency provider for the ListGrader matching the request's routing."""
+    try:
+        return pool.grader_for(request)
+    except UnknownRoutingProfileError:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown routing profile {request.routing_profile!r}",
+        )
+
+
+def _sse(event: str, data: str, event_id: int | None = None) -> str:
+    """Format one server-sent event."""
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\ndata: {data}\n\n"
+
+
+def get_job_runner(request: Request) -> JobRunner:
+    """Dependency provider for the app's JobRunner."""
+    state = request.app.state
+    if not hasattr(state, "job_runner"):
+        state.job_runner = JobRunner(JobStore())
+    return state.job_runner
 
 
 @router.post("/grade", response_model=GradeResponse)
@@ -37,6 +124,12 @@ async def grade_list(
 
         return await grader.grade(request)
 
+    except GradingQueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="Grading queue is full, retry later",
+            headers={"Retry-After": "30"},
+        )
     except ConnectionError:
         raise HTTPException(status_code=503, detail="AI service (Ollama) unavailable")
     except TimeoutError:
@@ -46,12 +139,127 @@ async def grade_list(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/grade/jobs", response_model=GradeJob, status_code=202)
+async def submit_grade_job(
+    request: GradeRequest,
+    grader: ListGrader = Depends(get_grader),
+    runner: JobRunner = Depends(get_job_runner),
+) -> GradeJob:
+    """Queue an army list for grading and return the job immediately.
+
+    Poll ``/grade/jobs/{job_id}`` for the result, or follow
+    ``/grade/jobs/{job_id}/events`` for round-by-round progress.
+    """
+    return runner.submit(request, grader)
+
+
+@router.get("/grade/jobs/{job_id}", response_model=GradeJob)
+async def get_grade_job(
+    job_id: UUID, runner: JobRunner = Depends(get_job_runner)
+) -> GradeJob:
+    """Return a grading job's status, and its result once finished."""
+    job = runner.store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/grade/jobs/{job_id}/events")
+async def stream_grade_job(
+    job_id: UUID, request: Request, runner: JobRunner = Depends(get_job_runner)
+) -> StreamingResponse:
+    """Stream a job's debate progress as server-sent events.
+
+    Each argument and vote is sent as it is produced. The stream ends with a
+    ``succeeded`` or ``failed`` event carrying the job. Reconnecting clients
+    can send ``Last-Event-ID`` to resume where they left off.
+    """
+    store = runner.store
+    if store.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    last_seen = int(request.headers.get("last-event-id") or 0)
+
+    async def events() -> AsyncIterator[str]:
+        after = last_seen
+        while True:
+            # Read the status first: events are written before it changes
+            job = store.get(job_id)
+            for seq, event in store.events(job_id, after):
+                after = seq
+                yield _sse(event.type.value, event.model_dump_json(), seq)
+            if job is None or job.status in FINISHED:
+                break
+            await asyncio.sleep(SSE_POLL_INTERVAL)
+        if job is not None:
+            yield _sse(job.status.value, job.model_dump_json())
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.post("/grade/stream")
+async def stream_grade(
+    request: GradeRequest, grader: ListGrader = Depends(get_grader)
+) -> StreamingResponse:
+    """Grade an army list, streaming the debate live as server-sent events.
+
+    ``token`` events carry partial agent output as it is generated, followed
+    by each ``argument``, ``vote`` and the ``verdict``. The stream ends with
+    a ``result`` event holding the GradeResponse, or an ``error`` event.
+    """
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue[DebateEvent | None] = asyncio.Queue()
+
+    def forward(event: DebateEvent) -> None:
+        # Called from the grading worker thread
+        loop.call_soon_threadsafe(events.put_nowait, event)
+
+    async def stream() -> AsyncIterator[str]:
+        grading = asyncio.create_task(
+            grader.grade(request, on_event=forward, stream_tokens=True)
+        )
+        # Queued after every forwarded event, so it always arrives last
+        grading.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while (event := await events.get()) is not None:
+                yield _sse(event.type.value, event.model_dump_json())
+            try:
+                response = grading.result()
+            except Exception as e:
+                yield _sse("error", json.dumps({"detail": str(e)}))
+                return
+            yield _sse("result", response.model_dump_json())
+        finally:
+            grading.cancel()
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @router.get("/health")
 async def health_check():
     """Simple health check endpoint."""
     return {"status": "operational", "version": "0.3.0"}
 
 
+@router.get("/ready")
+async def readiness_check(pool: EnginePool = Depends(get_engine_pool)):
+    """Readiness probe: succeeds once the model has been loaded."""
+    return JSONResponse(status_code=200 if pool.ready else 503, content=pool.status())
+
+
+@router.get("/queue")
+async def queue_status(pool: EnginePool = Depends(get_engine_pool)):
+    """Report how many gradings are running and waiting for a worker."""
+    return pool.executor.stats()
+
+
 app.include_router(router)
 
 if __name__ == "__main__":
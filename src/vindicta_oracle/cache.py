@@ -0,0 +1,207 @@
+"""Response Cache - Content-addressed cache for LLM generations.
+
+Identical prompts against identical generation settings are answered from
+a bounded in-memory LRU, backed by an optional SQLite file so answers
+survive restarts. Entries expire after a TTL and the disk tier evicts its
+least recently used rows once it grows past a byte budget.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from vindicta_oracle.ollama_client import OllamaConfig
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + SQLite) cache of LLM responses."""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_memory_entries: int = 1024,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float | None = 7 * 24 * 3600,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite file for the persistent tier, or None for memory only.
+            max_memory_entries: Entries kept in the in-memory LRU.
+            max_disk_bytes: Total response bytes kept on disk before the
+                least recently used rows are evicted.
+            ttl_seconds: Entry lifetime, or None to never expire.
+        """
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_seconds = ttl_seconds
+        self._memory: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed"
+                " ON responses (accessed_at)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def make_key(
+        config: OllamaConfig,
+        system_prompt: str,
+        user_prompt: str,
+        format: str | dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> str:
+        """Hash everything that determines a generation into a cache key."""
+        fields = [
+            config.model,
+            config.temperature,
+            config.seed,
+            config.max_tokens,
+            system_prompt,
+            user_prompt,
+        ]
+        # Only requests using per-call overrides hash them, so keys of plain
+        # requests stay the same
+        if format is not None or max_tokens is not None or stop:
+            fields += [format, max_tokens, stop or None]
+        payload = json.dumps(fields, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key``, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                response, created_at = entry
+                if not self._expired(created_at, now):
+                    self._memory.move_to_end(key)
+                    self._hits += 1
+                    return response
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response, created_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None:
+                    response, created_at = row
+                    if not self._expired(created_at, now):
+                        self._db.execute(
+                            "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                            (now, key),
+                        )
+                        self._db.commit()
+                        self._remember(key, response, created_at)
+                        self._hits += 1
+                        self._disk_hits += 1
+                        return response
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._db.commit()
+
+            self._misses += 1
+            return None
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response in both tiers."""
+        now = time.time()
+        with self._lock:
+            self._remember(key, response, now)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                    (key, response, len(response.encode("utf-8")), now, now),
+                )
+                self._evict_disk()
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current sizes."""
+        with self._lock:
+            disk_entries = 0
+            if self._db is not None:
+                disk_entries = self._db.execute(
+                    "SELECT COUNT(*) FROM responses"
+                ).fetchone()[0]
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "memory_entries": len(self._memory),
+                "disk_entries": disk_entries,
+            }
+
+    def close(self) -> None:
+        """Close the persistent tier."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        """Whether an entry created at ``created_at`` is past its TTL."""
+        return self.ttl_seconds is not None and now - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, response: str, created_at: float) -> None:
+        """Insert into the memory LRU, evicting the oldest entries."""
+        self._memory[key] = (response, created_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._evictions += 1
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used rows until under the byte budget."""
+        assert self._db is not None
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+        excess = total.fetchone()[0] - self.max_disk_bytes
+        if excess <= 0:
+            return
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        doomed = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            doomed.append((key,))
+            excess -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", doomed)
+        self._evictions += len(doomed)
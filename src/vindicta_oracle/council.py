@@ -0,0 +1,127 @@
+"""Council Mode - All five council turns from a single LLM request.
+
+A normal round sends five requests that repeat nearly the same context, so
+the server prefills it five times. In council mode one request carries each
+agent's own system prompt and asks the model for every turn at once, as a
+JSON object keyed by role. It trades some diversity between personas for
+a single prefill per round, which matters most on CPU-only or small-GPU
+nodes. Turns that can't be read back from the output are left for the
+caller to generate with per-agent calls.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from vindicta_oracle.agents.base import STANCE_FORMAT
+from vindicta_oracle.models import (
+    Argument,
+    ArgumentType,
+    DebateTranscript,
+    role_name,
+)
+
+if TYPE_CHECKING:
+    from vindicta_oracle.agents import BaseAgent
+    from vindicta_oracle.ollama_client import OllamaClient
+
+
+class CouncilWriter:
+    """Generates a whole round of council turns in one request."""
+
+    def __init__(self, client: OllamaClient):
+        self.client = client
+
+    def respond(
+        self,
+        agents: Sequence[BaseAgent],
+        transcript: DebateTranscript,
+        round_num: int,
+    ) -> dict[str, Argument]:
+        """Generate every agent's turn for ``round_num`` in one request.
+
+        Returns:
+            Arguments keyed by role value. Roles whose turn was missing or
+            empty in the output (or all of them, if it wasn't valid JSON)
+            are absent.
+        """
+        response = self.client.generate(
+            self._system_prompt(agents),
+            self._user_prompt(agents, transcript, round_num),
+            format=self._schema(agents),
+            max_tokens=self.client.config.max_tokens * len(agents),
+        )
+        try:
+            turns = json.loads(response)
+        except json.JSONDecodeError:
+            return {}
+        if not isinstance(turns, dict):
+            return {}
+
+        arguments = {}
+        for agent in agents:
+            content = turns.get(agent.role.value)
+            if not isinstance(content, str) or not content.strip():
+                continue
+            argument = Argument(
+                agent_role=agent.role,
+                round=round_num,
+                argument_type=ArgumentType.CLAIM,
+                content=content.strip(),
+            )
+            if agent.report_stance:
+                agent._extract_stance(argument)
+            arguments[agent.role.value] = argument
+        return arguments
+
+    @staticmethod
+    def _schema(agents: Sequence[BaseAgent]) -> dict:
+        """JSON schema of the output: one string per role."""
+        roles = [agent.role.value for agent in agents]
+        return {
+            "type": "object",
+            "properties": {role: {"type": "string"} for role in roles},
+            "required": roles,
+        }
+
+    @staticmethod
+    def _system_prompt(agents: Sequence[BaseAgent]) -> str:
+        """Brief the model on every council member, using their own prompts."""
+        members = "\n\n".join(
+            f"### {role_name(agent.role)}\n{agent.system_prompt}" for agent in agents
+        )
+        return f"""You voice every member of the Meta-Oracle council, a panel of {len(agents)} agents debating a Warhammer 40K matchup. Write each member's turn as that member would, keeping their distinct role and perspective.
+
+The council members are:
+
+{members}"""
+
+    @staticmethod
+    def _user_prompt(
+        agents: Sequence[BaseAgent], transcript: DebateTranscript, round_num: int
+    ) -> str:
+        """The round's task, with the matchup and the debate so far."""
+        context = transcript.context
+        history = transcript.history.render(transcript.rounds, round_num)
+        keys = ", ".join(f'"{agent.role.value}"' for agent in agents)
+        stance = ""
+        if any(agent.report_stance for agent in agents):
+            stance = f"\n{STANCE_FORMAT.replace('your response', 'each turn')}"
+
+        return f"""Round {round_num} of the council debate.
+
+MATCHUP:
+- Player 1: {context.player1_faction}
+{context.player1_list}
+- Player 2: {context.player2_faction}
+{context.player2_list}
+- Mission: {context.mission or "Standard"}
+
+Previous arguments this debate:
+{history}
+
+Write every member's turn for this round. Each member responds to the debate so far according to their role, is specific about units, abilities, and tactical implications, and stays under 200 words.{stance}
+
+Respond with a JSON object with exactly these keys: {keys}. Each value is that member's turn as plain text."""
@@ -1,6 +1,6 @@
 """Demo: Run a sample Meta-Oracle debate with local models."""
 
-from vindicta_oracle.models import DebateContext
+from vindicta_oracle.models import DebateContext, role_name
 from vindicta_oracle.engine import DebateEngine
 from vindicta_oracle.ollama_client import OllamaConfig
 
@@ -80,8 +80,7 @@ Total: ~1000 points
         print(f"{'─' * 70}")
 
         for arg in round_args:
-            role_name = arg.agent_role.value.upper().replace("_", "-")
-            print(f"\n[{role_name}]:")
+            print(f"\n[{role_name(arg.agent_role)}]:")
             print(arg.content)
 
     print("\n\n" + "=" * 70)
@@ -89,8 +88,7 @@ Total: ~1000 points
     print("=" * 70)
 
     for vote in transcript.votes:
-        role_name = vote.agent_role.value.upper().replace("_", "-")
-        print(f"\n[{role_name}]")
+        print(f"\n[{role_name(vote.agent_role)}]")
         print(f"  Prediction: {vote.prediction}")
         print(f"  Win Probability: {vote.win_probability * 100:.0f}%")
         print("  Reasoning:")
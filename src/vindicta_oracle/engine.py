@@ -2,34 +2,154 @@
 
 from __future__ import annotations
 
+import logging
+import queue
+import threading
 from collections import Counter
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import CancelledError as FutureCancelledError
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, TypeVar
 
-from vindicta_oracle.models import Argument, DebateContext, DebateTranscript
 from vindicta_oracle.agents import (
-    HomeAgent,
     AdversaryAgent,
     ArbiterAgent,
-    RuleSageAgent,
     ChaosAgent,
+    HomeAgent,
+    PromptLayout,
+    RuleSageAgent,
 )
-from vindicta_oracle.ollama_client import OllamaClient, OllamaConfig
+from vindicta_oracle.council import CouncilWriter
+from vindicta_oracle.events import ConsoleSink, EventSink
+from vindicta_oracle.history import DebateHistory
+from vindicta_oracle.models import (
+    AgentRole,
+    Argument,
+    CallTelemetry,
+    DebateContext,
+    DebateEvent,
+    DebateEventType,
+    DebateTranscript,
+    Vote,
+    VotingMode,
+)
+from vindicta_oracle.ollama_client import (
+    GenerationBudget,
+    OllamaClient,
+    OllamaConfig,
+    generation_budget,
+)
+from vindicta_oracle.summarizer import RoundSummarizer
+from vindicta_oracle.telemetry import collect_telemetry
 
 if TYPE_CHECKING:
-    from vindicta_oracle.models import ArmyList
+    from vindicta_oracle.agents import BaseAgent
+    from vindicta_oracle.cache import ResponseCache
+    from vindicta_oracle.models import ArmyList, RoutingTable
+    from vindicta_oracle.vote_reader import VoteLimits
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+EventCallback = Callable[[DebateEvent], None]
+
+# How often a timed agent whose generation hasn't started yet is checked on
+AGENT_POLL_INTERVAL = 0.05
+
+
+class DebateCancelledError(RuntimeError):
+    """Raised when a debate is stopped through its ``cancel`` event."""
 
 
 class DebateEngine:
     """Orchestrates the multi-round adversarial debate between 5 agents."""
 
-    def __init__(self, config: OllamaConfig | None = None, num_rounds: int = 3):
+    def __init__(
+        self,
+        config: OllamaConfig | None = None,
+        num_rounds: int = 3,
+        max_concurrency: int = 1,
+        parallel_votes: bool = True,
+        vote_timeout: float | None = None,
+        cache: ResponseCache | None = None,
+        sink: EventSink | None = None,
+        history_budget: int | None = None,
+        summarize: bool = False,
+        prompt_layout: PromptLayout = PromptLayout.CLASSIC,
+        adaptive_rounds: bool = False,
+        min_agreement: float = 1.0,
+        min_confidence: float = 0.7,
+        council_mode: bool = False,
+        fuse_votes: bool = False,
+        structured_votes: bool = False,
+        stop_sequences: dict[str, list[str]] | None = None,
+        vote_limits: VoteLimits | None = None,
+        routing: RoutingTable | None = None,
+    ):
         """Initialize the debate engine with all 5 council agents.
 
         Args:
             config: Ollama configuration (model, temperature, etc.)
             num_rounds: Number of debate rounds (default 3)
+            max_concurrency: Number of agent turns generated at once within a
+                round (default 1, i.e. sequential). Turns in a round only read
+                completed rounds, so they are safe to fan out.
+            parallel_votes: Issue all vote generations at once (default True).
+                Votes only read the finished transcript.
+            vote_timeout: Seconds each agent's vote generations (retries
+                included) may run once started before the vote is cancelled
+                and treated as an abstention (default None, wait
+                indefinitely).
+            cache: Optional response cache shared by all agents' generations.
+            sink: Receives every debate event (default ``ConsoleSink``, the
+                CLI output). Use ``NullSink`` to run silently.
+            history_budget: Approximate token budget for the debate history
+                in each prompt (default None, the full verbatim debate).
+                Older rounds are condensed first; the latest stays verbatim.
+            summarize: Replace all but the latest round in agent prompts
+                with a rolling LLM summary of each agent's position (default
+                False). Each summary is generated while the next round runs.
+            prompt_layout: How agents arrange their prompts. ``SHARED_PREFIX``
+                gives every agent the same leading tokens so the server can
+                reuse their KV cache; pair it with ``config.keep_alive`` so
+                the model (and its cache) stays loaded between turns.
+            adaptive_rounds: Stop before ``num_rounds`` once the council has
+                converged (default False). Agents then end each argument
+                with a one-line interim stance, which is checked after
+                every round.
+            min_agreement: Share of agents (0-1] that must hold the same
+                stance for the council to count as converged.
+            min_confidence: Mean stated confidence (0-1] those agents need.
+            council_mode: Generate each round's five turns with one request
+                that returns them as JSON (default False). Turns missing from
+                the output fall back to per-agent calls. Council turns are
+                not streamed as tokens.
+            fuse_votes: Ask for each agent's vote in a trailer of its
+                final-round argument instead of a separate vote request
+                (default False). Agents whose trailer can't be read, or
+                debates that end early, still vote separately.
+            structured_votes: Request separate votes as JSON constrained by
+                the ``VoteBallot`` schema and validate them, retrying once
+                before falling back to the free-text parser (default False).
+            stop_sequences: Stop sequences per phase, keyed "respond" or
+                "vote" (default None). ``DEFAULT_STOP_SEQUENCES`` stops
+                agents from writing other council members' turns.
+            vote_limits: Stream separate votes and stop each one once its
+                fields are in and its reasoning reaches these limits
+                (default None, generate until the model stops).
+            routing: Model, temperature and token budget per (role, phase),
+                overriding ``config`` where set (default None, one config
+                for everything). Agents routed to the same settings share
+                a client.
         """
-        client = OllamaClient(config)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not 0 < min_agreement <= 1 or not 0 < min_confidence <= 1:
+            raise ValueError("min_agreement and min_confidence must be in (0, 1]")
+
+        client = OllamaClient(config, cache=cache)
         self.agents = [
             HomeAgent(client),
             AdversaryAgent(client),
@@ -37,70 +157,436 @@ class DebateEngine:
             RuleSageAgent(client),
             ChaosAgent(client),
         ]
-        self.num_rounds = num_rounds
+        self.routing = routing
+        clients = {client.config.model_dump_json(): client}
+
+        def routed(role: AgentRole | None, phase: str) -> OllamaClient:
+            if routing is None:
+                return client
+            routed_config = routing.config_for(client.config, role, phase)
+            key = routed_config.model_dump_json()
+            if key not in clients:
+                clients[key] = OllamaClient(routed_config, cache=cache)
+            return clients[key]
 
-    def run_debate(self, context: DebateContext) -> DebateTranscript:
+        for agent in self.agents:
+            agent.client = routed(agent.role, "respond")
+            if routing is not None:
+                agent.phase_clients = {"vote": routed(agent.role, "vote")}
+            agent.layout = prompt_layout
+            agent.report_stance = adaptive_rounds
+            agent.structured_votes = structured_votes
+            agent.stop_sequences = stop_sequences
+            agent.vote_limits = vote_limits
+        self.num_rounds = num_rounds
+        self.max_concurrency = max_concurrency
+        self.parallel_votes = parallel_votes
+        self.vote_timeout = vote_timeout
+        self.sink = sink if sink is not None else ConsoleSink()
+        self.history_budget = history_budget
+        self.summarizer = (
+            RoundSummarizer(routed(None, "summary")) if summarize else None
+        )
+        self.council = CouncilWriter(routed(None, "respond")) if council_mode else None
+        self.fuse_votes = fuse_votes
+        self.adaptive_rounds = adaptive_rounds
+        self.min_agreement = min_agreement
+        self.min_confidence = min_confidence
+
+    def run_debate(
+        self,
+        context: DebateContext,
+        on_event: EventCallback | None = None,
+        stream_tokens: bool = False,
+        cancel: threading.Event | None = None,
+    ) -> DebateTranscript:
         """Execute the full debate protocol.
 
         Args:
             context: The matchup context (factions, lists, mission, etc.)
+            on_event: Optional callback receiving the same events as the
+                engine's sink, in transcript order
+            stream_tokens: Also send token events with partial agent output
+                while it is generated. Tokens of concurrent turns interleave.
+            cancel: Optional event stopping the debate once set. It is checked
+                before every round and agent turn; turns already generating
+                run to completion.
 
         Returns:
             Complete debate transcript with all rounds, votes, and consensus
+
+        Raises:
+            DebateCancelledError: If ``cancel`` was set before the verdict.
         """
         transcript = DebateTranscript(context=context)
+        transcript.history = DebateHistory(token_budget=self.history_budget)
+
+        def check_cancelled() -> None:
+            if cancel is not None and cancel.is_set():
+                raise DebateCancelledError(f"Debate {transcript.id} was cancelled")
+
+        def emit(event_type: DebateEventType, data: dict) -> None:
+            event = DebateEvent(type=event_type, debate_id=transcript.id, data=data)
+            self.sink.emit(event)
+            if on_event is not None:
+                on_event(event)
+
+        def tokens(
+            agent: BaseAgent, phase: str, round_num: int | None = None
+        ) -> Callable[[str], None] | None:
+            if not stream_tokens:
+                return None
+            meta = {"agent_role": agent.role.value, "phase": phase, "round": round_num}
+            return lambda text: emit(DebateEventType.TOKEN, {**meta, "text": text})
+
+        def argument_done(agent: BaseAgent, argument: Argument) -> None:
+            emit(DebateEventType.ARGUMENT, argument.model_dump(mode="json"))
+
+        def vote_done(agent: BaseAgent, vote: Vote | None) -> None:
+            if vote is None:
+                emit(
+                    DebateEventType.ABSTAIN,
+                    {"agent_role": agent.role.value, "timeout": self.vote_timeout},
+                )
+            else:
+                emit(DebateEventType.VOTE, vote.model_dump(mode="json"))
+
+        emit(DebateEventType.STARTED, context.model_dump(mode="json"))
+
+        # The summary of rounds 1..r is generated while round r + 1 runs
+        # and is in place before round r + 2 (or the votes) need it
+        summaries = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="oracle-summary")
+            if self.summarizer is not None
+            else None
+        )
+        pending: Future[tuple[str, list[CallTelemetry]]] | None = None
+        fused: dict[str, Vote] = {}
+
+        try:
+            # Run debate rounds
+            for round_num in range(1, self.num_rounds + 1):
+                check_cancelled()
+                emit(DebateEventType.ROUND, {"round": round_num})
+
+                def respond(agent: BaseAgent, round_num: int = round_num) -> Argument:
+                    check_cancelled()
+                    on_token = tokens(agent, "respond", round_num)
+                    if not self.fuse_votes or round_num < self.num_rounds:
+                        return agent.respond(transcript, round_num, on_token=on_token)
+                    argument, vote = agent.respond_and_vote(
+                        transcript, round_num, on_token=on_token
+                    )
+                    if vote is not None:
+                        fused[agent.role.value] = vote
+                    return argument
+
+                if self.council is not None:
+                    round_arguments = self._run_council(
+                        transcript, round_num, respond, on_result=argument_done
+                    )
+                else:
+                    round_arguments = self._run_agents(
+                        self.agents, respond, on_result=argument_done
+                    )
+                transcript.rounds.append(round_arguments)
+                for argument in round_arguments:
+                    transcript.telemetry.extend(argument.telemetry)
+
+                if pending is not None:
+                    try:
+                        summary, calls = pending.result()
+                    except Exception:
+                        # Later summaries would build on a record missing this
+                        # round, so keep the rest of the debate verbatim
+                        logger.warning(
+                            "Summarizing round %d failed; keeping it verbatim",
+                            round_num - 1,
+                            exc_info=True,
+                        )
+                        assert summaries is not None
+                        summaries.shutdown(wait=False)
+                        summaries = None
+                    else:
+                        transcript.telemetry.extend(calls)
+                        transcript.history.set_summary(summary, round_num - 1)
+                        emit(
+                            DebateEventType.SUMMARY,
+                            {"rounds": round_num - 1, "summary": summary},
+                        )
+                    pending = None
+
+                if round_num == self.num_rounds:
+                    transcript.termination_reason = (
+                        f"completed all {self.num_rounds} rounds"
+                    )
+                    break
+                if self.adaptive_rounds:
+                    reason = self._check_convergence(round_arguments)
+                    if reason is not None:
+                        transcript.termination_reason = (
+                            f"converged after round {round_num}: {reason}"
+                        )
+                        break
+
+                if summaries is not None:
+                    pending = summaries.submit(
+                        self._summarize,
+                        transcript.history.summary,
+                        round_arguments,
+                        round_num,
+                    )
+        finally:
+            if summaries is not None:
+                summaries.shutdown(wait=False, cancel_futures=True)
 
-        self._print_header(context)
+        # Voting phase
+        check_cancelled()
+        emit(DebateEventType.VOTING, {})
+
+        def vote(agent: BaseAgent) -> Vote | None:
+            check_cancelled()
+            return agent.vote(transcript, on_token=tokens(agent, "vote"))
+
+        missing = [agent for agent in self.agents if agent.role.value not in fused]
+        votes = self._run_agents(
+            missing,
+            vote,
+            on_result=None if fused else vote_done,
+            max_workers=len(missing) if self.parallel_votes else 1,
+            timeout=self.vote_timeout,
+            telemetry=transcript.telemetry,
+        )
+        if fused:
+            # Report fused and separately cast votes together, in agent order
+            separate = dict(zip((agent.role.value for agent in missing), votes))
+            votes = [
+                fused.get(agent.role.value) or separate[agent.role.value]
+                for agent in self.agents
+            ]
+            for agent, vote in zip(self.agents, votes):
+                vote_done(agent, vote)
+            transcript.voting_mode = VotingMode.MIXED if missing else VotingMode.FUSED
+        transcript.votes.extend(vote for vote in votes if vote is not None)
+        for vote in transcript.votes:
+            transcript.telemetry.extend(vote.telemetry)
 
-        # Run debate rounds
-        for round_num in range(1, self.num_rounds + 1):
-            self._print_round_header(round_num)
+        # Calculate consensus
+        transcript.consensus, transcript.consensus_confidence = (
+            self._calculate_consensus(transcript)
+        )
 
-            round_arguments: list[Argument] = []
-            for agent in self.agents:
-                role_name = agent.role.value.upper().replace("_", "-")
-                print(f"\n🎙️  [{role_name}] Speaking...")
+        emit(
+            DebateEventType.VERDICT,
+            {
+                "consensus": transcript.consensus,
+                "confidence": transcript.consensus_confidence,
+                "termination_reason": transcript.termination_reason,
+                "voting_mode": transcript.voting_mode.value,
+                "votes": [vote.model_dump(mode="json") for vote in transcript.votes],
+            },
+        )
 
-                argument = agent.respond(transcript, round_num)
-                round_arguments.append(argument)
+        return transcript
 
-                # Print truncated preview
-                preview = argument.content[:300].replace("\n", " ")
-                if len(argument.content) > 300:
-                    preview += "..."
-                print(f"   {preview}")
+    def iter_debate(self, context: DebateContext) -> Iterator[DebateEvent]:
+        """Run a debate in the background, yielding events as they happen.
 
-            transcript.rounds.append(round_arguments)
+        Yields every event, including token events with partial agent
+        output, ending with the verdict. Errors from the debate are re-raised.
+        Closing the iterator early cancels the debate before its next turn.
+        """
+        events: queue.SimpleQueue[DebateEvent | None] = queue.SimpleQueue()
+        failure: list[Exception] = []
+        cancel = threading.Event()
+
+        def run() -> None:
+            try:
+                self.run_debate(
+                    context, on_event=events.put, stream_tokens=True, cancel=cancel
+                )
+            except Exception as e:
+                failure.append(e)
+            finally:
+                events.put(None)
+
+        threading.Thread(target=run, name="oracle-debate", daemon=True).start()
+        try:
+            while (event := events.get()) is not None:
+                yield event
+        finally:
+            cancel.set()
+        if failure:
+            raise failure[0]
+
+    def _run_agents(
+        self,
+        agents: Sequence[BaseAgent],
+        call: Callable[[BaseAgent], T],
+        on_result: Callable[[BaseAgent, T | None], None] | None = None,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        telemetry: list[CallTelemetry] | None = None,
+    ) -> list[T | None]:
+        """Run ``call`` for every agent, fanning out up to ``max_workers``.
+
+        Results (and ``on_result`` callbacks) are always delivered in agent
+        order, regardless of which generation finishes first.
 
-        # Voting phase
-        self._print_voting_header()
+        Args:
+            agents: Agents to run, in council order.
+            call: The per-agent work (``respond``, ``vote``...).
+            on_result: Optional callback invoked in order as results arrive.
+            max_workers: Fan-out width (defaults to ``max_concurrency``).
+            timeout: Seconds each agent's generations may run in total,
+                counted while they run (time queued for a worker or an
+                Ollama slot doesn't count). Generations that overrun are
+                cancelled and yield ``None``.
+            telemetry: Receives the calls of agents that timed out, including
+                the cancelled one, since they never reach a result.
 
+        Returns:
+            One result per agent, ``None`` for agents that timed out.
+        """
+        workers = min(max_workers or self.max_concurrency, len(agents))
+        if workers <= 1 and timeout is None:
+            results: list[T | None] = []
+            for agent in agents:
+                result = call(agent)
+                if on_result is not None:
+                    on_result(agent, result)
+                results.append(result)
+            return results
+
+        def run(agent: BaseAgent, budget: GenerationBudget | None) -> T:
+            if budget is None:
+                return call(agent)
+            budget.mark_started()
+            with generation_budget(budget):
+                return call(agent)
+
+        budgets = [
+            GenerationBudget(timeout) if timeout is not None else None for _ in agents
+        ]
+        pool = ThreadPoolExecutor(
+            max_workers=max(workers, 1), thread_name_prefix="oracle-agent"
+        )
+        try:
+            futures = [
+                pool.submit(run, agent, budget)
+                for agent, budget in zip(agents, budgets)
+            ]
+            results = []
+            for agent, future, budget in zip(agents, futures, budgets):
+                result = self._await_agent(future, budget)
+                recorder = budget.recorder if budget is not None else None
+                if result is None and recorder is not None and telemetry is not None:
+                    telemetry.extend(recorder.calls)
+                if on_result is not None:
+                    on_result(agent, result)
+                results.append(result)
+            return results
+        finally:
+            # Don't block the debate on generations that overran the timeout
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _await_agent(future: Future[T], budget: GenerationBudget | None) -> T | None:
+        """An agent's result, or ``None`` once its budget has run out.
+
+        While the agent's generation waits for a worker or an Ollama slot
+        its clock is stopped, so the wait is polled rather than bounded.
+        """
+        if budget is None:
+            return future.result()
+        while True:
+            remaining = budget.remaining()
+            try:
+                return future.result(
+                    timeout=AGENT_POLL_INTERVAL
+                    if remaining is None
+                    else max(0.0, remaining)
+                )
+            except FutureTimeoutError:
+                if future.done():
+                    # The generation itself gave up
+                    return None
+                if budget.expired():
+                    budget.cancel()
+                    return None
+            except FutureCancelledError:
+                return None
+
+    def _run_council(
+        self,
+        transcript: DebateTranscript,
+        round_num: int,
+        respond: Callable[[BaseAgent], Argument],
+        on_result: Callable[[BaseAgent, Argument], None] | None = None,
+    ) -> list[Argument]:
+        """Generate a round in council mode, falling back per agent.
+
+        Turns the council output didn't provide are generated with
+        ``respond`` (fanned out as usual). Results and ``on_result`` calls
+        are delivered in agent order.
+        """
+        assert self.council is not None
+        with collect_telemetry(None, "respond", round_num) as calls:
+            turns = self.council.respond(self.agents, transcript, round_num)
+        transcript.telemetry.extend(calls)
+        missing = [agent for agent in self.agents if agent.role.value not in turns]
+        for agent, argument in zip(missing, self._run_agents(missing, respond)):
+            turns[agent.role.value] = argument
+
+        arguments = []
         for agent in self.agents:
-            role_name = agent.role.value.upper().replace("_", "-")
-            print(f"\n🗳️  [{role_name}] Casting vote...")
-
-            vote = agent.vote(transcript)
-            transcript.votes.append(vote)
+            argument = turns[agent.role.value]
+            if on_result is not None:
+                on_result(agent, argument)
+            arguments.append(argument)
+        return arguments
+
+    def _summarize(
+        self, previous: str | None, arguments: Sequence[Argument], round_num: int
+    ) -> tuple[str, list[CallTelemetry]]:
+        """Run the summarizer, returning the summary and its LLM calls."""
+        assert self.summarizer is not None
+        with collect_telemetry(None, "summary", round_num) as calls:
+            summary = self.summarizer.summarize(previous, arguments, round_num)
+        return summary, calls
+
+    def _check_convergence(self, arguments: Sequence[Argument]) -> str | None:
+        """Decide from a round's interim stances whether to stop debating.
+
+        Agents without a readable stance count as disagreeing.
 
-            print(
-                f"   → {vote.prediction} ({vote.win_probability * 100:.0f}% confidence)"
-            )
-
-        # Calculate consensus
-        transcript.consensus, transcript.consensus_confidence = (
-            self._calculate_consensus(transcript)
+        Returns:
+            Why the council counts as converged, or None to keep going.
+        """
+        stances = Counter(arg.stance for arg in arguments if arg.stance)
+        if not stances:
+            return None
+        stance, count = stances.most_common(1)[0]
+        agreement = count / len(self.agents)
+        confidence = (
+            sum(arg.confidence for arg in arguments if arg.stance == stance) / count
+        )
+        if agreement < self.min_agreement or confidence < self.min_confidence:
+            return None
+        return (
+            f"{count}/{len(self.agents)} agents favour {stance}"
+            f" (mean confidence {confidence * 100:.0f}%)"
         )
-
-        self._print_verdict(transcript)
-
-        return transcript
 
     def _calculate_consensus(self, transcript: DebateTranscript) -> tuple[str, float]:
         """Calculate the council's consensus prediction.
 
-        Uses simple majority voting with averaged confidence.
+        Uses simple majority voting with averaged confidence. Agents that
+        abstained (e.g. timed out) are simply not counted.
         """
         votes = transcript.votes
+        if not votes:
+            return "No consensus", 0.0
         predictions = [v.prediction for v in votes]
 
         # Simple majority
@@ -115,47 +601,20 @@ class DebateEngine:
 
         return winner, avg_confidence
 
-    def _print_header(self, context: DebateContext) -> None:
-        """Print the debate header."""
-        print("\n" + "=" * 70)
-        print("🏛️   META-ORACLE COUNCIL CONVENES")
-        print("=" * 70)
-        print(f"\n📋 MATCHUP: {context.player1_faction} vs {context.player2_faction}")
-        print(f"📍 Mission: {context.mission or 'Standard'}")
-        if context.terrain:
-            print(f"🏔️  Terrain: {context.terrain}")
-
-    def _print_round_header(self, round_num: int) -> None:
-        """Print a round header."""
-        print(f"\n{'─' * 70}")
-        print(f"🔔 ROUND {round_num}")
-        print(f"{'─' * 70}")
-
-    def _print_voting_header(self) -> None:
-        """Print the voting phase header."""
-        print(f"\n{'=' * 70}")
-        print("🗳️   VOTING PHASE")
-        print(f"{'=' * 70}")
-
-    def _print_verdict(self, transcript: DebateTranscript) -> None:
-        """Print the final council verdict."""
-        print(f"\n{'=' * 70}")
-        print("🏆  COUNCIL VERDICT")
-        print(f"{'=' * 70}")
-        print(f"\n🎯 Prediction: {transcript.consensus}")
-        print(f"📊 Confidence: {transcript.consensus_confidence * 100:.0f}%")
-
-        # Show vote breakdown
-        print("\n📜 Vote Breakdown:")
-        for vote in transcript.votes:
-            role = vote.agent_role.value.upper().replace("_", "-")
-            print(f"   • {role}: {vote.prediction} ({vote.win_probability * 100:.0f}%)")
-
-    def run_grading_session(self, army_list: ArmyList) -> DebateTranscript:
+    def run_grading_session(
+        self,
+        army_list: ArmyList,
+        on_event: EventCallback | None = None,
+        stream_tokens: bool = False,
+        cancel: threading.Event | None = None,
+    ) -> DebateTranscript:
         """Execute a debate to grade a single army list.
 
         Args:
             army_list: The army list to grade
+            on_event: Optional progress callback (see ``run_debate``)
+            stream_tokens: Include token events in the progress
+            cancel: Optional event stopping the debate (see ``run_debate``)
 
         Returns:
             Transcript containing the evaluation debate
@@ -179,4 +638,6 @@ class DebateEngine:
             additional_context="Grading requested for competitive viability.",
         )
 
-        return self.run_debate(context)
+        return self.run_debate(
+            context, on_event=on_event, stream_tokens=stream_tokens, cancel=cancel
+        )
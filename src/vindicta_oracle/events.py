@@ -0,0 +1,186 @@
+"""Event Sinks - Observers for debate progress.
+
+``DebateEngine`` reports everything it does as ``DebateEvent`` objects and
+hands them to a sink instead of printing. The console sink reproduces the
+CLI's output; the API uses the null sink (or a queue) so no blocking
+console I/O happens on the request path.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import sys
+import threading
+from abc import ABC, abstractmethod
+from typing import TextIO
+
+from vindicta_oracle.models import DebateEvent, DebateEventType, role_name
+
+logger = logging.getLogger(__name__)
+
+
+class EventSink(ABC):
+    """Receives debate events. Sinks may be called from worker threads."""
+
+    @abstractmethod
+    def emit(self, event: DebateEvent) -> None:
+        """Handle a single event."""
+        ...
+
+    def __call__(self, event: DebateEvent) -> None:
+        """Sinks can be used wherever an event callback is expected."""
+        self.emit(event)
+
+
+class NullSink(EventSink):
+    """Discards every event."""
+
+    def emit(self, event: DebateEvent) -> None:
+        """Ignore the event."""
+
+
+class ConsoleSink(EventSink):
+    """Human-readable council output for the CLI and demo.
+
+    Each event is written as one block under a lock, so output from
+    concurrent turns never interleaves mid-line. Token events are ignored;
+    arguments are shown as a truncated preview once complete.
+    """
+
+    def __init__(self, stream: TextIO | None = None, preview_chars: int = 300):
+        self._stream = stream
+        self.preview_chars = preview_chars
+        self._lock = threading.Lock()
+
+    def emit(self, event: DebateEvent) -> None:
+        """Format and write the event."""
+        lines = self._format(event)
+        if not lines:
+            return
+        stream = self._stream or sys.stdout
+        with self._lock:
+            stream.write("\n".join(lines) + "\n")
+            stream.flush()
+
+    def _format(self, event: DebateEvent) -> list[str]:
+        """Render an event as console lines."""
+        data = event.data
+        if event.type == DebateEventType.STARTED:
+            lines = [
+                "\n" + "=" * 70,
+                "🏛️   META-ORACLE COUNCIL CONVENES",
+                "=" * 70,
+                f"\n📋 MATCHUP: {data['player1_faction']} vs {data['player2_faction']}",
+                f"📍 Mission: {data['mission'] or 'Standard'}",
+            ]
+            if data["terrain"]:
+                lines.append(f"🏔️  Terrain: {data['terrain']}")
+            return lines
+        if event.type == DebateEventType.ROUND:
+            return [f"\n{'─' * 70}", f"🔔 ROUND {data['round']}", f"{'─' * 70}"]
+        if event.type == DebateEventType.ARGUMENT:
+            preview = data["content"][: self.preview_chars].replace("\n", " ")
+            if len(data["content"]) > self.preview_chars:
+                preview += "..."
+            role = role_name(data["agent_role"])
+            return [f"\n🎙️  [{role}] Speaking...", f"   {preview}"]
+        if event.type == DebateEventType.VOTING:
+            return [f"\n{'=' * 70}", "🗳️   VOTING PHASE", f"{'=' * 70}"]
+        if event.type == DebateEventType.VOTE:
+            role = role_name(data["agent_role"])
+            confidence = data["win_probability"] * 100
+            return [
+                f"\n🗳️  [{role}] Casting vote...",
+                f"   → {data['prediction']} ({confidence:.0f}% confidence)",
+            ]
+        if event.type == DebateEventType.ABSTAIN:
+            role = role_name(data["agent_role"])
+            return [
+                f"\n🗳️  [{role}] Casting vote...",
+                f"   ⏱️  No vote within {data['timeout']}s (abstains)",
+            ]
+        if event.type == DebateEventType.VERDICT:
+            lines = [
+                f"\n{'=' * 70}",
+                "🏆  COUNCIL VERDICT",
+                f"{'=' * 70}",
+                f"\n🎯 Prediction: {data['consensus']}",
+                f"📊 Confidence: {data['confidence'] * 100:.0f}%",
+            ]
+            if data.get("termination_reason"):
+                lines.append(f"🏁 Debate {data['termination_reason']}")
+            lines.append("\n📜 Vote Breakdown:")
+            for vote in data["votes"]:
+                role = role_name(vote["agent_role"])
+                lines.append(
+                    f"   • {role}: {vote['prediction']}"
+                    f" ({vote['win_probability'] * 100:.0f}%)"
+                )
+            return lines
+        return []
+
+
+class LoggingSink(EventSink):
+    """Writes each event as a structured log record.
+
+    The full event is attached as ``record.debate_event`` for JSON
+    formatters. Token events are logged at DEBUG, everything else at INFO.
+    """
+
+    def __init__(self, log: logging.Logger | None = None):
+        self._log = log or logger
+
+    def emit(self, event: DebateEvent) -> None:
+        """Log the event."""
+        level = logging.DEBUG if event.type == DebateEventType.TOKEN else logging.INFO
+        self._log.log(
+            level,
+            "debate %s: %s %s",
+            event.debate_id,
+            event.type.value,
+            event.data.get("agent_role", ""),
+            extra={"debate_event": event.model_dump(mode="json")},
+        )
+
+
+class QueueSink(EventSink):
+    """Buffers events in memory for another thread to consume.
+
+    When ``maxsize`` is reached the oldest event is dropped, so a slow or
+    absent consumer can never stall the debate.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        self.events: queue.Queue[DebateEvent] = queue.Queue(maxsize)
+        self.dropped = 0
+
+    def emit(self, event: DebateEvent) -> None:
+        """Enqueue the event, dropping the oldest one if full."""
+        while True:
+            try:
+                self.events.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self.events.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+
+    def get(self, timeout: float | None = None) -> DebateEvent:
+        """Block until the next event is available.
+
+        Raises:
+            queue.Empty: If ``timeout`` elapses first.
+        """
+        return self.events.get(timeout=timeout)
+
+    def drain(self) -> list[DebateEvent]:
+        """Remove and return every buffered event."""
+        drained = []
+        while True:
+            try:
+                drained.append(self.events.get_nowait())
+            except queue.Empty:
+                return drained
@@ -0,0 +1,116 @@
+"""Grading Executor - Bounded worker pool for blocking debate sessions.
+
+Debates are long, synchronous LLM pipelines. Running them on a dedicated,
+bounded thread pool keeps the API's event loop free to answer other
+requests, and the queue depth tells operators how far behind we are.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class GradingQueueFullError(RuntimeError):
+    """Raised when the executor's backlog is at capacity."""
+
+
+class GradingExecutor:
+    """Bounded thread pool that reports its running and queued work."""
+
+    def __init__(self, max_workers: int = 4, max_queue: int = 32):
+        """Initialize the executor.
+
+        Args:
+            max_workers: Debates executed at the same time.
+            max_queue: Debates allowed to wait for a worker before new
+                submissions are rejected.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="oracle-grader"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+
+    @property
+    def queued(self) -> int:
+        """Submissions waiting for a worker."""
+        return self._queued
+
+    @property
+    def running(self) -> int:
+        """Submissions currently executing."""
+        return self._running
+
+    def stats(self) -> dict[str, int]:
+        """Snapshot of executor load for health/queue reporting."""
+        with self._lock:
+            return {
+                "running": self._running,
+                "queued": self._queued,
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+            }
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking callable on the pool without blocking the event loop.
+
+        Raises:
+            GradingQueueFullError: If all workers are busy and the queue is full.
+        """
+        with self._lock:
+            if self._queued + self._running >= self.max_workers + self.max_queue:
+                raise GradingQueueFullError(
+                    f"Grading queue is full ({self._queued} waiting)"
+                )
+            self._queued += 1
+
+        def task() -> T:
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        future = self._pool.submit(task)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # A task cancelled before it started never leaves the queue itself
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and release the worker threads."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+_default_executor: GradingExecutor | None = None
+_default_lock = threading.Lock()
+
+
+def get_default_executor() -> GradingExecutor:
+    """Return the process-wide executor shared by graders without their own."""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = GradingExecutor()
+        return _default_executor
@@ -1,36 +1,107 @@
 """List Grader - Orchestrates list evaluation and scoring."""
 
+import asyncio
+import json
 import random
+import threading
 import time
 
-from vindicta_oracle.engine import DebateEngine
+from vindicta_oracle.engine import DebateEngine, EventCallback
+from vindicta_oracle.events import NullSink
+from vindicta_oracle.executor import GradingExecutor, get_default_executor
 from vindicta_oracle.models import (
     ArmyList,
     GradeRequest,
     GradeResponse,
+    DebateEvent,
+    DebateEventType,
     DebateTranscript,
 )
+from vindicta_oracle.telemetry import summarize_telemetry
+
+
+class _Flight:
+    """An in-flight debate shared by coalesced requests.
+
+    Progress events are recorded so callers joining late still see the
+    whole debate, in order, before live events. Token events only reach
+    listeners that asked for them. Once every caller waiting on the debate
+    has been cancelled, ``cancel`` is set so the engine stops early.
+    """
+
+    def __init__(self) -> None:
+        self.future: asyncio.Future[DebateTranscript] | None = None
+        self.cancel = threading.Event()
+        self.waiters = 0
+        self._events: list[DebateEvent] = []
+        self._listeners: list[tuple[EventCallback, bool]] = []
+        self._lock = threading.Lock()
+
+    def emit(self, event: DebateEvent) -> None:
+        """Record an event and forward it to every interested listener."""
+        with self._lock:
+            self._events.append(event)
+            for listener, tokens in self._listeners:
+                if tokens or event.type != DebateEventType.TOKEN:
+                    listener(event)
+
+    def subscribe(self, listener: EventCallback, tokens: bool = False) -> None:
+        """Replay past events to ``listener`` and follow new ones."""
+        with self._lock:
+            for event in self._events:
+                if tokens or event.type != DebateEventType.TOKEN:
+                    listener(event)
+            self._listeners.append((listener, tokens))
+
+    def unsubscribe(self, listener: EventCallback) -> None:
+        """Stop forwarding events to ``listener``."""
+        with self._lock:
+            self._listeners = [
+                entry for entry in self._listeners if entry[0] is not listener
+            ]
 
 
 class ListGrader:
     """Orchestrates the army list grading process."""
 
-    def __init__(self, engine: DebateEngine | None = None):
-        self.engine = engine or DebateEngine()
-
-    async def grade(self, request: GradeRequest) -> GradeResponse:
+    def __init__(
+        self,
+        engine: DebateEngine | None = None,
+        executor: GradingExecutor | None = None,
+    ):
+        self.engine = engine or DebateEngine(sink=NullSink())
+        self.executor = executor or get_default_executor()
+        self._in_flight: dict[str, _Flight] = {}
+
+    async def grade(
+        self,
+        request: GradeRequest,
+        on_event: EventCallback | None = None,
+        stream_tokens: bool = False,
+    ) -> GradeResponse:
         """Grade a single army list.
 
+        Concurrent requests for the same list (ignoring unit order and
+        whitespace) share a single debate; each still gets its own timing.
+
         Args:
             request: The grading request containing the army list
+            on_event: Optional callback receiving debate progress events
+            stream_tokens: Include partial agent output in the progress. A
+                request joining a debate already started without tokens
+                only receives whole arguments and votes; one that didn't
+                ask for tokens never receives them.
 
         Returns:
             Structured grade response
+
+        Raises:
+            GradingQueueFullError: If the grading executor is saturated.
         """
         start_time = time.time()
 
-        # 1. Run the council debate session
-        transcript = self.engine.run_grading_session(request.army_list)
+        # 1. Run (or join) the council debate session off the event loop
+        transcript = await self._run_debate(request.army_list, on_event, stream_tokens)
 
         # 2. Extract council performance (0-100)
         council_consensus = transcript.consensus_confidence * 100
@@ -67,9 +138,78 @@ class ListGrader:
                 "debate_id": str(transcript.id),
                 "rounds": len(transcript.rounds),
                 "processing_time_ms": processing_time_ms,
+                "telemetry": summarize_telemetry(transcript.telemetry),
             },
         )
 
+    async def _run_debate(
+        self,
+        army_list: ArmyList,
+        on_event: EventCallback | None = None,
+        stream_tokens: bool = False,
+    ) -> DebateTranscript:
+        """Run the grading debate, coalescing identical in-flight lists."""
+        key = self._list_key(army_list)
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = _Flight()
+            flight.future = asyncio.ensure_future(
+                self.executor.run(
+                    self.engine.run_grading_session,
+                    army_list,
+                    flight.emit,
+                    stream_tokens,
+                    flight.cancel,
+                )
+            )
+            self._in_flight[key] = flight
+
+            def land(_: asyncio.Future[DebateTranscript]) -> None:
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+
+            flight.future.add_done_callback(land)
+
+        if on_event is not None:
+            flight.subscribe(on_event, tokens=stream_tokens)
+
+        # Shield so one cancelled caller doesn't cancel the shared debate
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.future)
+        except asyncio.CancelledError:
+            if on_event is not None:
+                flight.unsubscribe(on_event)
+            if flight.waiters == 1:
+                # Nobody is left to read the result: free the executor slot
+                if self._in_flight.get(key) is flight:
+                    del self._in_flight[key]
+                flight.cancel.set()
+                flight.future.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    @staticmethod
+    def _list_key(army_list: ArmyList) -> str:
+        """Canonical form of a list, ignoring unit order and whitespace."""
+
+        def norm(text: str | None) -> str:
+            return " ".join(text.split()) if text else ""
+
+        units = sorted(
+            [norm(u.name), u.points, sorted(norm(w) for w in u.wargear)]
+            for u in army_list.units
+        )
+        return json.dumps(
+            [
+                norm(army_list.faction),
+                norm(army_list.detachment),
+                army_list.points_limit,
+                units,
+            ]
+        )
+
     def _calculate_primordia_score(self, army_list: ArmyList) -> int:
         """Stub for Primordia-AI tactical evaluation."""
         # Derived score from points efficiency (just a heuristic for the demo)
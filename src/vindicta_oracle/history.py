@@ -0,0 +1,164 @@
+"""Debate History - Incrementally rendered, token-budgeted debate history.
+
+Every agent prompt embeds the debate so far. Rather than re-formatting the
+whole transcript for each agent and each vote, ``DebateHistory`` renders a
+finished round once, caches its text (verbatim and condensed), and reuses
+the assembled history for every agent reading the same rounds. With a
+token budget, the most recent rounds stay verbatim and older ones are
+condensed (and, if still too long, omitted) so prompts stop growing with
+the number of rounds. A rolling summary of earlier rounds (see
+``RoundSummarizer``) can replace those rounds entirely.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from vindicta_oracle.models import Argument
+
+EMPTY_HISTORY = "No arguments yet - you are opening the debate."
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English)."""
+    return (len(text) + 3) // 4
+
+
+class DebateHistory:
+    """Per-round cache of the debate text that agents are prompted with.
+
+    Rounds are appended once finished; ``render`` picks up new rounds from
+    the transcript automatically. Safe to call from concurrent agent turns.
+    """
+
+    def __init__(
+        self,
+        token_budget: int | None = None,
+        recent_rounds: int = 1,
+        condensed_chars: int = 160,
+    ):
+        """Initialize an empty history.
+
+        Args:
+            token_budget: Approximate token limit for the rendered history,
+                or None for the full verbatim debate.
+            recent_rounds: Latest rounds always kept verbatim.
+            condensed_chars: Length each argument of an older round is cut
+                to (its first sentence, at most this many characters).
+        """
+        self.token_budget = token_budget
+        self.recent_rounds = recent_rounds
+        self.condensed_chars = condensed_chars
+        self._verbatim: list[str] = []
+        self._condensed: list[str] = []
+        self._rendered: dict[int, str] = {}
+        self._summary: str | None = None
+        self._summarized = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of rounds rendered so far."""
+        return len(self._verbatim)
+
+    @property
+    def summary(self) -> str | None:
+        """The current rolling summary, if one has been set."""
+        return self._summary
+
+    @property
+    def summarized_rounds(self) -> int:
+        """Number of leading rounds the summary covers."""
+        return self._summarized
+
+    def set_summary(self, summary: str, rounds: int) -> None:
+        """Replace rounds 1 to ``rounds`` with ``summary`` in rendered history."""
+        with self._lock:
+            self._summary = summary
+            self._summarized = rounds
+            self._rendered.clear()
+
+    def render(self, rounds: Sequence[Sequence[Argument]], upto: int) -> str:
+        """History text for the first ``upto`` rounds of ``rounds``.
+
+        Rounds not seen yet are rendered and cached first. The assembled
+        text is cached too, so every agent reading the same rounds shares
+        one string.
+        """
+        with self._lock:
+            for arguments in rounds[len(self._verbatim) :]:
+                self._append(arguments)
+            upto = min(upto, len(self._verbatim))
+            if upto not in self._rendered:
+                self._rendered[upto] = self._assemble(upto)
+            return self._rendered[upto]
+
+    def _append(self, arguments: Sequence[Argument]) -> None:
+        """Cache both renderings of a round (call with the lock held)."""
+        from vindicta_oracle.models import role_name  # models imports this module
+
+        roles = [role_name(arg.agent_role) for arg in arguments]
+        self._verbatim.append(
+            "\n\n".join(
+                f"[{role}]: {arg.content}" for role, arg in zip(roles, arguments)
+            )
+        )
+        round_num = len(self._verbatim)
+        self._condensed.append(
+            "\n".join(
+                f"[{role}, round {round_num}]: {self._condense(arg.content)}"
+                for role, arg in zip(roles, arguments)
+            )
+        )
+        self._rendered.clear()
+
+    def _assemble(self, upto: int) -> str:
+        """Join cached rounds, condensing the oldest ones to fit the budget.
+
+        Rounds covered by the summary are replaced by it, unless the caller
+        asked for fewer rounds than the summary spans.
+        """
+        if upto == 0:
+            return EMPTY_HISTORY
+
+        header: list[str] = []
+        first = 0
+        if self._summary is not None and self._summarized < upto:
+            header = [f"Summary of rounds 1-{self._summarized}:\n{self._summary}"]
+            first = self._summarized
+
+        parts = self._verbatim[first:upto]
+        if self.token_budget is None:
+            return "\n\n".join(header + parts)
+
+        # Older rounds go from verbatim to condensed to omitted, oldest first
+        older = max(0, len(parts) - self.recent_rounds)
+        for i in range(older):
+            if self._fits(header + parts):
+                break
+            parts[i] = self._condensed[first + i]
+        omitted = 0
+        while omitted < older and not self._fits(header + parts[omitted:]):
+            omitted += 1
+        parts = parts[omitted:]
+        if omitted:
+            parts.insert(0, f"({omitted} earlier round(s) omitted)")
+        return "\n\n".join(header + parts)
+
+    def _fits(self, parts: Sequence[str]) -> bool:
+        """Whether the joined parts are within the token budget."""
+        assert self.token_budget is not None
+        return estimate_tokens("\n\n".join(parts)) <= self.token_budget
+
+    def _condense(self, content: str) -> str:
+        """First sentence of an argument, capped at ``condensed_chars``."""
+        text = " ".join(content.split())
+        sentence = _SENTENCE_END.split(text, maxsplit=1)[0]
+        if len(sentence) > self.condensed_chars:
+            sentence = sentence[: self.condensed_chars].rstrip() + "..."
+        return sentence
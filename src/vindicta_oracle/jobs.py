@@ -0,0 +1,266 @@
+"""Grading Jobs - Durable asynchronous grading with progress events.
+
+A job records the grading request, its status, the final ``GradeResponse``
+and every ``DebateEvent`` emitted along the way in a local SQLite file, so
+clients can submit a list, disconnect, and poll or stream progress later.
+``JobRunner`` executes queued jobs in the background, at most as many at
+once as the grading executor has workers, so bursts wait in the store
+instead of overflowing the executor. Jobs that still find the executor full
+(its capacity is shared with direct grading requests) stay queued and retry
+with backoff.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from uuid import UUID
+
+from vindicta_oracle.executor import GradingQueueFullError
+from vindicta_oracle.grader import ListGrader
+from vindicta_oracle.models import (
+    DebateEvent,
+    GradeJob,
+    GradeRequest,
+    GradeResponse,
+    JobStatus,
+)
+
+FINISHED = (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+# Seconds a job waits before retrying a full grading executor, doubling up
+# to the maximum
+QUEUE_FULL_RETRY_DELAY = 0.5
+QUEUE_FULL_MAX_DELAY = 30.0
+
+
+class JobStore:
+    """SQLite-backed store of grading jobs and their progress events."""
+
+    def __init__(self, path: str | Path | None = None):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite file, or None (or ``":memory:"``) for an in-memory
+                store that is lost on restart.
+        """
+        path = ":memory:" if path is None else str(path)
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    request TEXT NOT NULL,
+                    job TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS job_events (
+                    job_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    event TEXT NOT NULL,
+                    PRIMARY KEY (job_id, seq)
+                );
+                """
+            )
+            self._db.commit()
+
+    def create(self, request: GradeRequest) -> GradeJob:
+        """Persist a new queued job for ``request``."""
+        job = GradeJob()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs VALUES (?, ?, ?)",
+                (str(job.id), request.model_dump_json(), job.model_dump_json()),
+            )
+            self._db.commit()
+        return job
+
+    def get(self, job_id: UUID) -> GradeJob | None:
+        """Return a job, or None if it doesn't exist."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT job FROM jobs WHERE id = ?", (str(job_id),)
+            ).fetchone()
+        return GradeJob.model_validate_json(row[0]) if row else None
+
+    def request(self, job_id: UUID) -> GradeRequest | None:
+        """Return the request a job was created for."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT request FROM jobs WHERE id = ?", (str(job_id),)
+            ).fetchone()
+        return GradeRequest.model_validate_json(row[0]) if row else None
+
+    def update(
+        self,
+        job_id: UUID,
+        status: JobStatus,
+        result: GradeResponse | None = None,
+        error: str | None = None,
+    ) -> GradeJob:
+        """Move a job to ``status``, recording its result or error."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT job FROM jobs WHERE id = ?", (str(job_id),)
+            ).fetchone()
+            if row is None:
+                raise KeyError(job_id)
+            job = GradeJob.model_validate_json(row[0])
+            job.status = status
+            job.result = result
+            job.error = error
+            job.updated_at = datetime.now()
+            self._db.execute(
+                "UPDATE jobs SET job = ? WHERE id = ?",
+                (job.model_dump_json(), str(job_id)),
+            )
+            self._db.commit()
+        return job
+
+    def append_event(self, job_id: UUID, event: DebateEvent) -> int:
+        """Record a progress event and return its sequence number (from 1)."""
+        with self._lock:
+            seq = self._db.execute(
+                "SELECT COALESCE(MAX(seq), 0) + 1 FROM job_events WHERE job_id = ?",
+                (str(job_id),),
+            ).fetchone()[0]
+            self._db.execute(
+                "INSERT INTO job_events VALUES (?, ?, ?)",
+                (str(job_id), seq, event.model_dump_json()),
+            )
+            self._db.commit()
+        return seq
+
+    def events(self, job_id: UUID, after: int = 0) -> list[tuple[int, DebateEvent]]:
+        """Progress events with a sequence number greater than ``after``."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT seq, event FROM job_events"
+                " WHERE job_id = ? AND seq > ? ORDER BY seq",
+                (str(job_id), after),
+            ).fetchall()
+        return [(seq, DebateEvent.model_validate_json(data)) for seq, data in rows]
+
+    def unfinished(self) -> list[GradeJob]:
+        """Jobs that were queued or running, e.g. when the server stopped."""
+        with self._lock:
+            rows = self._db.execute("SELECT job FROM jobs").fetchall()
+        jobs = [GradeJob.model_validate_json(row[0]) for row in rows]
+        return [job for job in jobs if job.status not in FINISHED]
+
+    def reset_events(self, job_id: UUID) -> None:
+        """Forget a job's progress events before it is re-run."""
+        with self._lock:
+            self._db.execute("DELETE FROM job_events WHERE job_id = ?", (str(job_id),))
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            self._db.close()
+
+
+class JobRunner:
+    """Runs stored grading jobs in the background."""
+
+    def __init__(self, store: JobStore, max_running: int = 4):
+        """Initialize the runner.
+
+        Args:
+            store: Where jobs, results and events are persisted.
+            max_running: Jobs graded at the same time; the rest stay queued.
+        """
+        self.store = store
+        self._slots = asyncio.Semaphore(max_running)
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def submit(self, request: GradeRequest, grader: ListGrader) -> GradeJob:
+        """Store a new job and schedule it; returns immediately."""
+        job = self.store.create(request)
+        self._schedule(job.id, request, grader)
+        return job
+
+    def resume(self, grader: ListGrader | Callable[[GradeRequest], ListGrader]) -> int:
+        """Re-run jobs left unfinished by a previous process.
+
+        Args:
+            grader: Grader to re-run the jobs on, or a function returning the
+                grader for each job's request (e.g. ``EnginePool.grader_for``).
+                Jobs it raises ``LookupError`` for are marked failed.
+
+        Returns:
+            The number of jobs rescheduled.
+        """
+        rescheduled = 0
+        for job in self.store.unfinished():
+            request = self.store.request(job.id)
+            if request is None:
+                continue
+            self.store.reset_events(job.id)
+            try:
+                job_grader = (
+                    grader if isinstance(grader, ListGrader) else grader(request)
+                )
+            except LookupError as e:
+                # e.g. the job's routing profile is no longer configured
+                self.store.update(
+                    job.id, JobStatus.FAILED, error=f"{type(e).__name__}: {e}"
+                )
+                continue
+            self.store.update(job.id, JobStatus.QUEUED)
+            self._schedule(job.id, request, job_grader)
+            rescheduled += 1
+        return rescheduled
+
+    async def close(self) -> None:
+        """Cancel running jobs; they are resumed on the next start."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _schedule(
+        self, job_id: UUID, request: GradeRequest, grader: ListGrader
+    ) -> None:
+        """Start the background task for a job."""
+        task = asyncio.create_task(self._run(job_id, request, grader))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self, job_id: UUID, request: GradeRequest, grader: ListGrader
+    ) -> None:
+        """Grade a job's list, recording events and the outcome.
+
+        While the grading executor is full the job goes back to queued and
+        is retried with backoff, outside the runner's slot.
+        """
+        delay = QUEUE_FULL_RETRY_DELAY
+        while True:
+            async with self._slots:
+                self.store.update(job_id, JobStatus.RUNNING)
+                try:
+                    response = await grader.grade(
+                        request,
+                        on_event=lambda event: self.store.append_event(job_id, event),
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except GradingQueueFullError:
+                    self.store.update(job_id, JobStatus.QUEUED)
+                except Exception as e:
+                    self.store.update(
+                        job_id, JobStatus.FAILED, error=f"{type(e).__name__}: {e}"
+                    )
+                    return
+                else:
+                    self.store.update(job_id, JobStatus.SUCCEEDED, result=response)
+                    return
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, QUEUE_FULL_MAX_DELAY)
@@ -1,9 +1,16 @@
 """Meta-Oracle data models for the 5-agent debate council."""
 
+from datetime import datetime
 from enum import Enum
+from typing import TYPE_CHECKING, Literal
 from uuid import UUID, uuid4
-from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+
+from pydantic import BaseModel, Field, PrivateAttr, RootModel, field_validator
+
+from vindicta_oracle.history import DebateHistory
+
+if TYPE_CHECKING:
+    from vindicta_oracle.ollama_client import OllamaConfig
 
 
 class AgentRole(str, Enum):
@@ -16,6 +23,15 @@ class AgentRole(str, Enum):
     CHAOS = "chaos"  # Upset detector / devil's advocate
 
 
+def role_name(role: AgentRole | str) -> str:
+    """Format an agent role the way transcripts and prompts show it.
+
+    Accepts the enum or its value, as carried in event payloads.
+    """
+    value = role.value if isinstance(role, AgentRole) else role
+    return value.upper().replace("_", "-")
+
+
 class ArgumentType(str, Enum):
     """Types of arguments agents can make during debate."""
 
@@ -26,6 +42,28 @@ class ArgumentType(str, Enum):
     QUESTION = "question"
 
 
+class CallTelemetry(BaseModel):
+    """Token counts and timings Ollama reported for one LLM call.
+
+    Durations are in milliseconds. Cached responses have zero counts.
+    Stopped calls were cancelled before Ollama reported its stats, so their
+    numbers are measured client-side (see ``telemetry.CallProgress``).
+    """
+
+    agent_role: AgentRole | None = None  # None for council-wide calls
+    phase: str  # "respond", "vote" or "summary"
+    round: int | None = None
+    model: str
+    cached: bool = False
+    stopped: bool = False
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    prefill_ms: float = 0.0
+    decode_ms: float = 0.0
+    load_ms: float = 0.0
+    total_ms: float = 0.0
+
+
 class Argument(BaseModel):
     """A single argument made by an agent during debate."""
 
@@ -36,7 +74,9 @@ class Argument(BaseModel):
     content: str
     in_response_to: UUID | None = None
     confidence: float = 0.5
+    stance: str | None = None  # Interim prediction, when agents report one
     timestamp: datetime = Field(default_factory=datetime.now)
+    telemetry: list[CallTelemetry] = Field(default_factory=list)
 
 
 class Vote(BaseModel):
@@ -47,6 +87,19 @@ class Vote(BaseModel):
     win_probability: float  # 0.0 to 1.0
     confidence: float  # How confident in this vote
     reasoning: str
+    telemetry: list[CallTelemetry] = Field(default_factory=list)
+
+
+class VoteBallot(BaseModel):
+    """The part of a ``Vote`` an agent writes itself, as structured output.
+
+    Its JSON schema constrains vote generation; a valid ballot maps
+    straight onto the matching ``Vote`` fields.
+    """
+
+    prediction: Literal["Player 1 wins", "Player 2 wins", "Draw"]
+    win_probability: float = Field(ge=0.0, le=1.0)
+    reasoning: str = Field(min_length=1)
 
 
 class DebateContext(BaseModel):
@@ -61,6 +114,14 @@ class DebateContext(BaseModel):
     additional_context: str | None = None
 
 
+class VotingMode(str, Enum):
+    """How the council's votes were collected."""
+
+    SEPARATE = "separate"  # A dedicated vote request per agent after the debate
+    FUSED = "fused"  # Every vote came with the agent's final-round argument
+    MIXED = "mixed"  # Fused where the trailer parsed, separate otherwise
+
+
 class DebateTranscript(BaseModel):
     """Full transcript of a council debate session."""
 
@@ -70,7 +131,44 @@ class DebateTranscript(BaseModel):
     votes: list[Vote] = Field(default_factory=list)
     consensus: str | None = None
     consensus_confidence: float = 0.0
+    termination_reason: str | None = None  # Why the debate stopped when it did
+    voting_mode: VotingMode = VotingMode.SEPARATE
+    # Every LLM call of the debate, including council and summary requests
+    telemetry: list[CallTelemetry] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.now)
+    _history: DebateHistory = PrivateAttr(default_factory=DebateHistory)
+
+    @property
+    def history(self) -> DebateHistory:
+        """Incrementally rendered history of the rounds so far."""
+        return self._history
+
+    @history.setter
+    def history(self, history: DebateHistory) -> None:
+        self._history = history
+
+
+class DebateEventType(str, Enum):
+    """Progress events emitted while a debate runs."""
+
+    STARTED = "started"  # Matchup context, before the first round
+    ROUND = "round"  # A debate round is starting
+    TOKEN = "token"  # Partial agent output while it is being generated
+    ARGUMENT = "argument"
+    SUMMARY = "summary"  # Rolling summary of earlier rounds is in place
+    VOTING = "voting"  # The voting phase is starting
+    VOTE = "vote"
+    ABSTAIN = "abstain"  # An agent gave no vote within the vote timeout
+    VERDICT = "verdict"
+
+
+class DebateEvent(BaseModel):
+    """A single progress update from a running debate."""
+
+    type: DebateEventType
+    debate_id: UUID
+    data: dict
+    timestamp: datetime = Field(default_factory=datetime.now)
 
 
 class Unit(BaseModel):
@@ -103,6 +201,67 @@ class ArmyList(BaseModel):
         return v
 
 
+# Generation phases a route can target
+PHASES = ("respond", "vote", "summary")
+
+
+class Route(BaseModel):
+    """Generation settings that override the base ``OllamaConfig``."""
+
+    model: str | None = None
+    temperature: float | None = Field(default=None, ge=0.0)
+    max_tokens: int | None = Field(default=None, ge=1)
+
+
+class RoutingTable(RootModel[dict[str, Route]]):
+    """Per-role, per-phase models and generation budgets.
+
+    Routes are keyed ``"<role>.<phase>"``, where either part may be ``*``,
+    e.g. ``{"chaos.*": {"model": "llama3.2:1b"}, "*.vote": {"max_tokens":
+    128}}``. Phases are ``respond`` (debate turns, including council-mode
+    rounds), ``vote`` and ``summary``. Council rounds and summaries don't
+    belong to one agent, so only ``*`` role keys apply to them.
+    """
+
+    root: dict[str, Route] = Field(default_factory=dict)
+
+    @field_validator("root")
+    @classmethod
+    def validate_keys(cls, routes: dict[str, Route]) -> dict[str, Route]:
+        roles = {role.value for role in AgentRole} | {"*"}
+        for key in routes:
+            role, _, phase = key.partition(".")
+            if role not in roles or phase not in (*PHASES, "*"):
+                raise ValueError(
+                    f"Invalid route {key!r}: expected '<role>.<phase>' with "
+                    f"role in {sorted(roles)} and phase in {[*PHASES, '*']}"
+                )
+        return routes
+
+    def route(self, role: AgentRole | None, phase: str) -> Route:
+        """Merged settings for ``role`` in ``phase``.
+
+        Keys apply from least to most specific (``*.*``, ``*.<phase>``,
+        ``<role>.*``, ``<role>.<phase>``); each overrides only the fields
+        it sets.
+        """
+        keys = ["*.*", f"*.{phase}"]
+        if role is not None:
+            keys += [f"{role.value}.*", f"{role.value}.{phase}"]
+        merged: dict = {}
+        for key in keys:
+            if key in self.root:
+                merged.update(self.root[key].model_dump(exclude_none=True))
+        return Route(**merged)
+
+    def config_for(
+        self, config: "OllamaConfig", role: AgentRole | None, phase: str
+    ) -> "OllamaConfig":
+        """``config`` with the route for ``role`` in ``phase`` applied."""
+        overrides = self.route(role, phase).model_dump(exclude_none=True)
+        return config.model_copy(update=overrides) if overrides else config
+
+
 class GradeRequest(BaseModel):
     """Payload for the /grade API endpoint."""
 
@@ -110,6 +269,10 @@ class GradeRequest(BaseModel):
     context: dict | None = Field(
         default=None, description="Optional mission or opponent context"
     )
+    routing_profile: str | None = Field(
+        default=None,
+        description="Name of a routing profile configured on the server",
+    )
 
 
 class GradeResponse(BaseModel):
@@ -124,3 +287,23 @@ class GradeResponse(BaseModel):
         ..., description="Final consensus and prediction details"
     )
     metadata: dict = Field(..., description="Processing metadata and session IDs")
+
+
+class JobStatus(str, Enum):
+    """Lifecycle of an asynchronous grading job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class GradeJob(BaseModel):
+    """Status and (once finished) result of an asynchronous grading job."""
+
+    id: UUID = Field(default_factory=uuid4)
+    status: JobStatus = JobStatus.QUEUED
+    result: GradeResponse | None = None
+    error: str | None = None
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
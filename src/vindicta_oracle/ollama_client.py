@@ -1,7 +1,47 @@
-"""Ollama client for local LLM inference."""
+"""Ollama client for local LLM inference.
 
+All requests go through a single process-wide connection pool: one
+``ollama.AsyncClient`` per host, living on a dedicated background event
+loop, with a semaphore capping in-flight requests to match the server's
+``OLLAMA_NUM_PARALLEL`` slots. ``AsyncOllamaClient`` awaits that pool from
+any event loop, and ``OllamaClient`` is the blocking facade used by agents.
+
+Callers that need to bound a generation wrap it in ``generation_budget``:
+the budget's clock only runs while its requests hold a slot, retries
+included, and cancelling the budget cancels the request on the pool loop,
+freeing the slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+import httpx
 import ollama
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from vindicta_oracle.cache import ResponseCache
+from vindicta_oracle.telemetry import (
+    CallProgress,
+    TelemetryRecorder,
+    current_recorder,
+)
+
+T = TypeVar("T")
+
+
+def _default_num_parallel() -> int:
+    """Match the server's parallel slots when ``OLLAMA_NUM_PARALLEL`` is set."""
+    return int(os.environ.get("OLLAMA_NUM_PARALLEL", "4"))
 
 
 class OllamaConfig(BaseModel):
@@ -10,25 +50,436 @@ class OllamaConfig(BaseModel):
     model: str = "llama3.2"
     temperature: float = 0.7
     max_tokens: int = 512
+    seed: int | None = None
+    host: str | None = None  # Falls back to OLLAMA_HOST / localhost
+    num_parallel: int = Field(default_factory=_default_num_parallel, ge=1)
+    keep_alive: str | float | None = None  # How long the model stays loaded
 
 
-class OllamaClient:
-    """Wrapper for local Ollama LLM inference."""
+class _ConnectionPool:
+    """Process-wide event loop owning the shared Ollama HTTP clients."""
+
+    def __init__(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="ollama-io", daemon=True
+        )
+        self._thread.start()
+        self._clients: dict[str | None, ollama.AsyncClient] = {}
+        self._limiters: dict[str | None, asyncio.Semaphore] = {}
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule a coroutine on the pool's loop from any thread."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def client(self, config: OllamaConfig) -> ollama.AsyncClient:
+        """Shared client for the config's host (call on the pool loop)."""
+        if config.host not in self._clients:
+            self._clients[config.host] = ollama.AsyncClient(
+                host=config.host,
+                limits=httpx.Limits(
+                    max_connections=config.num_parallel,
+                    max_keepalive_connections=config.num_parallel,
+                ),
+            )
+        return self._clients[config.host]
+
+    def limiter(self, config: OllamaConfig) -> asyncio.Semaphore:
+        """In-flight request limiter for the config's host (call on the pool loop).
+
+        The first config seen for a host sizes its semaphore.
+        """
+        if config.host not in self._limiters:
+            self._limiters[config.host] = asyncio.Semaphore(config.num_parallel)
+        return self._limiters[config.host]
+
+
+_pool: _ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> _ConnectionPool:
+    """Return the process-wide connection pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _ConnectionPool()
+        return _pool
+
+
+class GenerationBudget:
+    """Time limit for generations, counted while they hold a slot.
+
+    The owner polls ``expired`` (or ``remaining``) and calls ``cancel``;
+    the client keeps ``started`` and the in-flight request up to date.
+    Every generation made under one budget (e.g. a vote and its retries)
+    draws on the same deadline: time used before a request is queued stays
+    spent. Clients that don't report their start (e.g. test doubles) leave
+    the clock running from the last ``mark_started``.
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.started: float | None = None
+        self.used = 0.0
+        self.recorder: TelemetryRecorder | None = None
+        self._future: Future | None = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    def mark_started(self) -> None:
+        """Start (or resume) the clock."""
+        with self._lock:
+            self.started = time.monotonic()
+
+    def mark_queued(self) -> None:
+        """Pause the clock while a request waits for a slot."""
+        with self._lock:
+            if self.started is not None:
+                self.used += time.monotonic() - self.started
+            self.started = None
+
+    def remaining(self) -> float | None:
+        """Seconds left, or None while no generation is running."""
+        with self._lock:
+            if self.started is None:
+                return None
+            return self.timeout - self.used - (time.monotonic() - self.started)
+
+    def expired(self) -> bool:
+        """Whether the running generation has used up the budget."""
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def attach(self, future: Future, recorder: TelemetryRecorder | None = None) -> None:
+        """Track the in-flight request so ``cancel`` can stop it.
+
+        ``recorder`` is where the request reports its telemetry, kept so the
+        owner can still account for the calls of a generation it cancelled.
+        """
+        with self._lock:
+            self._future = future
+            self.recorder = recorder
+            if self._cancelled:
+                future.cancel()
+
+    def cancel(self) -> None:
+        """Cancel the in-flight request and any made after this."""
+        with self._lock:
+            self._cancelled = True
+            if self._future is not None:
+                self._future.cancel()
+
+
+_budget: ContextVar[GenerationBudget | None] = ContextVar(
+    "oracle_generation_budget", default=None
+)
+
+
+@contextmanager
+def generation_budget(budget: GenerationBudget) -> Iterator[GenerationBudget]:
+    """Subject the generations made inside the block to ``budget``."""
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+
+
+def current_budget() -> GenerationBudget | None:
+    """The budget of the innermost active ``generation_budget`` block."""
+    return _budget.get()
+
 
-    def __init__(self, config: OllamaConfig | None = None):
+class AsyncOllamaClient:
+    """Non-blocking Ollama client backed by the shared connection pool."""
+
+    def __init__(
+        self, config: OllamaConfig | None = None, cache: ResponseCache | None = None
+    ):
         self.config = config or OllamaConfig()
+        self.cache = cache
+
+    async def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        format: str | dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> str:
+        """Generate a response without blocking the caller's event loop.
+
+        Args:
+            system_prompt: System message.
+            user_prompt: User message.
+            format: Ollama output format, ``"json"`` or a JSON schema.
+            max_tokens: Overrides ``config.max_tokens`` for this request.
+            stop: Stop sequences ending the generation for this request.
+        """
+        return await asyncio.wrap_future(
+            self.submit(system_prompt, user_prompt, format, max_tokens, stop)
+        )
+
+    def submit(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        format: str | dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> Future[str]:
+        """Schedule a generation on the shared pool and return its future.
+
+        Cached responses resolve immediately without touching the pool.
+        """
+        return self._submit(system_prompt, user_prompt, format, max_tokens, stop)
+
+    def submit_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        on_chunk: Callable[[str], None],
+        format: str | dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> Future[str]:
+        """Schedule a streamed generation, calling ``on_chunk`` per token chunk.
+
+        ``on_chunk`` runs on the pool's I/O loop and must not block. The
+        future resolves to the full response; cancelling it stops the
+        generation on the server.
+        """
+        return self._submit(
+            system_prompt, user_prompt, format, max_tokens, stop, on_chunk
+        )
+
+    async def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        format: str | dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield response chunks as the model produces them."""
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue[str | None] = asyncio.Queue()
+
+        def put(chunk: str | None) -> None:
+            loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+
+        future = self.submit_stream(
+            system_prompt, user_prompt, put, format, max_tokens, stop
+        )
+        future.add_done_callback(lambda _: put(None))
+        try:
+            while (chunk := await chunks.get()) is not None:
+                yield chunk
+            future.result()
+        finally:
+            future.cancel()
+
+    def _submit(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        format: str | dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+        on_chunk: Callable[[str], None] | None = None,
+    ) -> Future[str]:
+        """Answer from the cache or schedule a chat request on the pool.
+
+        The caller's telemetry recorder and generation budget, if any, are
+        captured here since the chat itself runs on the pool's I/O thread.
+        """
+        recorder = current_recorder()
+        budget = current_budget()
+        key = None
+        if self.cache is not None:
+            key = ResponseCache.make_key(
+                self.config, system_prompt, user_prompt, format, max_tokens, stop
+            )
+            cached = self.cache.get(key)
+            if cached is not None:
+                if recorder is not None:
+                    recorder.record(self.config.model, None, cached=True)
+                if on_chunk is not None:
+                    on_chunk(cached)
+                future: Future[str] = Future()
+                future.set_result(cached)
+                return future
+
+        if budget is not None:
+            budget.mark_queued()
+        progress = CallProgress()
+        future = _get_pool().submit(
+            self._chat(
+                system_prompt,
+                user_prompt,
+                format=format,
+                max_tokens=max_tokens,
+                stop=stop,
+                key=key,
+                on_chunk=on_chunk,
+                recorder=recorder,
+                budget=budget,
+                progress=progress,
+            )
+        )
+        if recorder is not None:
+
+            def stopped(future: Future[str]) -> None:
+                # Runs in the cancelling thread, before the caller moves on
+                stats = progress.stats()
+                if future.cancelled() and not progress.finished and stats:
+                    recorder.record(self.config.model, stats, stopped=True)
+
+            future.add_done_callback(stopped)
+        if budget is not None:
+            budget.attach(future, recorder)
+        return future
 
-    def generate(self, system_prompt: str, user_prompt: str) -> str:
-        """Generate a response using local Ollama model."""
-        response = ollama.chat(
-            model=self.config.model,
-            messages=[
+    async def _chat(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        format: str | dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+        key: str | None = None,
+        on_chunk: Callable[[str], None] | None = None,
+        recorder: TelemetryRecorder | None = None,
+        budget: GenerationBudget | None = None,
+        progress: CallProgress | None = None,
+    ) -> str:
+        """Run one chat request on the pool loop, respecting the limiter.
+
+        ``progress`` is kept up to date for telemetry of cancelled calls.
+        """
+        pool = _get_pool()
+        progress = progress or CallProgress()
+        request = {
+            "model": self.config.model,
+            "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            options={
-                "temperature": self.config.temperature,
-                "num_predict": self.config.max_tokens,
-            },
+            "options": self._options(max_tokens, stop),
+            "keep_alive": self.config.keep_alive,
+        }
+        if format is not None:
+            request["format"] = format
+        async with pool.limiter(self.config):
+            if budget is not None:
+                budget.mark_started()
+            progress.start()
+            if on_chunk is None:
+                response = await pool.client(self.config).chat(**request)
+                content = response["message"]["content"]
+            else:
+                parts = []
+                response = None
+                stream = await pool.client(self.config).chat(**request, stream=True)
+                async for part in stream:
+                    # The final part carries the stats for the whole call
+                    response = part
+                    chunk = part["message"]["content"]
+                    if chunk:
+                        parts.append(chunk)
+                        progress.token()
+                        on_chunk(chunk)
+                content = "".join(parts)
+
+        progress.finished = True
+        if recorder is not None:
+            recorder.record(self.config.model, response)
+
+        if key is not None and self.cache is not None:
+            # The disk tier blocks, so keep it off the shared I/O loop
+            await asyncio.to_thread(self.cache.put, key, content)
+        return content
+
+    def _options(
+        self, max_tokens: int | None = None, stop: list[str] | None = None
+    ) -> dict:
+        """Ollama generation options for this config."""
+        options = {
+            "temperature": self.config.temperature,
+            "num_predict": max_tokens or self.config.max_tokens,
+        }
+        if self.config.seed is not None:
+            options["seed"] = self.config.seed
+        if stop:
+            options["stop"] = stop
+        return options
+
+    async def warm_up(self) -> None:
+        """Load the model into memory ahead of the first real request.
+
+        An empty chat makes Ollama load the model and hold it for
+        ``keep_alive`` without generating anything.
+        """
+        await asyncio.wrap_future(_get_pool().submit(self._load()))
+
+    async def _load(self) -> None:
+        """Send the keep-alive ping on the pool loop."""
+        pool = _get_pool()
+        await pool.client(self.config).chat(
+            model=self.config.model, messages=[], keep_alive=self.config.keep_alive
+        )
+
+
+class OllamaClient:
+    """Wrapper for local Ollama LLM inference.
+
+    Blocking facade over ``AsyncOllamaClient`` so synchronous callers share
+    the same connection pool and concurrency limit as async ones.
+    """
+
+    def __init__(
+        self, config: OllamaConfig | None = None, cache: ResponseCache | None = None
+    ):
+        self.config = config or OllamaConfig()
+        self.aio = AsyncOllamaClient(self.config, cache=cache)
+
+    def generate(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        format: str | dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> str:
+        """Generate a response using local Ollama model.
+
+        See ``AsyncOllamaClient.generate`` for the per-call overrides.
+        """
+        return self.aio.submit(
+            system_prompt, user_prompt, format, max_tokens, stop
+        ).result()
+
+    def stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        format: str | dict | None = None,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+    ) -> Iterator[str]:
+        """Yield response chunks as the model produces them.
+
+        Closing the iterator early stops the generation on the server.
+        """
+        chunks: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        future = self.aio.submit_stream(
+            system_prompt, user_prompt, chunks.put, format, max_tokens, stop
         )
-        return response["message"]["content"]
+        future.add_done_callback(lambda _: chunks.put(None))
+        try:
+            while (chunk := chunks.get()) is not None:
+                yield chunk
+            future.result()
+        finally:
+            future.cancel()
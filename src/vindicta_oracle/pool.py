@@ -0,0 +1,207 @@
+"""Engine Pool - Long-lived, warmed-up graders shared across API requests.
+
+Building a ``DebateEngine`` wires up five agents and an Ollama client, and
+the first generation against a cold model pays the model-load cost. The
+pool builds one grader per ``OllamaConfig`` for the lifetime of the app,
+loads the model at startup (retrying until Ollama answers) and reports
+readiness once that has happened.
+
+Per-role routing is chosen by operators: requests name one of the pool's
+routing profiles rather than sending a table, so clients can't pick
+arbitrary models or budgets. The pool holds at most ``max_graders``
+graders, dropping the least recently used beyond that.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+
+from vindicta_oracle.cache import ResponseCache
+from vindicta_oracle.engine import DebateEngine
+from vindicta_oracle.events import NullSink
+from vindicta_oracle.executor import GradingExecutor
+from vindicta_oracle.grader import ListGrader
+from vindicta_oracle.models import GradeRequest, RoutingTable
+from vindicta_oracle.ollama_client import AsyncOllamaClient, OllamaConfig
+
+# Seconds between warm-up attempts while Ollama is unreachable, doubling up
+# to the maximum
+WARM_UP_RETRY_DELAY = 1.0
+WARM_UP_MAX_DELAY = 60.0
+
+
+class UnknownRoutingProfileError(LookupError):
+    """Raised when a request names a routing profile the pool doesn't have."""
+
+
+def load_routing_profiles(value: str) -> dict[str, RoutingTable]:
+    """Parse ``{"name": <routing table>}`` given inline or as a JSON file path."""
+    path = Path(value)
+    if not value.lstrip().startswith("{") and path.is_file():
+        value = path.read_text()
+    profiles = json.loads(value)
+    if not isinstance(profiles, dict):
+        raise TypeError("Routing profiles must be a JSON object of named tables")
+    return {
+        name: RoutingTable.model_validate(table) for name, table in profiles.items()
+    }
+
+
+class EnginePool:
+    """Cache of warm ``ListGrader`` instances keyed by config and routing."""
+
+    def __init__(
+        self,
+        default_config: OllamaConfig | None = None,
+        executor: GradingExecutor | None = None,
+        num_rounds: int = 3,
+        cache: ResponseCache | None = None,
+        routing_profiles: Mapping[str, RoutingTable] | None = None,
+        max_graders: int = 16,
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            default_config: Config used when callers don't supply one.
+            executor: Executor shared by every grader in the pool.
+            num_rounds: Debate rounds for engines built by the pool.
+            cache: Response cache shared by every engine in the pool.
+            routing_profiles: Named routing tables requests may select.
+            max_graders: Graders kept before the least recently used is
+                dropped (the default grader is always kept).
+        """
+        if max_graders < 1:
+            raise ValueError("max_graders must be at least 1")
+        self.default_config = default_config or OllamaConfig()
+        self.executor = executor or GradingExecutor()
+        self.num_rounds = num_rounds
+        self.cache = cache
+        self.routing_profiles = dict(routing_profiles or {})
+        self.max_graders = max_graders
+        self._graders: OrderedDict[str, ListGrader] = OrderedDict()
+        self._warm: set[str] = set()
+        self._errors: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(config: OllamaConfig, routing: RoutingTable | None = None) -> str:
+        """Stable key for a config (pydantic models aren't hashable)."""
+        key = config.model_dump_json()
+        if routing:
+            key += routing.model_dump_json()
+        return key
+
+    def grader(
+        self,
+        config: OllamaConfig | None = None,
+        routing: RoutingTable | None = None,
+    ) -> ListGrader:
+        """Return the pooled grader for ``config`` and ``routing``.
+
+        The grader is built on first use.
+        """
+        config = config or self.default_config
+        key = self._key(config, routing)
+        with self._lock:
+            if key in self._graders:
+                self._graders.move_to_end(key)
+            else:
+                # Progress reaches API clients through on_event, not stdout,
+                # and schema-constrained votes avoid re-grading on mis-parses
+                engine = DebateEngine(
+                    config=config,
+                    num_rounds=self.num_rounds,
+                    cache=self.cache,
+                    sink=NullSink(),
+                    structured_votes=True,
+                    routing=routing or None,
+                )
+                self._graders[key] = ListGrader(engine=engine, executor=self.executor)
+                self._evict()
+            return self._graders[key]
+
+    def grader_for(self, request: GradeRequest) -> ListGrader:
+        """Return the pooled grader for a request's routing profile.
+
+        Raises:
+            UnknownRoutingProfileError: If the profile isn't configured.
+        """
+        name = request.routing_profile
+        if name is None:
+            return self.grader()
+        if name not in self.routing_profiles:
+            raise UnknownRoutingProfileError(name)
+        return self.grader(routing=self.routing_profiles[name])
+
+    def _evict(self) -> None:
+        """Drop least recently used graders beyond ``max_graders``.
+
+        Callers holding an evicted grader can keep using it; it is just no
+        longer handed out. Caller must hold ``_lock``.
+        """
+        default = self._key(self.default_config)
+        for key in list(self._graders):
+            if len(self._graders) <= self.max_graders:
+                break
+            if key != default:
+                del self._graders[key]
+
+    async def warm_up(self, config: OllamaConfig | None = None) -> bool:
+        """Build the grader for ``config`` and load its model.
+
+        Returns:
+            True if the model answered the keep-alive ping.
+        """
+        config = config or self.default_config
+        key = self._key(config)
+        self.grader(config)
+        try:
+            await AsyncOllamaClient(config).warm_up()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._errors[key] = f"{type(e).__name__}: {e}"
+            return False
+        self._errors.pop(key, None)
+        self._warm.add(key)
+        return True
+
+    async def warm_up_until_ready(self, config: OllamaConfig | None = None) -> None:
+        """Retry ``warm_up`` with backoff until the model loads or cancelled."""
+        delay = WARM_UP_RETRY_DELAY
+        while not await self.warm_up(config):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARM_UP_MAX_DELAY)
+
+    @property
+    def ready(self) -> bool:
+        """Whether the default model has been loaded."""
+        return self._key(self.default_config) in self._warm
+
+    def status(self) -> dict:
+        """Readiness details for the readiness probe."""
+        key = self._key(self.default_config)
+        status = {
+            "status": "ready" if self.ready else "warming",
+            "model": self.default_config.model,
+            "engines": len(self._graders),
+            "routing_profiles": sorted(self.routing_profiles),
+            "queue": self.executor.stats(),
+        }
+        if self.cache is not None:
+            status["cache"] = self.cache.stats()
+        if key in self._errors:
+            status["status"] = "unavailable"
+            status["error"] = self._errors[key]
+        return status
+
+    def close(self) -> None:
+        """Release the pool's worker threads."""
+        self.executor.shutdown(wait=False)
+        if self.cache is not None:
+            self.cache.close()
@@ -0,0 +1,168 @@
+"""Rules ingestion CLI - Crawl rules pages into the vector store.
+
+Only pages that changed since their last crawl are chunked, embedded and
+stored; see ``crawl_state.recrawl_urls``.
+"""
+
+import argparse
+import asyncio
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from vindicta_oracle.rag_pipeline.crawl_state import CrawlStateStore, recrawl_urls
+from vindicta_oracle.rag_pipeline.scraper import ScrapeLimits
+
+_RELATIVE = re.compile(r"^(\d+)([mhd])$")
+_UNITS = {"m": "minutes", "h": "hours", "d": "days"}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Ingest rules pages from the command line."""
+    parser = argparse.ArgumentParser(
+        description="Crawl rules pages into the Meta-Oracle vector store",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m vindicta_oracle.rag_pipeline --urls-file rules_urls.txt
+  python -m vindicta_oracle.rag_pipeline --urls-file rules_urls.txt --since 20h
+  python -m vindicta_oracle.rag_pipeline https://wahapedia.ru/wh40k10ed/the-rules/core-rules/ --force
+        """,
+    )
+    parser.add_argument("urls", nargs="*", help="Rules page URLs to ingest")
+    parser.add_argument(
+        "--urls-file", help="File with one URL per line ('#' starts a comment)"
+    )
+    parser.add_argument(
+        "--state",
+        default="crawl_state.db",
+        help="SQLite file recording each page's last crawl (default: crawl_state.db)",
+    )
+    parser.add_argument(
+        "--since",
+        type=parse_since,
+        help=(
+            "Skip pages checked at or after this time: an ISO date/datetime or "
+            "a relative age like 30m, 12h or 7d"
+        ),
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore recorded crawl state and re-ingest every page",
+    )
+    parser.add_argument(
+        "--chroma-dir",
+        default="./chroma_db",
+        help="ChromaDB persistence directory (default: ./chroma_db)",
+    )
+    parser.add_argument(
+        "--embedding-model",
+        default="nomic-embed-text",
+        help="Ollama embedding model (default: nomic-embed-text)",
+    )
+    parser.add_argument(
+        "--embedding-cache",
+        help="Directory for a persistent embedding cache (default: none)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Pages crawled in parallel (default: 8)",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=2,
+        help="Pages crawled in parallel from one host (default: 2)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.force and args.since:
+        parser.error("--since and --force are mutually exclusive")
+    urls = list(args.urls)
+    if args.urls_file:
+        urls += _read_urls(args.urls_file)
+    if not urls:
+        parser.error("no URLs given")
+
+    # Imported here so --help works without the storage dependencies
+    from vindicta_oracle.rag_pipeline.clients.chromadb_client import ChromaDBClient
+    from vindicta_oracle.rag_pipeline.clients.ollama_client import (
+        OllamaEmbeddingClient,
+    )
+    from vindicta_oracle.rag_pipeline.storage import RulesStorage
+
+    embedder = OllamaEmbeddingClient(model=args.embedding_model)
+    if args.embedding_cache:
+        from vindicta_oracle.rag_pipeline.embedding_cache import (
+            CachedEmbedder,
+            EmbeddingCache,
+        )
+
+        cache = EmbeddingCache(args.embedding_cache, model=args.embedding_model)
+        embedder = CachedEmbedder(embedder, cache)
+    storage = RulesStorage.with_index(
+        ChromaDBClient(persist_directory=args.chroma_dir), embedder
+    )
+
+    state_store = CrawlStateStore(args.state)
+    try:
+        result = asyncio.run(
+            recrawl_urls(
+                urls,
+                state_store,
+                limits=ScrapeLimits(
+                    max_concurrency=args.concurrency,
+                    per_host_connections=args.per_host,
+                ),
+                since=args.since,
+                force=args.force,
+            )
+        )
+        storage.store_chunks(result.chunks)
+        # Only record pages once their chunks are safely stored
+        state_store.save(result.pages)
+    finally:
+        state_store.close()
+
+    print(
+        f"Changed: {len(result.changed)} ({result.success_count} chunks), "
+        f"unchanged: {len(result.unchanged)}, "
+        f"not modified: {len(result.not_modified)}, "
+        f"skipped: {len(result.skipped)}, errors: {result.error_count}"
+    )
+    for error in result.errors:
+        print(f"  ✗ {error['url']}: {error['error_type']}: {error['message']}")
+
+
+def parse_since(value: str) -> datetime:
+    """Parse ``--since``: an ISO date/datetime or an age like ``12h``.
+
+    Naive datetimes are taken as local time.
+    """
+    match = _RELATIVE.match(value.strip())
+    if match:
+        amount, unit = match.groups()
+        return datetime.now() - timedelta(**{_UNITS[unit]: int(amount)})
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected an ISO datetime or an age like 12h, got {value!r}"
+        )
+
+
+def _read_urls(path: str) -> list[str]:
+    """URLs listed in a file, skipping blank lines and comments."""
+    lines = Path(path).read_text(encoding="utf-8").splitlines()
+    return [
+        line.strip()
+        for line in lines
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+
+if __name__ == "__main__":
+    main()
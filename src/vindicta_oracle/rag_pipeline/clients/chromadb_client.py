@@ -40,9 +40,13 @@ class ChromaDBClient:
         self,
         ids: list[str] | None = None,
         where: dict[str, Any] | None = None,
+        include: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Get documents by ID or filter."""
+        """Get documents by ID or filter, optionally only some fields."""
+        if include is None:
+            return self.collection.get(ids=ids, where=where)
         return self.collection.get(
             ids=ids,
             where=where,
+            include=include,  # type: ignore[arg-type]
         )
@@ -9,6 +9,16 @@ class OllamaEmbeddingClient:
         self.model = model
 
     def embed(self, text: str) -> list[float]:
-        """Generate an embedding vector for the given text."""
-        response = ollama.embeddings(model=self.model, prompt=text)
-        return response["embedding"]
+        """Generate an embedding vector for the given text.
+
+        Uses the same endpoint as ``embed_batch``, so queries and stored
+        documents get identical (normalized) vectors for the same text.
+        """
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embedding vectors for several texts in one request."""
+        if not texts:
+            return []
+        response = ollama.embed(model=self.model, input=texts)
+        return [list(embedding) for embedding in response["embeddings"]]
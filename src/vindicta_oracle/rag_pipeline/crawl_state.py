@@ -0,0 +1,307 @@
+"""RAG Pipeline crawl state — incremental re-crawls of rules pages.
+
+Rules pages only change when FAQs and dataslates drop, so a refresh
+shouldn't re-fetch and re-chunk every page. ``CrawlStateStore`` keeps the
+ETag, Last-Modified and whole-page SHA-256 of each URL's last crawl in
+SQLite. ``recrawl_urls`` asks the server first with a conditional HEAD
+request; pages it reports unchanged (304, or the same validators) are not
+fetched at all. Pages that are fetched but whose markdown hashes the same
+as last time are not chunked, so nothing downstream is embedded or stored.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from pathlib import Path
+from typing import Protocol
+
+from vindicta_oracle.rag_pipeline.scraper import (
+    CrawlerProtocol,
+    ScrapeLimits,
+    ScrapeResult,
+    _HostLimiter,
+    compute_content_hash,
+    extract_markdown_chunks,
+    open_crawl4ai_crawler,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PageState:
+    """What the last crawl of a URL saw."""
+
+    url: str
+    page_hash: str
+    etag: str | None = None
+    last_modified: str | None = None
+    checked_at: float = 0.0  # Epoch seconds of the last check
+
+
+@dataclass
+class Validators:
+    """HTTP cache validators returned for a page."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def matches(self, state: PageState) -> bool:
+        """Whether these identify the same page version as ``state``."""
+        if self.etag is not None or state.etag is not None:
+            return self.etag == state.etag
+        return self.last_modified is not None and (
+            self.last_modified == state.last_modified
+        )
+
+
+class ValidatorProtocol(Protocol):
+    """Protocol for conditional page checks — enables testing without HTTP."""
+
+    async def check(
+        self, url: str, etag: str | None, last_modified: str | None
+    ) -> Validators | None:
+        """Current validators for a page, or None if it is not modified."""
+        ...
+
+
+class HttpValidator:
+    """Conditional HEAD requests over ``urllib``, run in worker threads."""
+
+    def __init__(self, timeout: float = 10.0) -> None:
+        self.timeout = timeout
+
+    async def check(
+        self, url: str, etag: str | None, last_modified: str | None
+    ) -> Validators | None:
+        """Send a HEAD request with If-None-Match / If-Modified-Since."""
+        return await asyncio.to_thread(self._head, url, etag, last_modified)
+
+    def _head(
+        self, url: str, etag: str | None, last_modified: str | None
+    ) -> Validators | None:
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        request = urllib.request.Request(url, method="HEAD", headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return Validators(
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+        except urllib.error.HTTPError as exc:
+            if exc.code == 304:
+                return None
+            raise
+
+
+class CrawlStateStore:
+    """SQLite record of the last crawl of each URL."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Open (or create) the state database at ``path``."""
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                page_hash TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                checked_at REAL NOT NULL
+            )"""
+        )
+        self._db.commit()
+
+    def get(self, url: str) -> PageState | None:
+        """The recorded state of a URL, if it has been crawled."""
+        return self.get_many([url]).get(url)
+
+    def get_many(self, urls: Iterable[str]) -> dict[str, PageState]:
+        """Recorded states of several URLs, keyed by URL."""
+        urls = list(dict.fromkeys(urls))
+        states: dict[str, PageState] = {}
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(urls), 500):
+                batch = urls[start : start + 500]
+                rows = self._db.execute(
+                    "SELECT url, page_hash, etag, last_modified, checked_at"
+                    f" FROM pages WHERE url IN ({','.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+                states.update((row[0], PageState(*row)) for row in rows)
+        return states
+
+    def save(self, states: Iterable[PageState]) -> None:
+        """Record crawled pages, replacing their previous state."""
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO pages"
+                " (url, page_hash, etag, last_modified, checked_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [
+                    (s.url, s.page_hash, s.etag, s.last_modified, s.checked_at)
+                    for s in states
+                ],
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+
+@dataclass
+class RecrawlResult(ScrapeResult):
+    """Result of an incremental crawl.
+
+    ``chunks`` only come from changed pages. ``pages`` holds the new state
+    of every page that was checked; save it once the chunks are stored.
+    """
+
+    pages: list[PageState] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)  # New or modified
+    unchanged: list[str] = field(default_factory=list)  # Fetched, same hash
+    not_modified: list[str] = field(default_factory=list)  # Not fetched
+    skipped: list[str] = field(default_factory=list)  # Checked since ``since``
+
+
+async def recrawl_urls(
+    urls: list[str],
+    state_store: CrawlStateStore,
+    crawler: CrawlerProtocol | None = None,
+    limits: ScrapeLimits | None = None,
+    validator: ValidatorProtocol | None = None,
+    since: datetime | None = None,
+    force: bool = False,
+) -> RecrawlResult:
+    """Crawl only the pages that changed since their last recorded crawl.
+
+    State is read from ``state_store`` but not written: the caller saves
+    ``result.pages`` after storing the chunks, so a failed run is simply
+    repeated.
+
+    Args:
+        urls: URLs to crawl.
+        state_store: Where previous crawls were recorded.
+        crawler: Optional crawler implementation. Without one, a shared
+            crawl4ai crawler is started if any page needs fetching.
+        limits: Concurrency and per-host limits for checks and fetches.
+        validator: Conditional request implementation (HTTP by default).
+        since: Skip pages already checked at or after this time.
+        force: Ignore recorded state and re-ingest every page.
+
+    Returns:
+        A ``RecrawlResult`` with chunks of changed pages and new states.
+    """
+    limits = limits or ScrapeLimits()
+    validator = validator or HttpValidator()
+    slots = _HostLimiter(limits)
+    previous = {} if force else state_store.get_many(urls)
+    result = RecrawlResult()
+
+    async def check(url: str) -> Validators | None:
+        state = previous.get(url)
+        async with slots.slot(url):
+            try:
+                return await validator.check(
+                    url,
+                    state.etag if state else None,
+                    state.last_modified if state else None,
+                )
+            except Exception as exc:
+                # Not every server answers HEAD; fall back to fetching the page
+                logger.debug("Validator check failed for %s: %s", url, str(exc))
+                return Validators()
+
+    cutoff = since.timestamp() if since is not None else None
+    pending = []
+    for url in dict.fromkeys(urls):
+        state = previous.get(url)
+        if state is not None and cutoff is not None and state.checked_at >= cutoff:
+            result.skipped.append(url)
+        else:
+            pending.append(url)
+
+    checked = await asyncio.gather(*(check(url) for url in pending))
+    now = time.time()
+    to_fetch: list[tuple[str, Validators]] = []
+    for url, validators in zip(pending, checked):
+        state = previous.get(url)
+        if state is not None and (validators is None or validators.matches(state)):
+            result.not_modified.append(url)
+            result.pages.append(replace(state, checked_at=now))
+        else:
+            to_fetch.append((url, validators or Validators()))
+
+    if to_fetch:
+        async with _crawler_for(crawler) as active:
+
+            async def fetch(url: str) -> str:
+                async with slots.slot(url):
+                    return await active.fetch_markdown(url)
+
+            outcomes = await asyncio.gather(
+                *(fetch(url) for url, _ in to_fetch), return_exceptions=True
+            )
+        now = time.time()
+        for (url, validators), outcome in zip(to_fetch, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, BaseException):
+                result.errors.append(
+                    {
+                        "url": url,
+                        "error_type": type(outcome).__name__,
+                        "message": str(outcome),
+                    }
+                )
+                logger.error("Failed to scrape %s: %s (continuing)", url, outcome)
+                continue
+            page_hash = compute_content_hash(outcome)
+            state = previous.get(url)
+            if state is not None and state.page_hash == page_hash:
+                result.unchanged.append(url)
+            else:
+                chunks = extract_markdown_chunks(outcome, url)
+                result.chunks.extend(chunks)
+                result.changed.append(url)
+                logger.info("Scraped %d chunks from %s", len(chunks), url)
+            result.pages.append(
+                PageState(
+                    url=url,
+                    page_hash=page_hash,
+                    etag=validators.etag,
+                    last_modified=validators.last_modified,
+                    checked_at=now,
+                )
+            )
+    return result
+
+
+@asynccontextmanager
+async def _crawler_for(
+    crawler: CrawlerProtocol | None,
+) -> AsyncIterator[CrawlerProtocol]:
+    """The given crawler, or a crawl4ai crawler for the duration of the block."""
+    if crawler is not None:
+        yield crawler
+        return
+    async with open_crawl4ai_crawler() as shared:
+        yield shared
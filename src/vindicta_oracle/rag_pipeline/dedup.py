@@ -0,0 +1,128 @@
+"""RAG Pipeline dedup index — in-memory content hashes and URL versions.
+
+Loaded once from the vector store, the index answers the two questions
+ingestion asks for every chunk (has this content been stored? what is the
+latest version of this URL?) without a metadata scan each time, and is
+kept current as ``RulesStorage`` upserts new segments (FR-003, FR-006).
+
+For very large corpora the per-hash records can be replaced by a Bloom
+filter: definite misses still cost nothing, and only possible hits are
+confirmed against the store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from vindicta_oracle.rag_pipeline.storage import VectorStore
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set of strings with no false negatives."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """Size the filter for ``capacity`` items at ``error_rate``.
+
+        Args:
+            capacity: Expected number of items.
+            error_rate: Target false-positive rate once full, in (0, 1).
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self._size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def add(self, item: str) -> None:
+        """Add an item to the filter."""
+        for position in self._positions(item):
+            self._bits[position // 8] |= 1 << (position % 8)
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        return all(
+            self._bits[position // 8] & (1 << (position % 8))
+            for position in self._positions(item)
+        )
+
+    def _positions(self, item: str) -> list[int]:
+        """Bit positions for an item, by double hashing one digest."""
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self._size for i in range(self._hash_count)]
+
+
+class DedupIndex:
+    """Known content hashes and the latest version of each URL.
+
+    By default each hash maps to the URL and version it was stored with,
+    so duplicates are resolved without touching the store. With a
+    ``BloomFilter`` only membership is kept and ``known`` returns nothing;
+    callers confirm ``might_contain`` hits against the store instead.
+    """
+
+    def __init__(self, bloom: BloomFilter | None = None) -> None:
+        self._bloom = bloom
+        self._records: dict[str, tuple[str, int]] = {}
+        self._latest: dict[str, int] = {}
+
+    @classmethod
+    def from_store(
+        cls,
+        store: VectorStore,
+        bloom_capacity: int | None = None,
+        error_rate: float = 0.001,
+    ) -> DedupIndex:
+        """Build the index from every segment's metadata in one query.
+
+        Only metadata is fetched, not documents or embeddings.
+
+        Args:
+            store: The vector store to read.
+            bloom_capacity: Use a Bloom filter sized for this many hashes
+                instead of exact per-hash records.
+            error_rate: False-positive rate for the Bloom filter.
+        """
+        bloom = None
+        if bloom_capacity is not None:
+            bloom = BloomFilter(bloom_capacity, error_rate)
+        index = cls(bloom)
+        result = store.get(include=["metadatas"])
+        metas: list[dict[str, Any]] = result.get("metadatas") or []
+        for meta in metas:
+            if meta.get("content_hash") and meta.get("url"):
+                index.add(
+                    meta["content_hash"], meta["url"], int(meta.get("version", 1))
+                )
+        return index
+
+    def add(self, content_hash: str, url: str, version: int) -> None:
+        """Record a stored segment."""
+        if self._bloom is not None:
+            self._bloom.add(content_hash)
+        elif content_hash not in self._records:
+            self._records[content_hash] = (url, version)
+        self._latest[url] = max(self._latest.get(url, 0), version)
+
+    def might_contain(self, content_hash: str) -> bool:
+        """Whether the hash may have been stored (never wrong when False)."""
+        if self._bloom is not None:
+            return content_hash in self._bloom
+        return content_hash in self._records
+
+    def known(self, content_hash: str) -> tuple[str, int] | None:
+        """URL and version a hash was first stored with, if recorded exactly."""
+        return self._records.get(content_hash)
+
+    def latest_version(self, url: str) -> int:
+        """Highest stored version of a URL, or 0 if it has none."""
+        return self._latest.get(url, 0)
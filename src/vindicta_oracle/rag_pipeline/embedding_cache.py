@@ -0,0 +1,230 @@
+"""RAG Pipeline embedding cache — memory-mapped vectors keyed by content hash.
+
+Overlapping chunks and pages re-scraped after small edits keep producing
+text that has been embedded before. ``EmbeddingCache`` stores each
+embedding once, keyed by the SHA-256 hash of the model name and text, as
+a row of a memory-mapped float32/float16 matrix with a hash-to-row index
+file next to it. Lookups are zero-copy views into the mapping and the cache
+survives restarts. The cache belongs to one embedding model; opening it
+with a different model (or dtype) discards the old vectors.
+
+``CachedEmbedder`` wraps any embedding provider with the cache.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from vindicta_oracle.rag_pipeline.scraper import compute_content_hash
+
+if TYPE_CHECKING:
+    from vindicta_oracle.rag_pipeline.storage import EmbeddingProvider
+
+_META_FILE = "meta.json"
+_VECTORS_FILE = "vectors.bin"
+_INDEX_FILE = "index.txt"
+
+# Bumped whenever ``EmbeddingCache.key`` changes, so old keys are discarded
+_KEY_VERSION = 2
+
+# Rows the matrix file is first sized for; it doubles whenever it fills up
+_INITIAL_ROWS = 1024
+
+
+class EmbeddingCache:
+    """Persistent (model, text) -> embedding store.
+
+    Files live in ``path``: ``meta.json`` (model, dtype, dimensions),
+    ``vectors.bin`` (the matrix) and ``index.txt`` (one content hash per
+    line; line ``n`` is row ``n``). Rows are flushed before their index
+    lines are written, so a crash never indexes a missing vector.
+    """
+
+    def __init__(self, path: str | Path, model: str, dtype: str = "float32") -> None:
+        """Open (or create) the cache for ``model`` in ``path``.
+
+        Args:
+            path: Directory holding the cache files.
+            model: Embedding model the vectors come from.
+            dtype: Storage precision, ``"float32"`` or ``"float16"``.
+        """
+        if dtype not in ("float32", "float16"):
+            raise ValueError("dtype must be 'float32' or 'float16'")
+        self.path = Path(path)
+        self.model = model
+        self.dtype = np.dtype(dtype)
+        self._lock = threading.Lock()
+        self._rows: dict[str, int] = {}
+        self._dim: int | None = None
+        self._matrix: np.memmap | None = None
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, content_hash: object) -> bool:
+        return content_hash in self._rows
+
+    def get(self, content_hash: str) -> np.ndarray | None:
+        """The cached vector for a hash, as a read-only view, or None."""
+        row = self._rows.get(content_hash)
+        if row is None or self._matrix is None:
+            return None
+        view = self._matrix[row]
+        view.flags.writeable = False
+        return view
+
+    def key(self, text: str, model: str | None = None) -> str:
+        """Cache key of ``text`` embedded by ``model`` (the cache's by default)."""
+        return compute_content_hash(f"{model or self.model}\0{text}")
+
+    def get_text(self, text: str) -> np.ndarray | None:
+        """The cached vector for a text, or None."""
+        return self.get(self.key(text))
+
+    def put_many(self, items: Iterable[tuple[str, Sequence[float]]]) -> None:
+        """Store vectors by content hash; hashes already cached are skipped."""
+        with self._lock:
+            added: list[str] = []
+            for content_hash, vector in items:
+                if content_hash in self._rows:
+                    continue
+                values = np.asarray(vector, dtype=self.dtype)
+                if self._dim is None:
+                    self._create(values.shape[0])
+                if values.shape != (self._dim,):
+                    raise ValueError(
+                        f"Expected a {self._dim}-dimensional vector, "
+                        f"got shape {values.shape}"
+                    )
+                row = len(self._rows)
+                self._reserve(row + 1)
+                assert self._matrix is not None
+                self._matrix[row] = values
+                self._rows[content_hash] = row
+                added.append(content_hash)
+            if added:
+                assert self._matrix is not None
+                self._matrix.flush()
+                with open(self.path / _INDEX_FILE, "a", encoding="utf-8") as f:
+                    f.writelines(f"{content_hash}\n" for content_hash in added)
+
+    def put(self, content_hash: str, vector: Sequence[float]) -> None:
+        """Store one vector by content hash."""
+        self.put_many([(content_hash, vector)])
+
+    def clear(self) -> None:
+        """Drop every cached vector."""
+        with self._lock:
+            self._reset()
+
+    def _load(self) -> None:
+        """Map existing files, discarding them if written for another model."""
+        meta_path = self.path / _META_FILE
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._reset()
+            return
+        if (
+            meta.get("model") != self.model
+            or meta.get("dtype") != self.dtype.name
+            or meta.get("keys") != _KEY_VERSION
+        ):
+            self._reset()
+            return
+
+        self._dim = int(meta["dim"])
+        self._matrix = np.memmap(
+            self.path / _VECTORS_FILE, dtype=self.dtype, mode="r+"
+        ).reshape(-1, self._dim)
+        index_path = self.path / _INDEX_FILE
+        if index_path.exists():
+            hashes = index_path.read_text(encoding="utf-8").split()
+            # Lines beyond the matrix would point at rows never written
+            for row, content_hash in enumerate(hashes[: len(self._matrix)]):
+                self._rows.setdefault(content_hash, row)
+
+    def _reset(self) -> None:
+        """Delete the cache files and start empty."""
+        self._matrix = None
+        self._dim = None
+        self._rows.clear()
+        for name in (_META_FILE, _VECTORS_FILE, _INDEX_FILE):
+            (self.path / name).unlink(missing_ok=True)
+
+    def _create(self, dim: int) -> None:
+        """Start the matrix for ``dim``-dimensional vectors."""
+        self._dim = dim
+        (self.path / _META_FILE).write_text(
+            json.dumps(
+                {
+                    "model": self.model,
+                    "dtype": self.dtype.name,
+                    "dim": dim,
+                    "keys": _KEY_VERSION,
+                }
+            ),
+            encoding="utf-8",
+        )
+        self._resize(_INITIAL_ROWS)
+
+    def _reserve(self, rows: int) -> None:
+        """Make sure the matrix has at least ``rows`` rows."""
+        assert self._matrix is not None
+        if rows > len(self._matrix):
+            self._resize(max(rows, 2 * len(self._matrix)))
+
+    def _resize(self, rows: int) -> None:
+        """Grow the matrix file to ``rows`` rows and remap it."""
+        assert self._dim is not None
+        if self._matrix is not None:
+            self._matrix.flush()
+        size = rows * self._dim * self.dtype.itemsize
+        with open(self.path / _VECTORS_FILE, "ab") as f:
+            f.truncate(size)
+        self._matrix = np.memmap(
+            self.path / _VECTORS_FILE, dtype=self.dtype, mode="r+"
+        ).reshape(-1, self._dim)
+
+
+class CachedEmbedder:
+    """Embedding provider that serves previously embedded texts from a cache.
+
+    Only texts missing from the cache reach the wrapped provider: single
+    texts through its ``embed``, several in one ``embed_batch`` call where it
+    supports that. Entries are keyed by the provider's ``model`` when it
+    has one, so a different model never gets another model's vectors.
+    """
+
+    def __init__(self, embedder: EmbeddingProvider, cache: EmbeddingCache) -> None:
+        self._embedder = embedder
+        self.cache = cache
+        self.model: str = getattr(embedder, "model", None) or cache.model
+
+    def embed(self, text: str) -> list[float]:
+        """Embedding for one text, from the cache when possible."""
+        key = self.cache.key(text, self.model)
+        if key not in self.cache:
+            self.cache.put(key, self._embedder.embed(text))
+        return self.cache.get(key).tolist()  # type: ignore[union-attr]
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embeddings for several texts, embedding only the cache misses."""
+        hashes = [self.cache.key(text, self.model) for text in texts]
+        missing = {h: text for h, text in zip(hashes, texts) if h not in self.cache}
+        if missing:
+            embed_batch = getattr(self._embedder, "embed_batch", None)
+            if embed_batch is None:
+                vectors = [self._embedder.embed(text) for text in missing.values()]
+            else:
+                vectors = embed_batch(list(missing.values()))
+            self.cache.put_many(zip(missing, vectors))
+        return [self.cache.get(h).tolist() for h in hashes]  # type: ignore[union-attr]
@@ -3,14 +3,20 @@
 Implements dedicated extraction logic for Wahapedia and 40k.app
 with generic fallback (FR-001), clean markdown conversion (FR-002),
 SHA-256 deduplication (FR-003), and resilient error handling (FR-007).
+Batches can be scraped concurrently through one shared crawler, with a
+global concurrency cap and per-host connection and rate limits.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import Any, Protocol
+from urllib.parse import urlsplit
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +56,90 @@ class ScrapeResult:
         return len(self.errors)
 
 
+@dataclass
+class ScrapeLimits:
+    """Parallelism and politeness limits for concurrent scraping."""
+
+    max_concurrency: int = 8  # Pages fetched at once across all hosts
+    per_host_connections: int = 2  # Pages fetched at once from one host
+    per_host_interval: float = 1.0  # Min seconds between requests to a host
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency < 1 or self.per_host_connections < 1:
+            raise ValueError("Concurrency limits must be at least 1")
+        if self.per_host_interval < 0:
+            raise ValueError("per_host_interval must not be negative")
+
+
+class Crawl4AICrawler:
+    """``CrawlerProtocol`` over one crawl4ai ``AsyncWebCrawler``.
+
+    Lets a whole batch reuse a single browser instead of starting one per
+    page. Use ``open_crawl4ai_crawler`` to create it.
+    """
+
+    def __init__(self, web_crawler: Any):
+        self._crawler = web_crawler
+
+    async def fetch_markdown(self, url: str) -> str:
+        """Fetch a URL through the shared crawler."""
+        result = await self._crawler.arun(url=url)
+        return result.markdown if hasattr(result, "markdown") else str(result)
+
+
+@asynccontextmanager
+async def open_crawl4ai_crawler() -> AsyncIterator[Crawl4AICrawler]:
+    """Start a crawl4ai browser for the duration of the block.
+
+    Raises:
+        ImportError: If crawl4ai is not installed.
+    """
+    try:
+        from crawl4ai import AsyncWebCrawler  # type: ignore[import-untyped]
+    except ImportError:
+        raise ImportError(
+            "crawl4ai is required for scraping. "
+            "Install with: pip install 'vindicta-foundation[rag]'"
+        )
+    async with AsyncWebCrawler() as web_crawler:
+        yield Crawl4AICrawler(web_crawler)
+
+
+class _HostLimiter:
+    """Global and per-host connection caps plus spacing between requests.
+
+    A slot takes the host's connection first, so pages queued for a busy
+    host don't hold global slots other hosts could use, then a global one.
+    Pacing comes last, with both held, so time spent waiting for a global
+    slot never counts towards the gap between a host's requests.
+    """
+
+    def __init__(self, limits: ScrapeLimits):
+        self._limits = limits
+        self._overall = asyncio.Semaphore(limits.max_concurrency)
+        self._connections: dict[str, asyncio.Semaphore] = {}
+        self._pacing: dict[str, asyncio.Lock] = {}
+        self._next_start: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold connection slots for ``url``, starting no sooner than allowed."""
+        host = urlsplit(url).netloc.lower()
+        if host not in self._connections:
+            self._connections[host] = asyncio.Semaphore(
+                self._limits.per_host_connections
+            )
+            self._pacing[host] = asyncio.Lock()
+        async with self._connections[host], self._overall:
+            async with self._pacing[host]:
+                loop = asyncio.get_running_loop()
+                delay = self._next_start.get(host, 0.0) - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._next_start[host] = loop.time() + self._limits.per_host_interval
+            yield
+
+
 def compute_content_hash(content: str) -> str:
     """Compute SHA-256 hash of content for deduplication (FR-003).
 
@@ -154,17 +244,10 @@ async def scrape_url(
 
     # Default: use crawl4ai
     try:
-        from crawl4ai import AsyncWebCrawler  # type: ignore[import-untyped]
-
-        async with AsyncWebCrawler() as web_crawler:
-            result = await web_crawler.arun(url=url)
-            raw_md = result.markdown if hasattr(result, "markdown") else str(result)
-            return extract_markdown_chunks(raw_md, url)
+        async with open_crawl4ai_crawler() as web_crawler:
+            return await scrape_url(url, crawler=web_crawler)
     except ImportError:
-        raise ImportError(
-            "crawl4ai is required for scraping. "
-            "Install with: pip install 'vindicta-foundation[rag]'"
-        )
+        raise
     except Exception as exc:
         logger.error(
             "Scrape failed for %s: %s",
@@ -178,6 +261,7 @@ async def scrape_url(
 async def scrape_urls(
     urls: list[str],
     crawler: CrawlerProtocol | None = None,
+    limits: ScrapeLimits | None = None,
 ) -> ScrapeResult:
     """Scrape multiple URLs with resilient error handling (FR-007).
 
@@ -186,10 +270,19 @@ async def scrape_urls(
     Args:
         urls: List of URLs to scrape.
         crawler: Optional crawler implementation.
+        limits: Scrape concurrently within these limits. Without a crawler,
+            one crawl4ai crawler is then shared by the whole batch. By
+            default pages are scraped one at a time.
 
     Returns:
         A ``ScrapeResult`` with chunks and errors.
     """
+    if limits is not None:
+        if crawler is not None:
+            return await _scrape_concurrently(urls, crawler, limits)
+        async with open_crawl4ai_crawler() as shared:
+            return await _scrape_concurrently(urls, shared, limits)
+
     result = ScrapeResult()
 
     for url in urls:
@@ -211,3 +304,41 @@ async def scrape_urls(
             )
 
     return result
+
+
+async def _scrape_concurrently(
+    urls: list[str], crawler: CrawlerProtocol, limits: ScrapeLimits
+) -> ScrapeResult:
+    """Scrape ``urls`` in parallel, keeping results in URL order.
+
+    Unlike ``scrape_url``, fetch failures are recorded in the result's
+    errors rather than only logged.
+    """
+    slots = _HostLimiter(limits)
+
+    async def scrape(url: str) -> list[ScrapedChunk]:
+        async with slots.slot(url):
+            raw_md = await crawler.fetch_markdown(url)
+        return extract_markdown_chunks(raw_md, url)
+
+    outcomes = await asyncio.gather(
+        *(scrape(url) for url in urls), return_exceptions=True
+    )
+
+    result = ScrapeResult()
+    for url, outcome in zip(urls, outcomes):
+        if isinstance(outcome, asyncio.CancelledError):
+            raise outcome
+        if isinstance(outcome, BaseException):
+            result.errors.append(
+                {
+                    "url": url,
+                    "error_type": type(outcome).__name__,
+                    "message": str(outcome),
+                }
+            )
+            logger.error("Failed to scrape %s: %s (continuing)", url, str(outcome))
+            continue
+        result.chunks.extend(outcome)
+        logger.info("Scraped %d chunks from %s", len(outcome), url)
+    return result
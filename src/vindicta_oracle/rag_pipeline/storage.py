@@ -13,8 +13,13 @@ from typing import Any, Protocol
 from vindicta_foundation.models.rag import RulesSegment
 from vindicta_foundation.rag_pipeline.scraper import ScrapedChunk
 
+from vindicta_oracle.rag_pipeline.dedup import DedupIndex
+
 logger = logging.getLogger(__name__)
 
+# Chunks embedded and upserted per round-trip by ``store_chunks``
+DEFAULT_BATCH_SIZE = 64
+
 
 class EmbeddingProvider(Protocol):
     """Protocol for embedding generation — enables testing without Ollama."""
@@ -23,6 +28,14 @@ class EmbeddingProvider(Protocol):
         """Generate an embedding vector for the given text."""
         ...
 
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embedding vectors for several texts in one request.
+
+        Optional: ``RulesStorage`` embeds one text at a time with
+        providers that don't implement it.
+        """
+        ...
+
 
 class VectorStore(Protocol):
     """Protocol for vector storage — enables testing without ChromaDB."""
@@ -49,8 +62,13 @@ class VectorStore(Protocol):
         self,
         ids: list[str] | None = None,
         where: dict[str, Any] | None = None,
+        include: list[str] | None = None,
     ) -> dict[str, Any]:
-        """Get documents by ID or filter."""
+        """Get documents by ID or filter.
+
+        ``include`` limits the returned fields (e.g. ``["metadatas"]``);
+        the store's defaults apply when it is None.
+        """
         ...
 
 
@@ -58,16 +76,43 @@ class RulesStorage:
     """Storage layer for rules segments with embedding and versioning.
 
     Uses protocol-based dependency injection so ChromaDB and Ollama
-    can be swapped with mocks for testing.
+    can be swapped with mocks for testing. With a ``DedupIndex`` (see
+    ``with_index``), hash and version lookups are answered in memory.
     """
 
     def __init__(
         self,
         store: VectorStore,
         embedder: EmbeddingProvider,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        index: DedupIndex | None = None,
     ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self._store = store
         self._embedder = embedder
+        self._batch_size = batch_size
+        self._index = index
+
+    @classmethod
+    def with_index(
+        cls,
+        store: VectorStore,
+        embedder: EmbeddingProvider,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        bloom_capacity: int | None = None,
+    ) -> RulesStorage:
+        """Create storage with a dedup index loaded from ``store``.
+
+        Args:
+            store: The vector store.
+            embedder: The embedding provider.
+            batch_size: Chunks per embed/upsert round-trip.
+            bloom_capacity: Back the index with a Bloom filter sized for
+                this many hashes (see ``DedupIndex.from_store``).
+        """
+        index = DedupIndex.from_store(store, bloom_capacity=bloom_capacity)
+        return cls(store, embedder, batch_size=batch_size, index=index)
 
     def store_chunk(self, chunk: ScrapedChunk) -> RulesSegment:
         """Store a scraped chunk with embedding, handling dedup (FR-003).
@@ -82,71 +127,90 @@ class RulesStorage:
         Returns:
             The stored ``RulesSegment``.
         """
-        # Check for existing content with same hash
-        existing = self._find_by_hash(chunk.content_hash)
-        if existing is not None:
-            logger.info(
-                "Skipping duplicate chunk (hash=%s) for %s",
-                chunk.content_hash[:12],
-                chunk.url,
-            )
-            return existing
-
-        # Check for existing content at same URL (new version)
-        version = self._get_next_version(chunk.url)
-
-        # Generate embedding
-        embedding = self._embedder.embed(chunk.content_markdown)
-
-        # Create segment model
-        segment = RulesSegment(
-            url=chunk.url,  # type: ignore[arg-type]
-            content_markdown=chunk.content_markdown,
-            content_hash=chunk.content_hash,
-            version=version,
-            embedding=embedding,
-            timestamp=datetime.now(timezone.utc),
-        )
-
-        # Upsert to vector store
-        segment_id = str(segment.id)
-        self._store.upsert(
-            ids=[segment_id],
-            documents=[chunk.content_markdown],
-            metadatas=[
-                {
-                    "url": chunk.url,
-                    "content_hash": chunk.content_hash,
-                    "version": version,
-                    "timestamp": segment.timestamp.isoformat(),
-                }
-            ],
-            embeddings=[embedding],
-        )
-
-        logger.info(
-            "Stored chunk v%d (hash=%s) from %s",
-            version,
-            chunk.content_hash[:12],
-            chunk.url,
-        )
-        return segment
+        return self._store_batch([chunk])[0]
 
     def store_chunks(self, chunks: list[ScrapedChunk]) -> list[RulesSegment]:
         """Store multiple chunks, skipping duplicates (SC-003).
 
+        Chunks are written in batches of ``batch_size``. Each batch looks
+        up existing hashes and URL versions with one query each, embeds its
+        new chunks with one ``embed_batch`` call and is flushed with a
+        single upsert. Results match storing the chunks one by one.
+
         Args:
             chunks: List of scraped chunks.
 
         Returns:
-            List of stored ``RulesSegment`` objects.
+            List of stored ``RulesSegment`` objects, one per chunk.
         """
         segments: list[RulesSegment] = []
-        for chunk in chunks:
-            segment = self.store_chunk(chunk)
-            segments.append(segment)
+        for start in range(0, len(chunks), self._batch_size):
+            segments.extend(self._store_batch(chunks[start : start + self._batch_size]))
         return segments
 
+    def _store_batch(self, chunks: list[ScrapedChunk]) -> list[RulesSegment]:
+        """Dedup, version, embed and upsert one batch of chunks."""
+        if self._index is None:
+            existing = self._find_by_hashes(list({c.content_hash for c in chunks}))
+            versions = self._get_latest_versions(list({c.url for c in chunks}))
+        else:
+            existing, versions = self._lookup_in_index(chunks)
+
+        # Later chunks of the batch see the earlier ones, as if stored in turn
+        new: dict[str, tuple[ScrapedChunk, int]] = {}
+        for chunk in chunks:
+            if chunk.content_hash in existing or chunk.content_hash in new:
+                logger.info(
+                    "Skipping duplicate chunk (hash=%s) for %s",
+                    chunk.content_hash[:12],
+                    chunk.url,
+                )
+                continue
+            versions[chunk.url] = versions.get(chunk.url, 0) + 1
+            new[chunk.content_hash] = (chunk, versions[chunk.url])
+
+        if new:
+            embeddings = self._embed_batch(
+                [chunk.content_markdown for chunk, _ in new.values()]
+            )
+            timestamp = datetime.now(timezone.utc)
+            for (chunk, version), embedding in zip(new.values(), embeddings):
+                existing[chunk.content_hash] = RulesSegment(
+                    url=chunk.url,  # type: ignore[arg-type]
+                    content_markdown=chunk.content_markdown,
+                    content_hash=chunk.content_hash,
+                    version=version,
+                    embedding=embedding,
+                    timestamp=timestamp,
+                )
+
+            stored = [existing[content_hash] for content_hash in new]
+            self._store.upsert(
+                ids=[str(segment.id) for segment in stored],
+                documents=[segment.content_markdown for segment in stored],
+                metadatas=[
+                    {
+                        "url": chunk.url,
+                        "content_hash": chunk.content_hash,
+                        "version": version,
+                        "timestamp": timestamp.isoformat(),
+                    }
+                    for chunk, version in new.values()
+                ],
+                embeddings=embeddings,
+            )
+            for chunk, version in new.values():
+                if self._index is not None:
+                    self._index.add(chunk.content_hash, chunk.url, version)
+                logger.info(
+                    "Stored chunk v%d (hash=%s) from %s",
+                    version,
+                    chunk.content_hash[:12],
+                    chunk.url,
+                )
+
+        return [existing[chunk.content_hash] for chunk in chunks]
+
     def search(
         self,
         query: str,
@@ -182,32 +246,76 @@ class RulesStorage:
             )
         return results
 
-    def _find_by_hash(self, content_hash: str) -> RulesSegment | None:
-        """Look up an existing segment by content hash."""
+    def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts in one call, if the provider supports batches."""
+        embed_batch = getattr(self._embedder, "embed_batch", None)
+        if embed_batch is None:
+            return [self._embedder.embed(text) for text in texts]
+        return embed_batch(texts)
+
+    def _lookup_in_index(
+        self, chunks: list[ScrapedChunk]
+    ) -> tuple[dict[str, RulesSegment], dict[str, int]]:
+        """Existing segments and latest URL versions for a batch, from the index.
+
+        Only possible hits of a Bloom-filter index are checked in the store.
+        """
+        assert self._index is not None
+        existing: dict[str, RulesSegment] = {}
+        unconfirmed: set[str] = set()
+        for chunk in chunks:
+            record = self._index.known(chunk.content_hash)
+            if record is not None:
+                url, version = record
+                existing[chunk.content_hash] = RulesSegment(
+                    url=url,  # type: ignore[arg-type]
+                    content_markdown=chunk.content_markdown,
+                    content_hash=chunk.content_hash,
+                    version=version,
+                )
+            elif self._index.might_contain(chunk.content_hash):
+                unconfirmed.add(chunk.content_hash)
+        if unconfirmed:
+            existing.update(self._find_by_hashes(list(unconfirmed)))
+
+        versions = {
+            chunk.url: self._index.latest_version(chunk.url)
+            for chunk in chunks
+            if self._index.latest_version(chunk.url)
+        }
+        return existing, versions
+
+    def _find_by_hashes(self, hashes: list[str]) -> dict[str, RulesSegment]:
+        """Look up existing segments for any of the given content hashes."""
+        found: dict[str, RulesSegment] = {}
         try:
-            result = self._store.get(where={"content_hash": content_hash})
+            result = self._store.get(where={"content_hash": {"$in": hashes}})
             docs: list[str] = result.get("documents", [])
-            if docs:
-                metas: list[dict[str, Any]] = result.get("metadatas", [])
-                meta = metas[0] if metas else {}
-                return RulesSegment(
-                    url=meta.get("url", "https://unknown"),
-                    content_markdown=docs[0],
-                    content_hash=content_hash,
-                    version=int(meta.get("version", 1)),
-                )
+            metas: list[dict[str, Any]] = result.get("metadatas", [])
+            for doc, meta in zip(docs, metas):
+                content_hash = meta.get("content_hash")
+                if content_hash in hashes and content_hash not in found:
+                    found[content_hash] = RulesSegment(
+                        url=meta.get("url", "https://unknown"),
+                        content_markdown=doc,
+                        content_hash=content_hash,
+                        version=int(meta.get("version", 1)),
+                    )
         except Exception:
             pass
-        return None
+        return found
 
-    def _get_next_version(self, url: str) -> int:
-        """Get the next version number for a URL."""
+    def _get_latest_versions(self, urls: list[str]) -> dict[str, int]:
+        """Get the highest stored version for each of the given URLs."""
+        latest: dict[str, int] = {}
         try:
-            result = self._store.get(where={"url": url})
+            result = self._store.get(where={"url": {"$in": urls}})
             metas: list[dict[str, Any]] = result.get("metadatas", [])
-            if metas:
-                versions = [int(m.get("version", 1)) for m in metas]
-                return max(versions) + 1
+            for meta in metas:
+                url = meta.get("url")
+                if url in urls:
+                    version = int(meta.get("version", 1))
+                    latest[url] = max(latest.get(url, 0), version)
         except Exception:
             pass
-        return 1
+        return latest
@@ -0,0 +1,62 @@
+"""Round Summarizer - Rolling LLM summary of older debate rounds.
+
+Deep debates overflow the model's context and prefill time grows with every
+round. The summarizer folds each finished round into a short per-agent
+position summary, so agent prompts can carry the summary plus the latest
+round instead of the whole debate.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from vindicta_oracle.models import role_name
+
+if TYPE_CHECKING:
+    from vindicta_oracle.models import Argument
+    from vindicta_oracle.ollama_client import OllamaClient
+
+SUMMARIZER_PROMPT = """You are the clerk of the Meta-Oracle council, a panel of five agents debating a Warhammer 40K matchup.
+
+You keep a running record of where each council member stands. Merge the latest round into the existing record.
+
+Write exactly one line per agent, in this format:
+[ROLE]: their current position and strongest supporting points, in at most two sentences.
+
+Keep specific units, rules and numbers. Note when an agent changed position. Do not add commentary of your own."""
+
+
+class RoundSummarizer:
+    """Folds finished debate rounds into a rolling position summary."""
+
+    def __init__(self, client: OllamaClient):
+        self.client = client
+
+    def summarize(
+        self,
+        previous: str | None,
+        arguments: Sequence[Argument],
+        round_num: int,
+    ) -> str:
+        """Merge round ``round_num`` into the summary of the rounds before it.
+
+        Args:
+            previous: Summary of rounds 1 to ``round_num - 1``, if any.
+            arguments: The finished round's arguments.
+            round_num: The round being merged (1-based).
+
+        Returns:
+            Summary of rounds 1 to ``round_num``.
+        """
+        latest = "\n\n".join(
+            f"[{role_name(arg.agent_role)}]: {arg.content}" for arg in arguments
+        )
+        prompt = f"""Current record of positions:
+{previous or "(empty - this is the first round)"}
+
+Round {round_num} arguments:
+{latest}
+
+Write the updated record."""
+        return self.client.generate(SUMMARIZER_PROMPT, prompt).strip()
@@ -0,0 +1,196 @@
+"""LLM Telemetry - Per-call token counts and timings from Ollama.
+
+Every Ollama chat reports how many prompt and output tokens it processed
+and how long prefill, decoding and model loading took. Code that wants
+those numbers wraps its generations in ``collect_telemetry``; the client
+picks up the active collector when a request is submitted (in the caller's
+thread or task) and records one ``CallTelemetry`` per call. Generations
+stopped early (a caller closing a stream, a timeout) never get their final
+stats; they are recorded as ``stopped`` with the elapsed time and the
+tokens received so far, tracked by ``CallProgress``.
+
+``summarize_telemetry`` rolls calls up into throughput, prefill vs decode
+time and model-load stalls per debate, agent, round and phase.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from vindicta_oracle.models import AgentRole, CallTelemetry
+
+# Loads longer than this mean the model wasn't resident when the call came in
+LOAD_STALL_MS = 500.0
+
+_recorder: ContextVar[TelemetryRecorder | None] = ContextVar(
+    "oracle_telemetry", default=None
+)
+
+
+class CallProgress:
+    """Client-side view of a call in flight, for calls that get cancelled.
+
+    Each streamed chunk counts as one token (Ollama streams about one token
+    per chunk) and prefill is taken to run until the first chunk arrives.
+    Unstreamed calls only report the elapsed time.
+    """
+
+    def __init__(self) -> None:
+        self.started: float | None = None
+        self.first_token: float | None = None
+        self.tokens = 0
+        self.finished = False
+
+    def start(self) -> None:
+        """Mark that the call got its slot and the generation began."""
+        self.started = time.monotonic()
+
+    def token(self) -> None:
+        """Count one received chunk."""
+        if self.first_token is None:
+            self.first_token = time.monotonic()
+        self.tokens += 1
+
+    def stats(self) -> dict[str, int] | None:
+        """Estimates in the shape of Ollama's stats, or None if never started."""
+        started = self.started
+        if started is None:
+            return None
+        now = time.monotonic()
+        first_token = self.first_token if self.first_token is not None else now
+
+        def ns(seconds: float) -> int:
+            return int(seconds * 1e9)
+
+        return {
+            "eval_count": self.tokens,
+            "prompt_eval_duration": ns(first_token - started),
+            "eval_duration": ns(now - first_token),
+            "total_duration": ns(now - started),
+        }
+
+
+class TelemetryRecorder:
+    """Collects the calls made inside one ``collect_telemetry`` block."""
+
+    def __init__(
+        self,
+        agent_role: AgentRole | None = None,
+        phase: str = "respond",
+        round_num: int | None = None,
+    ):
+        self.agent_role = agent_role
+        self.phase = phase
+        self.round_num = round_num
+        self.calls: list[CallTelemetry] = []
+
+    def record(
+        self,
+        model: str,
+        stats: Mapping[str, Any] | None,
+        cached: bool = False,
+        stopped: bool = False,
+    ) -> CallTelemetry:
+        """Record one call from the stats of Ollama's final response.
+
+        Stopped calls pass ``CallProgress.stats`` instead. Safe to call from the client's I/O thread: appending to the list
+        is atomic and the caller only reads it after the call completes.
+        """
+
+        def ms(field: str) -> float:
+            return (stats.get(field) or 0) / 1e6 if stats else 0.0
+
+        call = CallTelemetry(
+            agent_role=self.agent_role,
+            phase=self.phase,
+            round=self.round_num,
+            model=model,
+            cached=cached,
+            stopped=stopped,
+            prompt_tokens=(stats.get("prompt_eval_count") or 0) if stats else 0,
+            completion_tokens=(stats.get("eval_count") or 0) if stats else 0,
+            prefill_ms=ms("prompt_eval_duration"),
+            decode_ms=ms("eval_duration"),
+            load_ms=ms("load_duration"),
+            total_ms=ms("total_duration"),
+        )
+        self.calls.append(call)
+        return call
+
+
+@contextmanager
+def collect_telemetry(
+    agent_role: AgentRole | None = None,
+    phase: str = "respond",
+    round_num: int | None = None,
+) -> Iterator[list[CallTelemetry]]:
+    """Record the LLM calls made inside the block, tagged with their origin.
+
+    Yields the list the calls are appended to. Nested blocks take over
+    recording until they exit.
+    """
+    recorder = TelemetryRecorder(agent_role, phase, round_num)
+    token = _recorder.set(recorder)
+    try:
+        yield recorder.calls
+    finally:
+        _recorder.reset(token)
+
+
+def current_recorder() -> TelemetryRecorder | None:
+    """The recorder of the innermost active ``collect_telemetry`` block."""
+    return _recorder.get()
+
+
+def summarize_telemetry(calls: Sequence[CallTelemetry]) -> dict:
+    """Aggregate calls per debate, agent, round and phase.
+
+    Calls not made by a single agent (council rounds, summaries) are
+    grouped under ``"council"``; votes and summaries aren't in any round.
+    """
+    by_agent: dict[str, list[CallTelemetry]] = {}
+    by_round: dict[str, list[CallTelemetry]] = {}
+    by_phase: dict[str, list[CallTelemetry]] = {}
+    for call in calls:
+        agent = call.agent_role.value if call.agent_role else "council"
+        by_agent.setdefault(agent, []).append(call)
+        if call.round is not None and call.phase == "respond":
+            by_round.setdefault(str(call.round), []).append(call)
+        by_phase.setdefault(call.phase, []).append(call)
+
+    return {
+        "debate": _aggregate(calls),
+        "by_agent": {key: _aggregate(group) for key, group in by_agent.items()},
+        "by_round": {key: _aggregate(group) for key, group in by_round.items()},
+        "by_phase": {key: _aggregate(group) for key, group in by_phase.items()},
+    }
+
+
+def _aggregate(calls: Sequence[CallTelemetry]) -> dict:
+    """Totals and throughput for a group of calls."""
+    prompt_tokens = sum(call.prompt_tokens for call in calls)
+    completion_tokens = sum(call.completion_tokens for call in calls)
+    prefill_ms = sum(call.prefill_ms for call in calls)
+    decode_ms = sum(call.decode_ms for call in calls)
+    return {
+        "calls": len(calls),
+        "cached_calls": sum(call.cached for call in calls),
+        "stopped_calls": sum(call.stopped for call in calls),
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "prefill_ms": round(prefill_ms, 1),
+        "decode_ms": round(decode_ms, 1),
+        "load_ms": round(sum(call.load_ms for call in calls), 1),
+        "load_stalls": sum(call.load_ms > LOAD_STALL_MS for call in calls),
+        "prefill_tokens_per_sec": _rate(prompt_tokens, prefill_ms),
+        "decode_tokens_per_sec": _rate(completion_tokens, decode_ms),
+    }
+
+
+def _rate(tokens: int, ms: float) -> float | None:
+    """Tokens per second, or None when no time was measured."""
+    return round(tokens / (ms / 1000), 1) if ms > 0 else None
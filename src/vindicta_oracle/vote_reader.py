@@ -0,0 +1,124 @@
+"""Vote Reader - Incremental parsing of streamed free-text votes.
+
+A vote only needs its WINNER, PROBABILITY and a few sentences of REASONING,
+but models tend to keep writing until they hit the token cap. ``VoteReader``
+parses the response as it streams in and reports when every field is
+present and the reasoning has reached its limit, so the caller can stop the
+generation there instead of decoding the rest.
+
+``read_vote_fields`` reads the WINNER and PROBABILITY fields of a finished
+free-text vote, so that a side mentioned in the reasoning can't be taken
+for the prediction.
+"""
+
+from __future__ import annotations
+
+import re
+
+from pydantic import BaseModel, Field, model_validator
+
+_WINNER = re.compile(r"^\W*WINNER\b[^\n]*\n", re.IGNORECASE | re.MULTILINE)
+_PROBABILITY = re.compile(
+    r"^\W*PROBABILITY\b[^\n]*?\d+\s*%", re.IGNORECASE | re.MULTILINE
+)
+_REASONING = re.compile(r"^\W*REASONING\W*", re.IGNORECASE | re.MULTILINE)
+# A sentence only counts once the whitespace after it arrives ("3.5" isn't one)
+_SENTENCE_END = re.compile(r"[.!?](?=\s)")
+
+_WINNER_FIELD = re.compile(
+    r"^\W*WINNER\W*(?P<value>[^\n]*)", re.IGNORECASE | re.MULTILINE
+)
+_PROBABILITY_FIELD = re.compile(
+    r"^\W*PROBABILITY\W*(?P<value>[^\n]*)", re.IGNORECASE | re.MULTILINE
+)
+_SIDE = re.compile(r"player\s*(?P<player>[12])|\bdraw\b", re.IGNORECASE)
+_NUMBER = re.compile(r"(?P<number>\d+(?:\.\d+)?)\s*(?P<percent>%?)")
+
+
+def read_vote_fields(text: str) -> tuple[str | None, float | None]:
+    """The prediction and win probability stated in a vote's fields.
+
+    Only the first WINNER and PROBABILITY lines are read. Either value is
+    None when its field is missing or unreadable.
+    """
+    prediction = None
+    winner = _WINNER_FIELD.search(text)
+    side = _SIDE.search(winner["value"]) if winner else None
+    if side is not None:
+        player = side["player"]
+        prediction = f"Player {player} wins" if player else "Draw"
+
+    probability = None
+    field = _PROBABILITY_FIELD.search(text)
+    number = _NUMBER.search(field["value"]) if field else None
+    if number is not None:
+        value = float(number["number"])
+        # "0.65" without a percent sign is already a fraction
+        if number["percent"] or value > 1:
+            value /= 100
+        probability = max(0.0, min(1.0, value))
+    return prediction, probability
+
+
+class VoteLimits(BaseModel):
+    """How much reasoning a vote may contain before it is cut off."""
+
+    max_sentences: int | None = Field(default=3, ge=1)
+    max_chars: int | None = Field(default=600, ge=1)
+
+    @model_validator(mode="after")
+    def _has_limit(self) -> VoteLimits:
+        if self.max_sentences is None and self.max_chars is None:
+            raise ValueError("set max_sentences, max_chars or both")
+        return self
+
+
+class VoteReader:
+    """Accumulates a streamed vote and reports when it is complete."""
+
+    def __init__(self, limits: VoteLimits | None = None):
+        self.limits = limits or VoteLimits()
+        self._chunks: list[str] = []
+        self._end: int | None = None
+
+    @property
+    def complete(self) -> bool:
+        """Whether every field is in and the reasoning has hit its limit."""
+        return self._end is not None
+
+    @property
+    def text(self) -> str:
+        """The response so far, with the reasoning cut at its limit."""
+        text = "".join(self._chunks)
+        return text if self._end is None else text[: self._end]
+
+    def feed(self, chunk: str) -> bool:
+        """Add a streamed chunk; returns True once the vote is complete."""
+        self._chunks.append(chunk)
+        if self._end is None:
+            self._end = self._reasoning_end("".join(self._chunks))
+        return self.complete
+
+    def _reasoning_end(self, text: str) -> int | None:
+        """Offset where the reasoning reaches its limit, once all fields are in."""
+        reasoning = _REASONING.search(text)
+        winner = _WINNER.search(text)
+        if (
+            reasoning is None
+            or winner is None
+            # The WINNER line must name a side, as ``read_vote_fields`` reads it
+            or _SIDE.search(winner.group()) is None
+            or _PROBABILITY.search(text) is None
+        ):
+            return None
+
+        start = reasoning.end()
+        ends = []
+        max_chars = self.limits.max_chars
+        if max_chars is not None and len(text) - start >= max_chars:
+            ends.append(start + max_chars)
+        if self.limits.max_sentences is not None:
+            sentences = list(_SENTENCE_END.finditer(text, start))
+            if len(sentences) >= self.limits.max_sentences:
+                ends.append(sentences[self.limits.max_sentences - 1].end())
+        return min(ends) if ends else None
@@ -0,0 +1,96 @@
+"""Shared test doubles."""
+
+import time
+from uuid import uuid4
+
+import pytest
+
+from vindicta_oracle.engine import DebateCancelledError
+from vindicta_oracle.models import (
+    AgentRole,
+    DebateContext,
+    DebateEvent,
+    DebateEventType,
+    DebateTranscript,
+    Vote,
+)
+
+
+class FakeDebateEngine:
+    """Debate engine returning a fixed "Player 1 wins" transcript."""
+
+    def __init__(self, release=None, events=False, error=None):
+        """Configure the fake.
+
+        Args:
+            release: Block each session until this event is set (or the
+                session is cancelled), holding the worker thread like a real
+                debate.
+            events: Report an argument and a vote (and a token when
+                streaming) as progress.
+            error: Raise this instead of debating.
+        """
+        self.release = release
+        self.events = events
+        self.error = error
+        self.sessions = 0
+        self.cancelled = 0
+
+    def run_grading_session(
+        self, army_list, on_event=None, stream_tokens=False, cancel=None
+    ):
+        self.sessions += 1
+        if self.error is not None:
+            raise self.error
+        context = DebateContext(
+            player1_faction=army_list.faction,
+            player1_list="mock",
+            player2_faction="mock",
+            player2_list="mock",
+        )
+        transcript = DebateTranscript(id=uuid4(), context=context)
+        transcript.consensus = "Player 1 wins"
+        transcript.consensus_confidence = 0.8
+        transcript.rounds = [[], [], []]
+        transcript.votes = [
+            Vote(
+                agent_role=AgentRole.HOME,
+                prediction="Player 1 wins",
+                win_probability=0.8,
+                confidence=0.9,
+                reasoning="Good list",
+            ),
+            Vote(
+                agent_role=AgentRole.ARBITER,
+                prediction="Player 1 wins",
+                win_probability=0.8,
+                confidence=0.8,
+                reasoning="Strong units",
+            ),
+        ]
+        if self.events and on_event is not None:
+            if stream_tokens:
+                on_event(
+                    DebateEvent(
+                        type=DebateEventType.TOKEN,
+                        debate_id=transcript.id,
+                        data={"text": "Good"},
+                    )
+                )
+            for event_type in (DebateEventType.ARGUMENT, DebateEventType.VOTE):
+                on_event(DebateEvent(type=event_type, debate_id=transcript.id, data={}))
+        if self.release is not None:
+            deadline = time.monotonic() + 5
+            while not self.release.wait(timeout=0.01):
+                if cancel is not None and cancel.is_set():
+                    self.cancelled += 1
+                    raise DebateCancelledError("cancelled")
+                if time.monotonic() > deadline:
+                    break
+        return transcript
+
+
+@pytest.fixture
+def fake_engine():
+    """Factory for ``FakeDebateEngine`` instances."""
+    return FakeDebateEngine
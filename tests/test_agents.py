@@ -19,12 +19,20 @@ from vindicta_oracle.models import (
     DebateContext,
     DebateTranscript,
     Vote,
+    VoteBallot,
+)
+from vindicta_oracle.agents.base import (
+    DEFAULT_STOP_SEQUENCES,
+    SHARED_SYSTEM_PROMPT,
+    VOTE_MAX_TOKENS,
+    PromptLayout,
 )
 from vindicta_oracle.agents.home import HomeAgent
 from vindicta_oracle.agents.adversary import AdversaryAgent
 from vindicta_oracle.agents.arbiter import ArbiterAgent
 from vindicta_oracle.agents.rule_sage import RuleSageAgent
 from vindicta_oracle.agents.chaos import ChaosAgent
+from vindicta_oracle.vote_reader import VoteLimits
 
 
 # =============================================================================
@@ -226,6 +234,18 @@ class TestRespondMethod:
             "opening the debate" in prompt.lower() or "no arguments" in prompt.lower()
         )
 
+    def test_respond_streams_tokens(self, mock_client, sample_transcript):
+        """respond() forwards streamed chunks and joins them into the argument."""
+        mock_client.stream = MagicMock(return_value=iter(["Orks ", "will ", "win"]))
+        agent = AdversaryAgent(mock_client)
+        tokens = []
+
+        result = agent.respond(sample_transcript, round_num=2, on_token=tokens.append)
+
+        assert tokens == ["Orks ", "will ", "win"]
+        assert result.content == "Orks will win"
+        mock_client.generate.assert_not_called()
+
 
 # =============================================================================
 # Vote Method Tests
@@ -292,6 +312,17 @@ REASONING: Evenly matched.
         assert isinstance(result, Vote)
         assert result.win_probability == 0.60
 
+    def test_vote_reads_fields_not_reasoning(self, mock_client, sample_transcript):
+        """Only the WINNER and PROBABILITY fields decide the vote."""
+        mock_client.generate.return_value = (
+            "WINNER: Draw\nPROBABILITY: 0.4\n"
+            "REASONING: Player 2 scores early, 90% of the time."
+        )
+        result = HomeAgent(mock_client).vote(sample_transcript)
+
+        assert result.prediction == "Draw"
+        assert result.win_probability == 0.4
+
     def test_vote_clamps_probability(self, mock_client, sample_transcript):
         """vote() should clamp probability to 0.0-1.0 range."""
         mock_client.generate.return_value = "WINNER: Player 1\nPROBABILITY: 150%"
@@ -375,3 +406,287 @@ class TestAgentInteraction:
             result = agent.vote(sample_transcript)
             assert isinstance(result, Vote)
             assert result.agent_role == agent.role
+
+
+# =============================================================================
+# Prompt Layout Tests
+# =============================================================================
+
+
+class TestSharedPrefixLayout:
+    """Test the KV-cache friendly prompt layout."""
+
+    @pytest.fixture
+    def shared_agents(self, all_agents):
+        """All agents switched to the shared-prefix layout."""
+        for agent in all_agents:
+            agent.layout = PromptLayout.SHARED_PREFIX
+        return all_agents
+
+    @staticmethod
+    def _prefix(prompt: str) -> str:
+        """Everything before the agent-specific tail."""
+        return prompt.split("YOUR ROLE:")[0]
+
+    def test_agents_share_system_prompt_and_prefix(
+        self, shared_agents, mock_client, sample_transcript
+    ):
+        """Every agent's request starts with identical text."""
+        for agent in shared_agents:
+            agent.respond(sample_transcript, round_num=2)
+
+        calls = mock_client.generate.call_args_list
+        assert {c[0][0] for c in calls} == {SHARED_SYSTEM_PROMPT}
+        assert len({self._prefix(c[0][1]) for c in calls}) == 1
+        prefix = self._prefix(calls[0][0][1])
+        assert "Redemptor Dreadnought" in prefix
+        assert "Space Marines have superior firepower." in prefix
+
+    def test_role_and_task_at_tail(self, shared_agents, mock_client, sample_transcript):
+        """The agent's own instructions follow the shared prefix."""
+        agent = shared_agents[0]
+        agent.respond(sample_transcript, round_num=2)
+
+        prompt = mock_client.generate.call_args[0][1]
+        tail = prompt.split("YOUR ROLE:")[1]
+        assert agent.system_prompt in tail
+        assert "Round 2 of the council debate" in tail
+
+    def test_vote_uses_same_prefix(self, shared_agents, mock_client, sample_transcript):
+        """Votes reuse the prefix and still ask for the vote format."""
+        mock_client.generate.return_value = "WINNER: Player 2\nPROBABILITY: 60%"
+        agent = shared_agents[0]
+        agent.respond(sample_transcript, round_num=2)
+        vote = agent.vote(sample_transcript)
+
+        respond_prompt, vote_prompt = (
+            c[0][1] for c in mock_client.generate.call_args_list
+        )
+        assert self._prefix(respond_prompt) == self._prefix(vote_prompt)
+        assert "WINNER:" in vote_prompt.split("YOUR ROLE:")[1]
+        assert vote.prediction == "Player 2 wins"
+
+
+class TestStanceExtraction:
+    """Test reading interim stances off arguments."""
+
+    @pytest.mark.parametrize(
+        "line, stance, confidence",
+        [
+            ("STANCE: Player 1 80%", "Player 1 wins", 0.8),
+            ("**Stance:** Player 2 65%.", "Player 2 wins", 0.65),
+            ("STANCE: [Player 1] [70]%", "Player 1 wins", 0.7),
+            ("STANCE: Draw", "Draw", 0.5),
+        ],
+    )
+    def test_stance_line_is_parsed_and_stripped(
+        self, mock_client, sample_transcript, line, stance, confidence
+    ):
+        """The stance moves from the content into the argument's fields."""
+        mock_client.generate.return_value = f"Bolters win the day.\n{line}"
+        agent = HomeAgent(mock_client)
+        agent.report_stance = True
+
+        argument = agent.respond(sample_transcript, round_num=2)
+
+        assert "STANCE:" in mock_client.generate.call_args[0][1]
+        assert argument.stance == stance
+        assert argument.confidence == confidence
+        assert argument.content == "Bolters win the day."
+
+    def test_missing_stance_leaves_argument_unchanged(
+        self, mock_client, sample_transcript
+    ):
+        """Arguments without a stance line keep their content."""
+        agent = HomeAgent(mock_client)
+        agent.report_stance = True
+
+        argument = agent.respond(sample_transcript, round_num=2)
+
+        assert argument.stance is None
+        assert argument.content == "Test response"
+
+
+class TestRespondAndVote:
+    """Test the final-round turn with a fused vote."""
+
+    def test_trailer_becomes_vote(self, mock_client, sample_transcript):
+        """The vote trailer is split off the argument and parsed."""
+        mock_client.generate.return_value = (
+            "Hold the line.\nVOTE:\nWINNER: Player 2\nPROBABILITY: 60%\n"
+            "REASONING: Numbers."
+        )
+        agent = ArbiterAgent(mock_client)
+
+        argument, vote = agent.respond_and_vote(sample_transcript, round_num=2)
+
+        assert "VOTE:" in mock_client.generate.call_args[0][1]
+        assert argument.content == "Hold the line."
+        assert vote.prediction == "Player 2 wins"
+        assert vote.win_probability == 0.6
+        assert vote.agent_role == AgentRole.ARBITER
+
+    def test_winner_line_without_marker(self, mock_client, sample_transcript):
+        """A trailer that skips the VOTE: marker still parses."""
+        mock_client.generate.return_value = "Hold.\nWINNER: Draw\nPROBABILITY: 50%"
+
+        argument, vote = HomeAgent(mock_client).respond_and_vote(
+            sample_transcript, round_num=2
+        )
+
+        assert argument.content == "Hold."
+        assert vote.prediction == "Draw"
+
+    def test_winner_field_beats_sides_in_reasoning(
+        self, mock_client, sample_transcript
+    ):
+        """Player 2 named in the reasoning doesn't override WINNER."""
+        mock_client.generate.return_value = (
+            "Hold.\nVOTE:\nWINNER: Player 1\nPROBABILITY: 65%\n"
+            "REASONING: Player 2 lacks anti-tank, a draw is unlikely."
+        )
+
+        _, vote = HomeAgent(mock_client).respond_and_vote(
+            sample_transcript, round_num=2
+        )
+
+        assert vote.prediction == "Player 1 wins"
+        assert vote.win_probability == 0.65
+
+    def test_missing_trailer_returns_no_vote(self, mock_client, sample_transcript):
+        """Without a trailer the caller has to ask for the vote."""
+        argument, vote = HomeAgent(mock_client).respond_and_vote(
+            sample_transcript, round_num=2
+        )
+
+        assert argument.content == "Test response"
+        assert vote is None
+
+
+class TestStructuredVote:
+    """Test schema-constrained JSON votes."""
+
+    @pytest.fixture
+    def agent(self, mock_client):
+        """A rule sage requesting structured votes."""
+        agent = RuleSageAgent(mock_client)
+        agent.structured_votes = True
+        return agent
+
+    def test_valid_json_becomes_vote(self, agent, mock_client, sample_transcript):
+        """A schema-valid ballot maps straight onto the Vote."""
+        mock_client.generate.return_value = (
+            '{"prediction": "Player 2 wins", "win_probability": 0.62,'
+            ' "reasoning": "Tide of Boyz."}'
+        )
+
+        vote = agent.vote(sample_transcript)
+
+        assert vote.prediction == "Player 2 wins"
+        assert vote.win_probability == 0.62
+        assert vote.reasoning == "Tide of Boyz."
+        kwargs = mock_client.generate.call_args[1]
+        assert kwargs["format"] == VoteBallot.model_json_schema()
+        assert kwargs["max_tokens"] == VOTE_MAX_TOKENS
+
+    def test_invalid_output_is_retried(self, agent, mock_client, sample_transcript):
+        """An invalid ballot is retried with the validation error."""
+        mock_client.generate.side_effect = [
+            '{"prediction": "Player 3 wins", "win_probability": 2}',
+            '{"prediction": "Draw", "win_probability": 0.4, "reasoning": "Even."}',
+        ]
+
+        vote = agent.vote(sample_transcript)
+
+        assert vote.prediction == "Draw"
+        retry_prompt = mock_client.generate.call_args_list[1][0][1]
+        assert "Your previous answer was invalid" in retry_prompt
+
+    def test_falls_back_to_text_parser(self, agent, mock_client, sample_transcript):
+        """After the retry budget, the free-text parser is used."""
+        mock_client.generate.return_value = "WINNER: Player 2\nPROBABILITY: 80%"
+
+        vote = agent.vote(sample_transcript)
+
+        assert mock_client.generate.call_count == agent.vote_retries + 1
+        assert vote.prediction == "Player 2 wins"
+        assert vote.win_probability == 0.8
+
+
+class TestVoteLimits:
+    """Test stopping votes early and per-phase stop sequences."""
+
+    def test_vote_stops_once_reasoning_is_complete(
+        self, mock_client, sample_transcript
+    ):
+        """The vote stream is closed as soon as the reasoning hits its limit."""
+        produced = []
+
+        def stream(system_prompt, user_prompt, **kwargs):
+            for chunk in [
+                "WINNER: Player 2\n",
+                "PROBABILITY: 70%\n",
+                "REASONING: Too many Boyz. ",
+                "The Captain can't hold. ",
+                "Also, the mission favours Orks...",
+            ]:
+                produced.append(chunk)
+                yield chunk
+
+        mock_client.stream = stream
+        agent = HomeAgent(mock_client)
+        agent.vote_limits = VoteLimits(max_sentences=1)
+
+        vote = agent.vote(sample_transcript)
+
+        assert len(produced) == 3
+        assert vote.prediction == "Player 2 wins"
+        assert vote.win_probability == 0.7
+        assert vote.reasoning.endswith("REASONING: Too many Boyz.")
+        mock_client.generate.assert_not_called()
+
+    def test_streamed_vote_uses_winner_field(self, mock_client, sample_transcript):
+        """The side in the WINNER line wins over sides named in the reasoning."""
+        mock_client.stream = lambda system_prompt, user_prompt, **kwargs: iter(
+            [
+                "WINNER: Player 1\nPROBABILITY: 65%\n",
+                "REASONING: Player 2 lacks anti-tank. ",
+                "More text.",
+            ]
+        )
+        agent = HomeAgent(mock_client)
+        agent.vote_limits = VoteLimits(max_sentences=1)
+
+        vote = agent.vote(sample_transcript)
+
+        assert vote.prediction == "Player 1 wins"
+        assert vote.win_probability == 0.65
+
+    def test_structured_vote_caps_reasoning_length(
+        self, mock_client, sample_transcript
+    ):
+        """JSON votes carry the character limit in their schema."""
+        mock_client.generate.return_value = (
+            '{"prediction": "Draw", "win_probability": 0.5, "reasoning": "Even."}'
+        )
+        agent = HomeAgent(mock_client)
+        agent.structured_votes = True
+        agent.vote_limits = VoteLimits(max_chars=200)
+
+        agent.vote(sample_transcript)
+
+        schema = mock_client.generate.call_args[1]["format"]
+        assert schema["properties"]["reasoning"]["maxLength"] == 200
+
+    def test_stop_sequences_per_phase(self, mock_client, sample_transcript):
+        """Each phase sends its own stop sequences."""
+        mock_client.generate.return_value = "WINNER: Player 1\nPROBABILITY: 60%"
+        agent = HomeAgent(mock_client)
+        agent.stop_sequences = {"respond": DEFAULT_STOP_SEQUENCES["respond"]}
+
+        agent.respond(sample_transcript, 2)
+        agent.vote(sample_transcript)
+
+        respond_call, vote_call = mock_client.generate.call_args_list
+        assert "\n[ADVERSARY]:" in respond_call[1]["stop"]
+        assert "stop" not in vote_call[1]
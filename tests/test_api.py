@@ -1,13 +1,29 @@
 """Integration tests for the Meta-Oracle API."""
 
-from fastapi.testclient import TestClient
+import time
 from unittest.mock import patch
 
-from vindicta_oracle.api import app
+import pytest
+from fastapi.testclient import TestClient
+
+from vindicta_oracle.api import app, get_grader
+from vindicta_oracle.executor import GradingExecutor
+from vindicta_oracle.grader import ListGrader
+from vindicta_oracle.models import GradeRequest, RoutingTable
+from vindicta_oracle.ollama_client import OllamaConfig
+from vindicta_oracle.pool import EnginePool, load_routing_profiles
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Keep state the app persists out of the working directory."""
+    monkeypatch.setenv("ORACLE_DATA_DIR", str(tmp_path))
+    monkeypatch.delenv("ORACLE_JOBS_PATH", raising=False)
+    return tmp_path
+
+
 def test_health_endpoint():
     """Test the health check endpoint."""
     response = client.get("/api/v1/health")
@@ -58,3 +74,218 @@ def test_grade_endpoint_invalid_payload():
     response = client.post("/api/v1/grade", json=payload)
     # Since we added a field_validator that raises ValueError, this becomes 422
     assert response.status_code == 422
+
+
+def test_queue_endpoint():
+    """Test the grading queue depth endpoint."""
+    response = client.get("/api/v1/queue")
+    assert response.status_code == 200
+    assert {"running", "queued", "max_workers", "max_queue"} <= set(response.json())
+
+
+@patch("vindicta_oracle.ollama_client.AsyncOllamaClient.warm_up")
+def test_ready_after_warm_up(mock_warm_up):
+    """The readiness probe passes once the lifespan warm-up succeeds."""
+    with TestClient(app) as warm_client:
+        response = warm_client.get("/api/v1/ready")
+
+    assert mock_warm_up.await_count == 1
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+
+@patch("vindicta_oracle.ollama_client.AsyncOllamaClient.warm_up")
+def test_not_ready_when_model_unavailable(mock_warm_up):
+    """The readiness probe fails while Ollama cannot load the model."""
+    mock_warm_up.side_effect = ConnectionError("Ollama down")
+
+    with TestClient(app) as cold_client:
+        response = cold_client.get("/api/v1/ready")
+
+    assert response.status_code == 503
+    assert response.json()["status"] == "unavailable"
+    assert client.get("/api/v1/health").status_code == 200
+
+
+@patch("vindicta_oracle.pool.WARM_UP_RETRY_DELAY", 0.01)
+@patch("vindicta_oracle.ollama_client.AsyncOllamaClient.warm_up")
+def test_ready_once_ollama_comes_up(mock_warm_up):
+    """A failed startup warm-up is retried until the model loads."""
+    mock_warm_up.side_effect = [ConnectionError("Ollama down"), None]
+
+    with TestClient(app) as late_client:
+        for _ in range(100):
+            response = late_client.get("/api/v1/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.01)
+
+    assert response.status_code == 200
+    assert mock_warm_up.await_count == 2
+
+
+def test_graders_are_reused_across_requests():
+    """The pool hands out the same warm grader for the same config."""
+    pool = EnginePool()
+
+    assert pool.grader() is pool.grader()
+    assert pool.grader(OllamaConfig(model="mistral")) is not pool.grader()
+
+
+def test_pool_routes_requests_to_matching_grader():
+    """Requests naming a routing profile get its grader with routed agents."""
+    pool = EnginePool(
+        routing_profiles={
+            "fast-chaos": RoutingTable({"chaos.*": {"model": "llama3.2:1b"}})
+        }
+    )
+    payload = {
+        "army_list": {
+            "faction": "Orks",
+            "units": [{"name": "Warboss", "points": 80}],
+        }
+    }
+    routed = GradeRequest.model_validate({**payload, "routing_profile": "fast-chaos"})
+
+    assert pool.grader_for(GradeRequest.model_validate(payload)) is pool.grader()
+    grader = pool.grader_for(routed)
+    assert grader is not pool.grader()
+    assert grader is pool.grader_for(routed)
+    models = {
+        agent.role.value: agent.client.config.model for agent in grader.engine.agents
+    }
+    assert models["chaos"] == "llama3.2:1b"
+    assert models["home"] == "llama3.2"
+
+
+def test_pool_keeps_a_bounded_number_of_graders():
+    """Least recently used graders are dropped; the default one is kept."""
+    pool = EnginePool(max_graders=2)
+    default = pool.grader()
+
+    for model in ("a", "b", "c"):
+        pool.grader(OllamaConfig(model=model))
+
+    assert pool.status()["engines"] == 2
+    assert pool.grader() is default
+
+
+def test_load_routing_profiles(tmp_path):
+    """Profiles are read inline or from a file and validated."""
+    path = tmp_path / "profiles.json"
+    path.write_text('{"cheap": {"*.vote": {"max_tokens": 64}}}')
+
+    profiles = load_routing_profiles(str(path))
+
+    assert profiles["cheap"].route(None, "vote").max_tokens == 64
+    with pytest.raises(ValueError):
+        load_routing_profiles('{"bad": {"wizard.respond": {}}}')
+
+
+def test_grade_rejects_unknown_routing_profile():
+    """Requests can only pick profiles the server defines."""
+    payload = {
+        "army_list": {
+            "faction": "Orks",
+            "units": [{"name": "Warboss", "points": 80}],
+        },
+        "routing_profile": "anything-goes",
+    }
+
+    response = client.post("/api/v1/grade", json=payload)
+
+    assert response.status_code == 422
+    assert "anything-goes" in response.json()["detail"]
+
+
+def test_grade_rejects_client_routing_tables():
+    """Raw routing tables in the request are not accepted."""
+    payload = {
+        "army_list": {
+            "faction": "Orks",
+            "units": [{"name": "Warboss", "points": 80}],
+        },
+        "routing": {"*.*": {"model": "huge", "max_tokens": 1_000_000}},
+    }
+    pool = EnginePool()
+
+    assert pool.grader_for(GradeRequest.model_validate(payload)) is pool.grader()
+
+
+@patch("vindicta_oracle.ollama_client.AsyncOllamaClient.warm_up")
+def test_grade_job_lifecycle(mock_warm_up, fake_engine):
+    """A job is accepted immediately, then streams progress and its result."""
+    app.dependency_overrides[get_grader] = lambda: ListGrader(
+        engine=fake_engine(events=True), executor=GradingExecutor(max_workers=1)
+    )
+    payload = {
+        "army_list": {
+            "faction": "Space Marines",
+            "units": [{"name": "Captain", "points": 100}],
+        }
+    }
+    try:
+        with TestClient(app) as jobs_client:
+            submitted = jobs_client.post("/api/v1/grade/jobs", json=payload)
+            assert submitted.status_code == 202
+            job_id = submitted.json()["id"]
+
+            stream = jobs_client.get(f"/api/v1/grade/jobs/{job_id}/events")
+            status = jobs_client.get(f"/api/v1/grade/jobs/{job_id}")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert stream.headers["content-type"].startswith("text/event-stream")
+    event_names = [
+        line.removeprefix("event: ")
+        for line in stream.text.splitlines()
+        if line.startswith("event: ")
+    ]
+    assert event_names == ["argument", "vote", "succeeded"]
+    assert status.json()["status"] == "succeeded"
+    assert status.json()["result"]["grade"] in ["A", "B", "C", "D", "F"]
+
+
+@patch("vindicta_oracle.ollama_client.AsyncOllamaClient.warm_up")
+def test_jobs_are_stored_in_the_data_dir(mock_warm_up, data_dir):
+    """Without ORACLE_JOBS_PATH, jobs go to a file that survives restarts."""
+    payload = {
+        "army_list": {"faction": "Orks", "units": [{"name": "Boyz", "points": 85}]}
+    }
+    with TestClient(app) as jobs_client:
+        job_id = jobs_client.post("/api/v1/grade/jobs", json=payload).json()["id"]
+
+    assert (data_dir / "jobs.db").exists()
+    with TestClient(app) as restarted:
+        assert restarted.get(f"/api/v1/grade/jobs/{job_id}").status_code == 200
+
+
+def test_unknown_job_is_404():
+    """Unknown job ids are reported as not found."""
+    response = client.get("/api/v1/grade/jobs/00000000-0000-0000-0000-000000000000")
+    assert response.status_code == 404
+
+
+def test_grade_stream_forwards_tokens(fake_engine):
+    """The streaming endpoint forwards tokens, progress and the result."""
+    app.dependency_overrides[get_grader] = lambda: ListGrader(
+        engine=fake_engine(events=True), executor=GradingExecutor(max_workers=1)
+    )
+    payload = {
+        "army_list": {
+            "faction": "Space Marines",
+            "units": [{"name": "Captain", "points": 100}],
+        }
+    }
+    try:
+        response = client.post("/api/v1/grade/stream", json=payload)
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    event_names = [
+        line.removeprefix("event: ")
+        for line in response.text.splitlines()
+        if line.startswith("event: ")
+    ]
+    assert event_names == ["token", "argument", "vote", "result"]
@@ -0,0 +1,133 @@
+"""Unit tests for the LLM response cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from vindicta_oracle import ollama_client
+from vindicta_oracle.cache import ResponseCache
+from vindicta_oracle.ollama_client import OllamaClient, OllamaConfig
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path for the persistent cache tier."""
+    return tmp_path / "cache" / "responses.sqlite"
+
+
+class TestCacheKey:
+    """Tests for content-addressed keys."""
+
+    def test_key_is_stable(self):
+        """The same config and prompts always hash to the same key."""
+        config = OllamaConfig(seed=7)
+        assert ResponseCache.make_key(config, "sys", "user") == (
+            ResponseCache.make_key(OllamaConfig(seed=7), "sys", "user")
+        )
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            OllamaConfig(model="mistral"),
+            OllamaConfig(temperature=0.1),
+            OllamaConfig(seed=1),
+            OllamaConfig(max_tokens=64),
+        ],
+    )
+    def test_key_covers_generation_settings(self, config):
+        """Changing any generation setting changes the key."""
+        base = ResponseCache.make_key(OllamaConfig(), "sys", "user")
+        assert ResponseCache.make_key(config, "sys", "user") != base
+
+    def test_key_covers_per_call_overrides(self):
+        """Output format, token and stop overrides change the key."""
+        config = OllamaConfig()
+        base = ResponseCache.make_key(config, "sys", "user")
+        keys = {
+            base,
+            ResponseCache.make_key(config, "sys", "user", format="json"),
+            ResponseCache.make_key(config, "sys", "user", max_tokens=2048),
+            ResponseCache.make_key(config, "sys", "user", stop=["\n[HOME]:"]),
+        }
+        assert len(keys) == 4
+
+    def test_key_ignores_connection_settings(self):
+        """Host and parallelism don't affect the generated text."""
+        base = ResponseCache.make_key(OllamaConfig(), "sys", "user")
+        other = OllamaConfig(host="http://gpu-2:11434", num_parallel=8)
+        assert ResponseCache.make_key(other, "sys", "user") == base
+
+
+class TestResponseCache:
+    """Tests for the two cache tiers."""
+
+    def test_memory_hit_and_miss_counters(self):
+        """Hits and misses are counted."""
+        cache = ResponseCache()
+        assert cache.get("k") is None
+        cache.put("k", "v")
+        assert cache.get("k") == "v"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["disk_entries"] == 0
+
+    def test_memory_lru_evicts_least_recent(self):
+        """The memory tier keeps only the most recently used entries."""
+        cache = ResponseCache(max_memory_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.stats()["evictions"] == 1
+
+    def test_disk_tier_survives_restart(self, db_path):
+        """Entries written to disk are served by a new cache instance."""
+        cache = ResponseCache(path=db_path)
+        cache.put("k", "v")
+        cache.close()
+
+        reopened = ResponseCache(path=db_path)
+        assert reopened.get("k") == "v"
+        assert reopened.stats()["disk_hits"] == 1
+
+    def test_expired_entries_are_misses(self, db_path):
+        """Entries older than the TTL are dropped from both tiers."""
+        cache = ResponseCache(path=db_path, ttl_seconds=60)
+        with patch("vindicta_oracle.cache.time.time", return_value=1000.0):
+            cache.put("k", "v")
+        with patch("vindicta_oracle.cache.time.time", return_value=1061.0):
+            assert cache.get("k") is None
+        assert cache.stats()["disk_entries"] == 0
+
+    def test_disk_tier_evicts_to_byte_budget(self, db_path):
+        """The disk tier drops least recently used rows past max_disk_bytes."""
+        cache = ResponseCache(path=db_path, max_memory_entries=1, max_disk_bytes=10)
+        cache.put("a", "12345")
+        cache.put("b", "12345")
+        cache.put("c", "12345")
+
+        assert cache.stats()["disk_entries"] == 2
+        assert cache.get("a") is None
+        assert cache.get("b") == "12345"
+
+
+def test_client_serves_repeated_prompts_from_cache():
+    """A cached prompt is answered without another model call."""
+    cache = ResponseCache()
+    client = OllamaClient(OllamaConfig(), cache=cache)
+    fake_client = MagicMock()
+    fake_client.chat = AsyncMock(return_value={"message": {"content": "fresh"}})
+
+    with patch.object(
+        ollama_client._ConnectionPool, "client", return_value=fake_client
+    ):
+        assert client.generate("sys", "user") == "fresh"
+        assert client.generate("sys", "user") == "fresh"
+
+    assert fake_client.chat.await_count == 1
+    assert cache.stats()["hits"] == 1
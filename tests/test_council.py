@@ -0,0 +1,144 @@
+"""Unit tests for single-request council mode."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from vindicta_oracle.agents import (
+    AdversaryAgent,
+    ArbiterAgent,
+    ChaosAgent,
+    HomeAgent,
+    RuleSageAgent,
+)
+from vindicta_oracle.council import CouncilWriter
+from vindicta_oracle.engine import DebateEngine
+from vindicta_oracle.events import NullSink
+from vindicta_oracle.models import DebateContext, DebateTranscript
+
+VOTE_RESPONSE = "WINNER: Player 1\nPROBABILITY: 65%\nREASONING: Bolters."
+ROLES = ["home", "adversary", "arbiter", "rule_sage", "chaos"]
+
+
+@pytest.fixture
+def transcript():
+    """An empty transcript for a sample matchup."""
+    return DebateTranscript(
+        context=DebateContext(
+            player1_faction="Space Marines",
+            player1_list="Captain, 5x Intercessors",
+            player2_faction="Orks",
+            player2_list="Warboss, 20x Boyz",
+        )
+    )
+
+
+def make_client(response: str) -> MagicMock:
+    """Client returning ``response`` for council requests."""
+    client = MagicMock()
+    client.config.max_tokens = 512
+    client.generate = MagicMock(return_value=response)
+    return client
+
+
+def make_agents(client) -> list:
+    """The five council agents sharing ``client``."""
+    return [
+        HomeAgent(client),
+        AdversaryAgent(client),
+        ArbiterAgent(client),
+        RuleSageAgent(client),
+        ChaosAgent(client),
+    ]
+
+
+class TestCouncilWriter:
+    """Tests for generating and parsing a council round."""
+
+    def test_parses_every_turn(self, transcript):
+        """Each role's text becomes that role's argument."""
+        client = make_client(json.dumps({role: f"{role} speaks" for role in ROLES}))
+
+        turns = CouncilWriter(client).respond(make_agents(client), transcript, 1)
+
+        assert list(turns) == ROLES
+        assert turns["rule_sage"].content == "rule_sage speaks"
+        assert turns["rule_sage"].round == 1
+
+    def test_single_request_with_every_persona(self, transcript):
+        """One request carries all system prompts and a JSON schema."""
+        client = make_client("{}")
+        agents = make_agents(client)
+
+        CouncilWriter(client).respond(agents, transcript, 1)
+
+        client.generate.assert_called_once()
+        system_prompt, _ = client.generate.call_args[0]
+        assert all(agent.system_prompt in system_prompt for agent in agents)
+        kwargs = client.generate.call_args[1]
+        assert kwargs["format"]["required"] == ROLES
+        assert kwargs["max_tokens"] == 512 * 5
+
+    @pytest.mark.parametrize("response", ["not json", "[1, 2]"])
+    def test_unreadable_output_yields_nothing(self, transcript, response):
+        """Output that isn't a JSON object gives no turns."""
+        client = make_client(response)
+
+        assert CouncilWriter(client).respond(make_agents(client), transcript, 1) == {}
+
+    def test_missing_and_empty_turns_are_skipped(self, transcript):
+        """Only roles with usable text are returned."""
+        client = make_client(json.dumps({"home": "Charge!", "adversary": "  "}))
+
+        turns = CouncilWriter(client).respond(make_agents(client), transcript, 1)
+
+        assert list(turns) == ["home"]
+
+    def test_reads_stances_when_requested(self, transcript):
+        """Adaptive rounds get stances from council turns too."""
+        client = make_client(json.dumps({"home": "Charge!\nSTANCE: Player 1 90%"}))
+        agents = make_agents(client)
+        for agent in agents:
+            agent.report_stance = True
+
+        turns = CouncilWriter(client).respond(agents, transcript, 1)
+
+        assert "STANCE:" in client.generate.call_args[0][1]
+        assert turns["home"].stance == "Player 1 wins"
+        assert turns["home"].content == "Charge!"
+
+
+class TestCouncilEngine:
+    """Tests for council mode in the debate engine."""
+
+    def test_falls_back_to_agents_for_missing_turns(self, transcript):
+        """Turns absent from the council output come from per-agent calls."""
+        council = json.dumps({role: f"{role} (council)" for role in ROLES[:3]})
+
+        def generate(system_prompt, user_prompt, format=None, max_tokens=None):
+            if format is not None:
+                return council
+            if "WINNER" in user_prompt:
+                return VOTE_RESPONSE
+            return "solo turn"
+
+        client = make_client("")
+        client.generate = MagicMock(side_effect=generate)
+        engine = DebateEngine(num_rounds=1, council_mode=True, sink=NullSink())
+        engine.council.client = client
+        for agent in engine.agents:
+            agent.client = client
+
+        result = engine.run_debate(transcript.context)
+
+        contents = [arg.content for arg in result.rounds[0]]
+        assert contents == [
+            "home (council)",
+            "adversary (council)",
+            "arbiter (council)",
+            "solo turn",
+            "solo turn",
+        ]
+        # One council request, two fallback turns and five votes
+        assert client.generate.call_count == 8
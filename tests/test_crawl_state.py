@@ -0,0 +1,258 @@
+"""Unit tests for incremental re-crawls."""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from itertools import pairwise
+
+import pytest
+
+from vindicta_oracle.rag_pipeline.__main__ import parse_since
+from vindicta_oracle.rag_pipeline.crawl_state import (
+    CrawlStateStore,
+    PageState,
+    Validators,
+    recrawl_urls,
+)
+from vindicta_oracle.rag_pipeline.scraper import ScrapeLimits, compute_content_hash
+
+URLS = ["https://rules.example/core", "https://rules.example/faq"]
+LIMITS = ScrapeLimits(per_host_interval=0)
+
+
+class FakeCrawler:
+    """Crawler serving fixed pages, recording fetched URLs."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+
+    async def fetch_markdown(self, url):
+        self.fetched.append(url)
+        return self.pages[url]
+
+
+class FakeValidator:
+    """Server with one ETag per URL that honours If-None-Match."""
+
+    def __init__(self, etags):
+        self.etags = etags
+        self.requests = []
+
+    async def check(self, url, etag, last_modified):
+        self.requests.append((url, etag))
+        current = self.etags.get(url)
+        if current is not None and etag == current:
+            return None
+        return Validators(etag=current)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """An empty crawl state store."""
+    store = CrawlStateStore(tmp_path / "state.db")
+    yield store
+    store.close()
+
+
+async def crawl(store, pages, etags, **kwargs):
+    """Run a re-crawl and save the new state, like the CLI does."""
+    crawler = FakeCrawler(pages)
+    result = await recrawl_urls(
+        URLS,
+        store,
+        crawler=crawler,
+        limits=LIMITS,
+        validator=FakeValidator(etags),
+        **kwargs,
+    )
+    store.save(result.pages)
+    return result, crawler
+
+
+PAGES = {URLS[0]: "# Core\n\nMove 6 inches.", URLS[1]: "# FAQ\n\nQ: Why?"}
+
+
+class TestCrawlStateStore:
+    """Tests for the SQLite state store."""
+
+    def test_round_trip(self, tmp_path):
+        """Saved states are read back after reopening."""
+        state = PageState(URLS[0], "abc", etag='"v1"', checked_at=12.5)
+        CrawlStateStore(tmp_path / "state.db").save([state])
+
+        store = CrawlStateStore(tmp_path / "state.db")
+
+        assert store.get(URLS[0]) == state
+        assert store.get(URLS[1]) is None
+
+
+class TestValidators:
+    """Tests for comparing validators with recorded state."""
+
+    def test_etag_wins_over_last_modified(self):
+        """With an ETag on either side, only ETags are compared."""
+        state = PageState("u", "h", etag='"a"', last_modified="Mon")
+
+        assert Validators(etag='"a"').matches(state)
+        assert not Validators(etag='"b"', last_modified="Mon").matches(state)
+
+    def test_no_validators_never_match(self):
+        """Pages without validators must be fetched."""
+        assert not Validators().matches(PageState("u", "h"))
+
+
+class TestRecrawl:
+    """Tests for skipping unchanged pages."""
+
+    @pytest.mark.asyncio
+    async def test_first_crawl_chunks_every_page(self, store):
+        """Without state every page is fetched and recorded."""
+        result, crawler = await crawl(store, PAGES, {URLS[0]: '"v1"'})
+
+        assert result.changed == URLS
+        assert crawler.fetched == URLS
+        assert store.get(URLS[0]).etag == '"v1"'
+        assert store.get(URLS[1]).page_hash == compute_content_hash(PAGES[URLS[1]])
+
+    @pytest.mark.asyncio
+    async def test_not_modified_pages_are_not_fetched(self, store):
+        """A 304 skips the fetch; a same-hash page skips chunking."""
+        await crawl(store, PAGES, {URLS[0]: '"v1"'})
+
+        result, crawler = await crawl(store, PAGES, {URLS[0]: '"v1"'})
+
+        assert result.not_modified == [URLS[0]]
+        assert result.unchanged == [URLS[1]]
+        assert crawler.fetched == [URLS[1]]
+        assert result.chunks == []
+
+    @pytest.mark.asyncio
+    async def test_changed_pages_are_rechunked(self, store):
+        """New validators and content produce chunks again."""
+        await crawl(store, PAGES, {URLS[0]: '"v1"'})
+        pages = {**PAGES, URLS[0]: "# Core\n\nMove 7 inches."}
+
+        result, _ = await crawl(store, pages, {URLS[0]: '"v2"'})
+
+        assert result.changed == [URLS[0]]
+        assert [c.content_markdown for c in result.chunks] == [pages[URLS[0]]]
+        assert store.get(URLS[0]).etag == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_since_skips_recent_checks(self, store):
+        """Pages checked after ``since`` get no requests at all."""
+        await crawl(store, PAGES, {})
+
+        result, crawler = await crawl(
+            store, PAGES, {}, since=datetime.now() - timedelta(hours=1)
+        )
+
+        assert result.skipped == URLS
+        assert crawler.fetched == []
+
+    @pytest.mark.asyncio
+    async def test_force_reingests_everything(self, store):
+        """Forcing ignores the recorded state."""
+        await crawl(store, PAGES, {URLS[0]: '"v1"'})
+
+        result, crawler = await crawl(store, PAGES, {URLS[0]: '"v1"'}, force=True)
+
+        assert result.changed == URLS
+        assert crawler.fetched == URLS
+
+    @pytest.mark.asyncio
+    async def test_failed_checks_fall_back_to_fetching(self, store):
+        """Servers that reject HEAD still get crawled."""
+
+        class BrokenValidator:
+            async def check(self, url, etag, last_modified):
+                raise ConnectionError("HEAD not allowed")
+
+        crawler = FakeCrawler(PAGES)
+        result = await recrawl_urls(
+            URLS, store, crawler=crawler, limits=LIMITS, validator=BrokenValidator()
+        )
+
+        assert result.changed == URLS
+        assert result.error_count == 0
+
+
+class TestParseSince:
+    """Tests for the ``--since`` argument."""
+
+    def test_relative_age(self):
+        """``12h`` means twelve hours ago."""
+        since = parse_since("12h")
+
+        assert since == pytest.approx(
+            datetime.now() - timedelta(hours=12), abs=timedelta(seconds=5)
+        )
+
+    def test_iso_datetime(self):
+        """ISO dates are parsed as given."""
+        assert parse_since("2026-10-01") == datetime(2026, 10, 1)
+
+    def test_rejects_garbage(self):
+        """Unparseable values are argparse errors."""
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_since("last week")
+
+
+@pytest.mark.asyncio
+async def test_busy_host_does_not_block_other_hosts(store):
+    """Checks queued for one host don't hold the global slots."""
+    started = {}
+
+    class SlowValidator:
+        async def check(self, url, etag, last_modified):
+            started.setdefault(url.split("/")[2], time.monotonic())
+            await asyncio.sleep(0.05)
+            return Validators()
+
+    urls = [f"https://busy.example/{p}" for p in range(6)]
+    urls.append("https://idle.example/0")
+    limits = ScrapeLimits(
+        max_concurrency=2, per_host_connections=1, per_host_interval=0
+    )
+
+    start = time.monotonic()
+    await recrawl_urls(
+        urls,
+        store,
+        crawler=FakeCrawler(dict.fromkeys(urls, "# Page")),
+        limits=limits,
+        validator=SlowValidator(),
+    )
+
+    assert started["idle.example"] - start < 0.04
+
+
+@pytest.mark.asyncio
+async def test_checks_to_a_host_stay_spaced(store):
+    """Waiting for a global slot doesn't use up a host's spacing."""
+    starts = []
+
+    class SlowValidator:
+        async def check(self, url, etag, last_modified):
+            if url.startswith("https://rules.example"):
+                starts.append(time.monotonic())
+            await asyncio.sleep(0.05)
+            return Validators()
+
+    urls = [f"https://other.example/{p}" for p in range(2)]
+    urls += [f"https://rules.example/{p}" for p in range(4)]
+    limits = ScrapeLimits(
+        max_concurrency=1, per_host_connections=2, per_host_interval=0.1
+    )
+
+    await recrawl_urls(
+        urls,
+        store,
+        crawler=FakeCrawler(dict.fromkeys(urls, "# Page")),
+        limits=limits,
+        validator=SlowValidator(),
+    )
+
+    assert all(b - a >= 0.095 for a, b in pairwise(starts))
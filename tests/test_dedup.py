@@ -0,0 +1,93 @@
+"""Unit tests for the ingestion dedup index."""
+
+from typing import ClassVar
+
+import pytest
+
+from vindicta_oracle.rag_pipeline.dedup import BloomFilter, DedupIndex
+
+
+class FakeStore:
+    """Vector store holding only metadata, counting queries."""
+
+    def __init__(self, metadatas):
+        self.metadatas = metadatas
+        self.queries = 0
+        self.include = None
+
+    def get(self, ids=None, where=None, include=None):
+        self.queries += 1
+        self.include = include
+        return {"documents": ["doc"] * len(self.metadatas), "metadatas": self.metadatas}
+
+
+class TestBloomFilter:
+    """Tests for the probabilistic hash set."""
+
+    def test_no_false_negatives(self):
+        """Every added item is reported as present."""
+        bloom = BloomFilter(capacity=500)
+        items = [f"hash-{i}" for i in range(500)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate_near_target(self):
+        """At capacity, unseen items rarely test positive."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"seen-{i}")
+
+        false_positives = sum(f"unseen-{i}" in bloom for i in range(10_000))
+
+        assert false_positives < 300
+
+    @pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (10, 0), (10, 1)])
+    def test_rejects_invalid_sizing(self, capacity, error_rate):
+        """Capacity and error rate must be usable."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity, error_rate)
+
+
+class TestDedupIndex:
+    """Tests for the in-memory hash and version index."""
+
+    METADATAS: ClassVar[list[dict]] = [
+        {"url": "https://a", "content_hash": "h1", "version": 1},
+        {"url": "https://a", "content_hash": "h2", "version": 2},
+        {"url": "https://b", "content_hash": "h3", "version": 1},
+    ]
+
+    def test_loads_once_from_store(self):
+        """Hashes and latest versions come from a single store query."""
+        store = FakeStore(self.METADATAS)
+
+        index = DedupIndex.from_store(store)
+
+        assert store.queries == 1
+        assert store.include == ["metadatas"]
+        assert index.known("h2") == ("https://a", 2)
+        assert index.might_contain("h3")
+        assert not index.might_contain("h4")
+        assert index.latest_version("https://a") == 2
+        assert index.latest_version("https://c") == 0
+
+    def test_add_keeps_index_current(self):
+        """Newly stored segments are visible straight away."""
+        index = DedupIndex()
+
+        index.add("h1", "https://a", 1)
+        index.add("h1", "https://b", 1)
+        index.add("h2", "https://a", 2)
+
+        assert index.known("h1") == ("https://a", 1)
+        assert index.latest_version("https://a") == 2
+
+    def test_bloom_backed_index_keeps_membership_only(self):
+        """With a Bloom filter, hits must be confirmed elsewhere."""
+        index = DedupIndex.from_store(FakeStore(self.METADATAS), bloom_capacity=100)
+
+        assert index.might_contain("h1")
+        assert index.known("h1") is None
+        assert index.latest_version("https://a") == 2
@@ -0,0 +1,139 @@
+"""Unit tests for the persistent embedding cache."""
+
+import pytest
+
+from vindicta_oracle.rag_pipeline.embedding_cache import CachedEmbedder, EmbeddingCache
+
+
+class FakeEmbedder:
+    """Embedder returning [len(text), 1.0], recording each batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    def embed(self, text):
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestEmbeddingCache:
+    """Tests for the memory-mapped store."""
+
+    def test_vectors_survive_reopen(self, tmp_path):
+        """A new cache on the same directory serves earlier vectors."""
+        EmbeddingCache(tmp_path, "nomic").put("abc", [0.5, 1.5, 2.5])
+
+        cache = EmbeddingCache(tmp_path, "nomic")
+
+        assert len(cache) == 1
+        assert cache.get("abc").tolist() == [0.5, 1.5, 2.5]
+        assert cache.get("missing") is None
+
+    def test_lookups_are_read_only_views(self, tmp_path):
+        """Hits are views into the mapping, not copies."""
+        cache = EmbeddingCache(tmp_path, "nomic")
+        cache.put("abc", [1.0, 2.0])
+
+        vector = cache.get("abc")
+
+        assert vector.base is not None
+        with pytest.raises(ValueError):
+            vector[0] = 9.0
+
+    def test_model_change_invalidates(self, tmp_path):
+        """Opening with another model discards the cached vectors."""
+        EmbeddingCache(tmp_path, "nomic").put("abc", [1.0, 2.0])
+
+        cache = EmbeddingCache(tmp_path, "mxbai")
+
+        assert len(cache) == 0
+        cache.put("abc", [3.0, 4.0, 5.0])
+        assert EmbeddingCache(tmp_path, "mxbai").get("abc").tolist() == [3, 4, 5]
+        assert len(EmbeddingCache(tmp_path, "nomic")) == 0
+
+    def test_grows_past_initial_capacity(self, tmp_path):
+        """The matrix is resized as rows are added."""
+        cache = EmbeddingCache(tmp_path, "nomic", dtype="float16")
+        cache.put_many((f"h{i}", [float(i), 0.0]) for i in range(3000))
+
+        reopened = EmbeddingCache(tmp_path, "nomic", dtype="float16")
+
+        assert len(reopened) == 3000
+        assert reopened.get("h0").tolist() == [0.0, 0.0]
+        assert reopened.get("h2999")[0] == pytest.approx(2999, rel=1e-3)
+
+    def test_rejects_wrong_dimensions(self, tmp_path):
+        """Every vector must match the cache's dimensions."""
+        cache = EmbeddingCache(tmp_path, "nomic")
+        cache.put("a", [1.0, 2.0])
+
+        with pytest.raises(ValueError):
+            cache.put("b", [1.0, 2.0, 3.0])
+
+    def test_rejects_unknown_dtype(self, tmp_path):
+        """Only float32 and float16 storage is supported."""
+        with pytest.raises(ValueError):
+            EmbeddingCache(tmp_path, "nomic", dtype="int8")
+
+
+class TestCachedEmbedder:
+    """Tests for serving embeddings through the cache."""
+
+    def test_embeds_only_misses(self, tmp_path):
+        """Cached and repeated texts aren't sent to the embedder again."""
+        inner = FakeEmbedder()
+        embedder = CachedEmbedder(inner, EmbeddingCache(tmp_path, "nomic"))
+        embedder.embed("cached")
+
+        vectors = embedder.embed_batch(["cached", "new", "new"])
+
+        assert inner.batches == [["cached"], ["new"]]
+        assert vectors == [[6.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+
+    def test_hits_after_restart(self, tmp_path):
+        """A fresh process reuses embeddings keyed by content hash."""
+        CachedEmbedder(FakeEmbedder(), EmbeddingCache(tmp_path, "nomic")).embed("rule")
+        inner = FakeEmbedder()
+
+        cache = EmbeddingCache(tmp_path, "nomic")
+        vector = CachedEmbedder(inner, cache).embed("rule")
+
+        assert vector == [4.0, 1.0]
+        assert inner.batches == []
+        assert cache.key("rule") in cache
+
+    def test_single_texts_use_the_providers_embed(self, tmp_path):
+        """Cached single embeds match what the provider's ``embed`` returns."""
+
+        class SplitEmbedder(FakeEmbedder):
+            def embed(self, text):
+                return [float(len(text)), 2.0]
+
+        embedder = CachedEmbedder(SplitEmbedder(), EmbeddingCache(tmp_path, "nomic"))
+
+        assert embedder.embed("rule") == [4.0, 2.0]
+        assert embedder.embed_batch(["rule"]) == [[4.0, 2.0]]
+
+    def test_keys_include_the_model(self, tmp_path):
+        """A provider for another model misses instead of reusing vectors."""
+        cache = EmbeddingCache(tmp_path, "nomic")
+        CachedEmbedder(FakeEmbedder(), cache).embed("rule")
+        other = FakeEmbedder()
+        other.model = "mxbai"
+
+        CachedEmbedder(other, cache).embed_batch(["rule"])
+
+        assert cache.key("rule") != cache.key("rule", "mxbai")
+        assert other.batches == [["rule"]]
+
+    def test_files_with_old_keys_are_discarded(self, tmp_path):
+        """Caches written before keys included the model start empty."""
+        cache = EmbeddingCache(tmp_path, "nomic")
+        cache.put("abc", [1.0, 2.0])
+        meta = (tmp_path / "meta.json").read_text().replace(', "keys": 2', "")
+        (tmp_path / "meta.json").write_text(meta)
+
+        assert len(EmbeddingCache(tmp_path, "nomic")) == 0
@@ -0,0 +1,41 @@
+"""Unit tests for the Ollama embedding client."""
+
+import math
+
+from vindicta_oracle.rag_pipeline.clients import ollama_client
+from vindicta_oracle.rag_pipeline.clients.ollama_client import OllamaEmbeddingClient
+
+
+def fake_embed(model, input):
+    """/api/embed stand-in returning unit vectors derived from each text."""
+    vectors = []
+    for text in input:
+        raw = [float(len(text)), float(text.count(" ") + 1)]
+        norm = math.hypot(*raw)
+        vectors.append([value / norm for value in raw])
+    return {"embeddings": vectors}
+
+
+def test_single_and_batch_embeddings_match(monkeypatch):
+    """A text embeds to the same vector alone or in a batch."""
+    calls = []
+
+    def embed(model, input):
+        calls.append((model, list(input)))
+        return fake_embed(model, input)
+
+    monkeypatch.setattr(ollama_client.ollama, "embed", embed)
+    client = OllamaEmbeddingClient(model="nomic-embed-text")
+
+    single = client.embed("Fights first")
+    batch = client.embed_batch(["Fights first", "Lone operative"])
+
+    assert single == batch[0]
+    assert [model for model, _ in calls] == ["nomic-embed-text"] * 2
+
+
+def test_empty_batch_skips_the_request(monkeypatch):
+    """No texts, no request."""
+    monkeypatch.setattr(ollama_client.ollama, "embed", None)
+
+    assert OllamaEmbeddingClient().embed_batch([]) == []
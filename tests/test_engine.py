@@ -0,0 +1,734 @@
+"""Unit tests for the DebateEngine orchestration."""
+
+import threading
+import time
+from collections import Counter
+from concurrent.futures import CancelledError, Future
+from typing import ClassVar
+from unittest.mock import MagicMock
+
+import pytest
+
+from vindicta_oracle.agents.base import STANCE_FORMAT
+from vindicta_oracle.engine import DebateCancelledError, DebateEngine
+from vindicta_oracle.events import NullSink, QueueSink
+from vindicta_oracle.models import (
+    AgentRole,
+    DebateContext,
+    DebateEventType,
+    DebateTranscript,
+    RoutingTable,
+    VotingMode,
+)
+from vindicta_oracle.ollama_client import OllamaConfig, current_budget
+from vindicta_oracle.summarizer import SUMMARIZER_PROMPT
+from vindicta_oracle.telemetry import current_recorder
+
+VOTE_RESPONSE = """WINNER: Player 1
+PROBABILITY: 65%
+REASONING: Space Marines have the advantage."""
+
+
+@pytest.fixture
+def sample_context():
+    """Create a sample debate context."""
+    return DebateContext(
+        player1_faction="Space Marines",
+        player1_list="Captain, 5x Intercessors",
+        player2_faction="Orks",
+        player2_list="Warboss, 20x Boyz",
+    )
+
+
+def make_engine(client, **kwargs) -> DebateEngine:
+    """Build a silent engine whose agents all share ``client``."""
+    kwargs.setdefault("sink", NullSink())
+    engine = DebateEngine(**kwargs)
+    for agent in engine.agents:
+        agent.client = client
+    if engine.summarizer is not None:
+        engine.summarizer.client = client
+    if engine.council is not None:
+        engine.council.client = client
+    return engine
+
+
+class TestConcurrentRounds:
+    """Tests for fanning out the agent turns of a round."""
+
+    def test_rejects_invalid_concurrency(self):
+        """max_concurrency below 1 is a configuration error."""
+        with pytest.raises(ValueError):
+            DebateEngine(max_concurrency=0)
+
+    def test_concurrent_round_preserves_agent_order(self, sample_context):
+        """Arguments are recorded in council order even if finished out of order."""
+        delays = {"HOME": 0.05, "ADVERSARY": 0.04, "ARBITER": 0.03}
+
+        def generate(system_prompt, user_prompt):
+            if "WINNER" in user_prompt:
+                return VOTE_RESPONSE
+            name = system_prompt.split()[2].rstrip(",")
+            time.sleep(delays.get(name, 0.0))
+            return f"{name} argues"
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(client, num_rounds=2, max_concurrency=5)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert len(transcript.rounds) == 2
+        for round_args in transcript.rounds:
+            assert [a.agent_role for a in round_args] == list(AgentRole)
+        assert transcript.rounds[0][0].content == "HOME argues"
+
+    def test_fan_out_width_is_bounded(self, sample_context):
+        """No more than max_concurrency generations run at the same time."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def generate(system_prompt, user_prompt):
+            nonlocal active, peak
+            if "WINNER" in user_prompt:
+                return VOTE_RESPONSE
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return VOTE_RESPONSE
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(client, num_rounds=1, max_concurrency=2)
+
+        engine.run_debate(sample_context)
+
+        assert 1 < peak <= 2
+
+    def test_sequential_mode_runs_every_turn(self, sample_context):
+        """The default sequential mode still produces a full transcript."""
+        client = MagicMock()
+        client.generate = MagicMock(return_value=VOTE_RESPONSE)
+        engine = make_engine(client, num_rounds=3)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert len(transcript.rounds) == 3
+        assert len(transcript.votes) == 5
+        assert transcript.consensus == "Player 1 wins"
+
+
+class TestParallelVoting:
+    """Tests for the concurrent voting phase."""
+
+    def test_votes_are_collected_in_council_order(self, sample_context):
+        """Parallel votes are recorded in council order before consensus."""
+        client = MagicMock()
+        client.generate = MagicMock(return_value=VOTE_RESPONSE)
+        engine = make_engine(client, num_rounds=1)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert [v.agent_role for v in transcript.votes] == list(AgentRole)
+        assert transcript.consensus == "Player 1 wins"
+        assert transcript.consensus_confidence == pytest.approx(0.65)
+
+    def test_slow_vote_is_dropped_after_timeout(self, sample_context):
+        """A vote that overruns vote_timeout abstains instead of stalling."""
+        release = threading.Event()
+
+        def generate(system_prompt, user_prompt):
+            if "WINNER" in user_prompt and system_prompt.startswith("You are CHAOS"):
+                release.wait(timeout=5)
+            return VOTE_RESPONSE
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(client, num_rounds=1, vote_timeout=0.2)
+
+        try:
+            start = time.monotonic()
+            transcript = engine.run_debate(sample_context)
+            elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        assert elapsed < 2
+        assert len(transcript.votes) == 4
+        assert AgentRole.CHAOS not in [v.agent_role for v in transcript.votes]
+        assert transcript.consensus == "Player 1 wins"
+
+    def test_timeout_applies_to_each_serial_vote(self, sample_context):
+        """Serial votes each get the full timeout from their own start."""
+
+        def generate(system_prompt, user_prompt):
+            if "WINNER" in user_prompt:
+                time.sleep(0.2)
+            return VOTE_RESPONSE
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(
+            client, num_rounds=1, parallel_votes=False, vote_timeout=0.3
+        )
+
+        transcript = engine.run_debate(sample_context)
+
+        assert len(transcript.votes) == 5
+
+    def test_vote_retries_share_the_timeout(self, sample_context):
+        """A structured vote and its retries run against one deadline."""
+
+        def generate(system_prompt, user_prompt, format=None, **options):
+            if format is None:
+                return "Argument."
+            # Report the request's slot like the real client does
+            budget = current_budget()
+            budget.mark_queued()
+            budget.mark_started()
+            time.sleep(0.15)
+            return VOTE_RESPONSE  # Not JSON, so the vote is retried
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(
+            client, num_rounds=1, structured_votes=True, vote_timeout=0.25
+        )
+
+        transcript = engine.run_debate(sample_context)
+
+        assert transcript.votes == []
+
+    def test_overrunning_vote_is_cancelled(self, sample_context):
+        """The generation of a timed-out vote is cancelled, not abandoned."""
+        cancelled = threading.Event()
+
+        def generate(system_prompt, user_prompt):
+            if "WINNER" in user_prompt and "CHAOS" in system_prompt:
+                request: Future = Future()
+                current_budget().attach(request)
+                try:
+                    request.result(timeout=5)
+                except CancelledError:
+                    cancelled.set()
+                    raise
+            return VOTE_RESPONSE
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(client, num_rounds=1, vote_timeout=0.1)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert cancelled.wait(timeout=1)
+        assert len(transcript.votes) == 4
+
+    def test_consensus_without_votes(self, sample_context):
+        """If every agent abstains there is no consensus."""
+        engine = DebateEngine()
+        transcript = DebateTranscript(context=sample_context)
+
+        assert engine._calculate_consensus(transcript) == ("No consensus", 0.0)
+
+
+class TestProgressEvents:
+    """Tests for the engine's progress callback."""
+
+    def test_events_follow_transcript_order(self, sample_context):
+        """Every argument, vote and the verdict are reported in order."""
+        client = MagicMock()
+        client.generate = MagicMock(return_value=VOTE_RESPONSE)
+        engine = make_engine(client, num_rounds=2, max_concurrency=5)
+        events = []
+
+        transcript = engine.run_debate(sample_context, on_event=events.append)
+
+        types = [e.type for e in events]
+        assert types == (
+            [DebateEventType.STARTED]
+            + ([DebateEventType.ROUND] + [DebateEventType.ARGUMENT] * 5) * 2
+            + [DebateEventType.VOTING]
+            + [DebateEventType.VOTE] * 5
+            + [DebateEventType.VERDICT]
+        )
+        assert all(e.debate_id == transcript.id for e in events)
+        assert events[0].data["player2_faction"] == "Orks"
+        assert events[2].data["agent_role"] == "home"
+        assert events[-1].data["consensus"] == "Player 1 wins"
+        assert len(events[-1].data["votes"]) == 5
+
+    def test_sink_receives_same_events_as_callback(self, sample_context):
+        """The engine's sink sees every event the callback does."""
+        client = MagicMock()
+        client.generate = MagicMock(return_value=VOTE_RESPONSE)
+        sink = QueueSink()
+        engine = make_engine(client, num_rounds=1, sink=sink)
+        events = []
+
+        engine.run_debate(sample_context, on_event=events.append)
+
+        assert sink.drain() == events
+
+    def test_timed_out_vote_is_reported_as_abstention(self, sample_context):
+        """Agents that miss the vote deadline produce an abstain event."""
+
+        def generate(system_prompt, user_prompt):
+            if "WINNER" in user_prompt and "CHAOS" in system_prompt:
+                time.sleep(0.5)
+            return VOTE_RESPONSE
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        sink = QueueSink()
+        engine = make_engine(client, num_rounds=1, vote_timeout=0.1, sink=sink)
+
+        engine.run_debate(sample_context)
+
+        abstentions = [e for e in sink.drain() if e.type == DebateEventType.ABSTAIN]
+        assert [e.data for e in abstentions] == [
+            {"agent_role": "chaos", "timeout": 0.1}
+        ]
+
+    def test_iter_debate_streams_tokens(self, sample_context):
+        """iter_debate yields partial output before each finished argument."""
+        client = MagicMock()
+        client.generate = MagicMock(return_value=VOTE_RESPONSE)
+        client.stream = MagicMock(side_effect=lambda s, u: iter(VOTE_RESPONSE))
+        engine = make_engine(client, num_rounds=1)
+
+        events = list(engine.iter_debate(sample_context))
+
+        first_argument = next(
+            i for i, e in enumerate(events) if e.type == DebateEventType.ARGUMENT
+        )
+        first_token = next(e for e in events if e.type == DebateEventType.TOKEN)
+        assert first_token.data["phase"] == "respond"
+        assert first_token.data["agent_role"] == "home"
+        assert events[first_argument - 1].type == DebateEventType.TOKEN
+        assert first_argument > 0
+        assert events[-1].type == DebateEventType.VERDICT
+
+    def test_iter_debate_reraises_errors(self, sample_context):
+        """Errors inside the background debate surface to the consumer."""
+        client = MagicMock()
+        client.stream = MagicMock(side_effect=ConnectionError("Ollama down"))
+        engine = make_engine(client, num_rounds=1)
+
+        with pytest.raises(ConnectionError):
+            list(engine.iter_debate(sample_context))
+
+    def test_cancel_stops_before_the_next_turn(self, sample_context):
+        """Once ``cancel`` is set no further agent turn starts."""
+        cancel = threading.Event()
+
+        def generate(system_prompt, user_prompt):
+            cancel.set()
+            return VOTE_RESPONSE
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(client, num_rounds=3, max_concurrency=1)
+
+        with pytest.raises(DebateCancelledError):
+            engine.run_debate(sample_context, cancel=cancel)
+
+        assert client.generate.call_count == 1
+
+    def test_closing_iter_debate_cancels_the_debate(self, sample_context):
+        """An abandoned iterator stops its background debate."""
+        gate = threading.Event()
+
+        def stream(system_prompt, user_prompt):
+            gate.wait(timeout=5)
+            return iter(VOTE_RESPONSE)
+
+        client = MagicMock()
+        client.stream = MagicMock(side_effect=stream)
+        engine = make_engine(client, num_rounds=3, max_concurrency=1)
+
+        events = engine.iter_debate(sample_context)
+        assert next(events).type == DebateEventType.STARTED
+        events.close()
+        gate.set()
+        for thread in threading.enumerate():
+            if thread.name == "oracle-debate":
+                thread.join(timeout=5)
+
+        assert client.stream.call_count == 1
+
+
+class TestRollingSummary:
+    """Tests for summarizing older rounds in the background."""
+
+    def test_prompts_carry_summary_and_latest_round(self, sample_context):
+        """Late rounds and votes see the summary, not the early rounds."""
+        prompts = []
+
+        def generate(system_prompt, user_prompt):
+            if system_prompt == SUMMARIZER_PROMPT:
+                rounds = user_prompt.count("Round ")
+                return f"SUMMARY-{len(prompts)}-{rounds}"
+            prompts.append(user_prompt)
+            if "WINNER" in user_prompt:
+                return VOTE_RESPONSE
+            return f"argument {len(prompts)}"
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        sink = QueueSink()
+        engine = make_engine(client, num_rounds=3, summarize=True, sink=sink)
+
+        transcript = engine.run_debate(sample_context)
+
+        round_3 = [p for p in prompts if p.startswith("Round 3")]
+        assert all("Summary of rounds 1-1:" in p for p in round_3)
+        assert all("[HOME]: argument 1\n" not in p for p in round_3)
+        assert all("argument 6" in p for p in round_3)
+        vote_prompts = [p for p in prompts if "WINNER" in p]
+        assert all("Summary of rounds 1-2:" in p for p in vote_prompts)
+        assert transcript.history.summarized_rounds == 2
+
+        summaries = [e.data for e in sink.drain() if e.type == DebateEventType.SUMMARY]
+        assert [s["rounds"] for s in summaries] == [1, 2]
+
+    def test_summary_overlaps_next_round(self, sample_context):
+        """The summary of round 1 is generated while round 2 is running."""
+        round_2_started = threading.Event()
+        overlapped = []
+
+        def generate(system_prompt, user_prompt):
+            if system_prompt == SUMMARIZER_PROMPT:
+                overlapped.append(round_2_started.wait(timeout=5))
+                return "summary"
+            if user_prompt.startswith("Round 2"):
+                round_2_started.set()
+            return VOTE_RESPONSE
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(client, num_rounds=2, summarize=True)
+
+        engine.run_debate(sample_context)
+
+        assert overlapped == [True]
+
+    def test_failed_summary_keeps_history_verbatim(self, sample_context, caplog):
+        """A summarizer error is logged and the debate carries on unsummarized."""
+        prompts = []
+
+        def generate(system_prompt, user_prompt):
+            if system_prompt == SUMMARIZER_PROMPT:
+                raise ConnectionError("summarizer down")
+            prompts.append(user_prompt)
+            if "WINNER" in user_prompt:
+                return VOTE_RESPONSE
+            return f"argument {len(prompts)}"
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        sink = QueueSink()
+        engine = make_engine(client, num_rounds=3, summarize=True, sink=sink)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert len(transcript.rounds) == 3
+        assert transcript.history.summary is None
+        round_3 = [p for p in prompts if p.startswith("Round 3")]
+        assert all("[HOME]: argument 1\n" in p for p in round_3)
+        # No summary is attempted once one has failed
+        summary_calls = [
+            c for c in client.generate.call_args_list if c.args[0] == SUMMARIZER_PROMPT
+        ]
+        assert len(summary_calls) == 1
+        assert not [e for e in sink.drain() if e.type == DebateEventType.SUMMARY]
+        assert "Summarizing round 1 failed" in caplog.text
+
+    def test_no_summaries_by_default(self, sample_context):
+        """Without summarize, prompts carry the verbatim debate."""
+        client = MagicMock()
+        client.generate = MagicMock(return_value=VOTE_RESPONSE)
+        engine = make_engine(client, num_rounds=3)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert engine.summarizer is None
+        assert transcript.history.summary is None
+
+
+class TestAdaptiveRounds:
+    """Tests for stopping the debate once the council converges."""
+
+    @staticmethod
+    def stance_client(stances: dict[str, str]) -> MagicMock:
+        """Client whose agents argue with the given STANCE lines by name."""
+
+        def generate(system_prompt, user_prompt):
+            if "WINNER" in user_prompt:
+                return VOTE_RESPONSE
+            name = system_prompt.split()[2].rstrip(",")
+            return f"{name} argues.\nSTANCE: {stances.get(name, 'Draw 50%')}"
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        return client
+
+    def test_stops_when_council_agrees(self, sample_context):
+        """Unanimous, confident stances end the debate after one round."""
+        client = self.stance_client(
+            dict.fromkeys(
+                ["HOME", "ADVERSARY", "ARBITER", "RULE-SAGE", "CHAOS"], "Player 1 85%"
+            )
+        )
+        engine = make_engine(client, num_rounds=3, adaptive_rounds=True)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert len(transcript.rounds) == 1
+        assert transcript.termination_reason == (
+            "converged after round 1: 5/5 agents favour Player 1 wins"
+            " (mean confidence 85%)"
+        )
+        assert len(transcript.votes) == 5
+        argument = transcript.rounds[0][0]
+        assert argument.stance == "Player 1 wins"
+        assert "STANCE" not in argument.content
+
+    def test_split_council_runs_all_rounds(self, sample_context):
+        """Disagreement keeps the debate going to ``num_rounds``."""
+        client = self.stance_client(
+            {"HOME": "Player 1 90%", "ADVERSARY": "Player 2 90%"}
+        )
+        engine = make_engine(client, num_rounds=3, adaptive_rounds=True)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert len(transcript.rounds) == 3
+        assert transcript.termination_reason == "completed all 3 rounds"
+
+    def test_thresholds_are_configurable(self, sample_context):
+        """A looser agreement threshold stops on a majority, not on low confidence."""
+        stances = dict.fromkeys(
+            ["HOME", "ARBITER", "RULE-SAGE", "CHAOS"], "Player 1 60%"
+        )
+        engine = make_engine(
+            self.stance_client(stances),
+            num_rounds=3,
+            adaptive_rounds=True,
+            min_agreement=0.8,
+        )
+        assert len(engine.run_debate(sample_context).rounds) == 3
+
+        engine = make_engine(
+            self.stance_client(stances),
+            num_rounds=3,
+            adaptive_rounds=True,
+            min_agreement=0.8,
+            min_confidence=0.6,
+        )
+        assert len(engine.run_debate(sample_context).rounds) == 1
+
+    def test_fixed_rounds_by_default(self, sample_context):
+        """Without adaptive rounds, agents are not asked for a stance."""
+        client = self.stance_client({})
+        engine = make_engine(client, num_rounds=2)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert len(transcript.rounds) == 2
+        prompts = [c[0][1] for c in client.generate.call_args_list]
+        assert not any(STANCE_FORMAT in p for p in prompts)
+        assert transcript.rounds[0][0].stance is None
+
+    def test_rejects_invalid_thresholds(self):
+        """Thresholds outside (0, 1] are configuration errors."""
+        with pytest.raises(ValueError):
+            DebateEngine(adaptive_rounds=True, min_agreement=1.5)
+
+
+class TestFusedVoting:
+    """Tests for casting votes with the final round."""
+
+    @staticmethod
+    def fused_client(skip: str | None = None) -> MagicMock:
+        """Client whose final-round turns carry a vote trailer.
+
+        The agent named ``skip`` leaves the trailer out.
+        """
+
+        def generate(system_prompt, user_prompt):
+            name = system_prompt.split()[2].rstrip(",")
+            if "debate has concluded" in user_prompt:
+                return "WINNER: Player 1\nPROBABILITY: 55%\nREASONING: Separate."
+            if "VOTE:" in user_prompt and name != skip:
+                return (
+                    f"{name} closes.\n\nVOTE:\nWINNER: Player 2\n"
+                    "PROBABILITY: 70%\nREASONING: Fused."
+                )
+            return f"{name} argues."
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        return client
+
+    def test_votes_come_from_final_round(self, sample_context):
+        """No separate vote requests are made when every trailer parses."""
+        client = self.fused_client()
+        engine = make_engine(client, num_rounds=2, fuse_votes=True)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert client.generate.call_count == 10
+        assert transcript.voting_mode == VotingMode.FUSED
+        assert [v.prediction for v in transcript.votes] == ["Player 2 wins"] * 5
+        assert transcript.rounds[1][0].content == "HOME closes."
+        assert transcript.rounds[0][0].content == "HOME argues."
+        assert transcript.consensus == "Player 2 wins"
+
+    def test_missing_trailer_falls_back_to_vote(self, sample_context):
+        """Agents without a readable trailer vote separately."""
+        client = self.fused_client(skip="CHAOS")
+        sink = QueueSink()
+        engine = make_engine(client, num_rounds=1, fuse_votes=True, sink=sink)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert client.generate.call_count == 6
+        assert transcript.voting_mode == VotingMode.MIXED
+        assert [v.agent_role for v in transcript.votes] == list(AgentRole)
+        assert transcript.votes[-1].prediction == "Player 1 wins"
+        votes = [e for e in sink.drain() if e.type == DebateEventType.VOTE]
+        assert [e.data["agent_role"] for e in votes] == [r.value for r in AgentRole]
+
+    def test_separate_votes_by_default(self, sample_context):
+        """Without fuse_votes every agent gets a dedicated vote request."""
+        client = self.fused_client()
+        engine = make_engine(client, num_rounds=1)
+
+        transcript = engine.run_debate(sample_context)
+
+        assert client.generate.call_count == 10
+        assert transcript.voting_mode == VotingMode.SEPARATE
+
+
+class TestRouting:
+    """Tests for per-role, per-phase model routing."""
+
+    ROUTING: ClassVar[dict[str, dict]] = {
+        "*.*": {"temperature": 0.2},
+        "chaos.*": {"model": "llama3.2:1b"},
+        "arbiter.*": {"model": "llama3.1:8b"},
+        "*.vote": {"max_tokens": 128},
+        "arbiter.vote": {"temperature": 0.0},
+    }
+
+    def test_more_specific_keys_override_fields(self):
+        """Routes merge field by field from least to most specific."""
+        table = RoutingTable.model_validate(self.ROUTING)
+
+        route = table.route(AgentRole.ARBITER, "vote")
+
+        assert route.model == "llama3.1:8b"
+        assert route.max_tokens == 128
+        assert route.temperature == 0.0
+        assert table.route(None, "summary").model_dump(exclude_none=True) == {
+            "temperature": 0.2
+        }
+
+    @pytest.mark.parametrize("key", ["chaos", "wizard.respond", "home.debate"])
+    def test_rejects_unknown_keys(self, key):
+        """Keys must name a known role and phase (or ``*``)."""
+        with pytest.raises(ValueError):
+            RoutingTable.model_validate({key: {"model": "mistral"}})
+
+    def test_agents_get_routed_clients(self):
+        """Each agent and phase uses the routed config; equal configs share."""
+        engine = DebateEngine(
+            config=OllamaConfig(model="llama3.2"),
+            routing=RoutingTable.model_validate(self.ROUTING),
+            summarize=True,
+            sink=NullSink(),
+        )
+        agents = {agent.role: agent for agent in engine.agents}
+        home, chaos = agents[AgentRole.HOME], agents[AgentRole.CHAOS]
+        arbiter = agents[AgentRole.ARBITER]
+
+        assert chaos.client.config.model == "llama3.2:1b"
+        assert arbiter.client.config.model == "llama3.1:8b"
+        assert home.client.config.model == "llama3.2"
+        assert home.client is agents[AgentRole.ADVERSARY].client
+        assert arbiter.phase_clients["vote"].config.max_tokens == 128
+        assert arbiter.phase_clients["vote"].config.temperature == 0.0
+        assert engine.summarizer.client is home.client
+
+    def test_votes_use_the_vote_client(self, sample_context):
+        """Vote generations go to the client routed for the vote phase."""
+        client = MagicMock()
+        client.generate = MagicMock(return_value="Argument.")
+        vote_client = MagicMock()
+        vote_client.generate = MagicMock(return_value=VOTE_RESPONSE)
+        engine = make_engine(client, num_rounds=1)
+        for agent in engine.agents:
+            agent.phase_clients = {"vote": vote_client}
+
+        engine.run_debate(sample_context)
+
+        assert client.generate.call_count == 5
+        assert vote_client.generate.call_count == 5
+
+
+class TestTelemetry:
+    """Tests for collecting per-call telemetry into the transcript."""
+
+    def test_calls_are_attached_and_collected(self, sample_context):
+        """Arguments, votes and the transcript carry the calls made for them."""
+
+        def generate(system_prompt, user_prompt):
+            current_recorder().record("llama3.2", {"eval_count": 7})
+            return VOTE_RESPONSE if "WINNER" in user_prompt else "Argument."
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(client, num_rounds=2, summarize=True)
+
+        transcript = engine.run_debate(sample_context)
+
+        argument = transcript.rounds[1][0]
+        assert [(c.agent_role, c.phase, c.round) for c in argument.telemetry] == [
+            (AgentRole.HOME, "respond", 2)
+        ]
+        assert transcript.votes[0].telemetry[0].phase == "vote"
+        phases = Counter(call.phase for call in transcript.telemetry)
+        assert phases == {"respond": 10, "summary": 1, "vote": 5}
+
+    def test_timed_out_votes_keep_their_calls(self, sample_context):
+        """Calls of a vote that hit the timeout still reach the transcript."""
+
+        def generate(system_prompt, user_prompt):
+            recorder = current_recorder()
+            if "WINNER" in user_prompt and "CHAOS" in system_prompt:
+                request: Future = Future()
+                request.add_done_callback(
+                    lambda _: recorder.record(
+                        "llama3.2", {"eval_count": 3}, stopped=True
+                    )
+                )
+                current_budget().attach(request, recorder)
+                request.result(timeout=5)
+            recorder.record("llama3.2", {"eval_count": 7})
+            return VOTE_RESPONSE
+
+        client = MagicMock()
+        client.generate = MagicMock(side_effect=generate)
+        engine = make_engine(client, num_rounds=1, vote_timeout=0.1)
+
+        transcript = engine.run_debate(sample_context)
+
+        votes = [call for call in transcript.telemetry if call.phase == "vote"]
+        assert len(votes) == 5
+        (stopped,) = [call for call in votes if call.stopped]
+        assert stopped.agent_role == AgentRole.CHAOS
+        assert stopped.completion_tokens == 3
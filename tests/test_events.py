@@ -0,0 +1,110 @@
+"""Unit tests for the debate event sinks."""
+
+import io
+import logging
+from uuid import uuid4
+
+import pytest
+
+from vindicta_oracle.events import ConsoleSink, LoggingSink, NullSink, QueueSink
+from vindicta_oracle.models import AgentRole, DebateEvent, DebateEventType, role_name
+
+
+def make_event(event_type: DebateEventType, **data) -> DebateEvent:
+    """Build an event for a throwaway debate."""
+    return DebateEvent(type=event_type, debate_id=uuid4(), data=data)
+
+
+@pytest.mark.parametrize("role", [AgentRole.RULE_SAGE, "rule_sage"])
+def test_role_name_accepts_enum_or_value(role):
+    """Roles print the same whether given as the enum or an event's value."""
+    assert role_name(role) == "RULE-SAGE"
+
+
+@pytest.fixture
+def vote_event():
+    """A finished vote from the rule sage."""
+    return make_event(
+        DebateEventType.VOTE,
+        agent_role="rule_sage",
+        prediction="Player 1 wins",
+        win_probability=0.65,
+    )
+
+
+class TestConsoleSink:
+    """Tests for the CLI output sink."""
+
+    def test_formats_vote(self, vote_event):
+        """Votes show the role, prediction and confidence."""
+        out = io.StringIO()
+        ConsoleSink(stream=out).emit(vote_event)
+
+        assert "[RULE-SAGE] Casting vote..." in out.getvalue()
+        assert "→ Player 1 wins (65% confidence)" in out.getvalue()
+
+    def test_truncates_long_arguments(self):
+        """Argument previews are cut at ``preview_chars``."""
+        out = io.StringIO()
+        event = make_event(
+            DebateEventType.ARGUMENT, agent_role="home", content="x" * 50
+        )
+        ConsoleSink(stream=out, preview_chars=10).emit(event)
+
+        assert f"   {'x' * 10}...\n" in out.getvalue()
+
+    def test_ignores_tokens(self):
+        """Partial output is not echoed to the console."""
+        out = io.StringIO()
+        ConsoleSink(stream=out).emit(make_event(DebateEventType.TOKEN, text="Hi"))
+
+        assert out.getvalue() == ""
+
+
+class TestLoggingSink:
+    """Tests for the structured logging sink."""
+
+    def test_attaches_event_to_record(self, vote_event, caplog):
+        """Each record carries the serialized event."""
+        with caplog.at_level(logging.INFO, logger="vindicta_oracle.events"):
+            LoggingSink().emit(vote_event)
+
+        (record,) = caplog.records
+        assert record.levelno == logging.INFO
+        assert record.debate_event["data"]["prediction"] == "Player 1 wins"
+
+    def test_tokens_log_at_debug(self, caplog):
+        """Token events stay out of INFO logs."""
+        with caplog.at_level(logging.INFO, logger="vindicta_oracle.events"):
+            LoggingSink().emit(make_event(DebateEventType.TOKEN, text="Hi"))
+
+        assert caplog.records == []
+
+
+class TestQueueSink:
+    """Tests for the in-memory queue sink."""
+
+    def test_drain_returns_events_in_order(self, vote_event):
+        """Drained events come out in emission order."""
+        sink = QueueSink()
+        round_event = make_event(DebateEventType.ROUND, round=1)
+        sink(round_event)
+        sink(vote_event)
+
+        assert sink.drain() == [round_event, vote_event]
+        assert sink.drain() == []
+
+    def test_full_queue_drops_oldest(self):
+        """A bounded sink never blocks; it discards the oldest events."""
+        sink = QueueSink(maxsize=2)
+        events = [make_event(DebateEventType.ROUND, round=n) for n in range(3)]
+        for event in events:
+            sink.emit(event)
+
+        assert sink.drain() == events[1:]
+        assert sink.dropped == 1
+
+
+def test_null_sink_accepts_events(vote_event):
+    """The null sink can be called like any other sink."""
+    NullSink()(vote_event)
@@ -1,56 +1,25 @@
 """Unit tests for the ListGrader."""
 
-import pytest
+import asyncio
+import threading
 from unittest.mock import MagicMock
-from uuid import uuid4
 
+import pytest
+
+from vindicta_oracle.executor import GradingExecutor, GradingQueueFullError
 from vindicta_oracle.grader import ListGrader
 from vindicta_oracle.models import (
     ArmyList,
-    Unit,
+    DebateEventType,
     GradeRequest,
-    DebateTranscript,
-    Vote,
-    AgentRole,
-    DebateContext,
+    Unit,
 )
 
 
-class MockDebateEngine:
-    def run_grading_session(self, army_list):
-        context = DebateContext(
-            player1_faction=army_list.faction,
-            player1_list="mock",
-            player2_faction="mock",
-            player2_list="mock",
-        )
-        transcript = DebateTranscript(id=uuid4(), context=context)
-        transcript.consensus = "Player 1 wins"
-        transcript.consensus_confidence = 0.8
-        transcript.rounds = [[], [], []]
-        transcript.votes = [
-            Vote(
-                agent_role=AgentRole.HOME,
-                prediction="Player 1 wins",
-                win_probability=0.8,
-                confidence=0.9,
-                reasoning="Good list",
-            ),
-            Vote(
-                agent_role=AgentRole.ARBITER,
-                prediction="Player 1 wins",
-                win_probability=0.8,
-                confidence=0.8,
-                reasoning="Strong units",
-            ),
-        ]
-        return transcript
-
-
 @pytest.mark.asyncio
-async def test_grade_valid_list():
+async def test_grade_valid_list(fake_engine):
     """Test the happy path for grading a valid list."""
-    grader = ListGrader(engine=MockDebateEngine())
+    grader = ListGrader(engine=fake_engine())
     army_list = ArmyList(
         faction="Space Marines", units=[Unit(name="Captain", points=100)]
     )
@@ -62,11 +31,12 @@ async def test_grade_valid_list():
     assert response.grade in ["A", "B", "C", "D", "F"]
     assert "home" in response.analysis
     assert response.council_verdict["confidence"] == 0.8
+    assert response.metadata["telemetry"]["debate"]["calls"] == 0
 
 
-def test_scoring_formula():
+def test_scoring_formula(fake_engine):
     """Verify the 60/40 scoring formula and grade mapping."""
-    grader = ListGrader(engine=MockDebateEngine())
+    grader = ListGrader(engine=fake_engine())
 
     # Mocking internal methods for formula test
     grader._calculate_primordia_score = MagicMock(return_value=100)
@@ -88,3 +58,186 @@ def test_grade_mapping():
     assert grader._map_score_to_grade(70) == "C"
     assert grader._map_score_to_grade(50) == "D"
     assert grader._map_score_to_grade(30) == "F"
+
+
+@pytest.mark.asyncio
+async def test_grade_does_not_block_event_loop(fake_engine):
+    """A running debate leaves the event loop free for other requests."""
+    release = threading.Event()
+    grader = ListGrader(
+        engine=fake_engine(release=release), executor=GradingExecutor(max_workers=1)
+    )
+    army_list = ArmyList(faction="Orks", units=[Unit(name="Boyz", points=85)])
+
+    task = asyncio.create_task(grader.grade(GradeRequest(army_list=army_list)))
+    await asyncio.sleep(0.05)  # Event loop still serves other coroutines
+
+    assert grader.executor.stats()["running"] == 1
+    release.set()
+    response = await task
+    assert response.council_verdict["prediction"] == "Player 1 wins"
+    assert grader.executor.stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_grade_rejects_when_queue_full(fake_engine):
+    """Submissions beyond workers + queue are rejected, not buffered."""
+    release = threading.Event()
+    executor = GradingExecutor(max_workers=1, max_queue=1)
+    grader = ListGrader(engine=fake_engine(release=release), executor=executor)
+    requests = [
+        GradeRequest(
+            army_list=ArmyList(faction="Orks", units=[Unit(name="Boyz", points=p)])
+        )
+        for p in (85, 170, 255)
+    ]
+
+    running = asyncio.create_task(grader.grade(requests[0]))
+    waiting = asyncio.create_task(grader.grade(requests[1]))
+    await asyncio.sleep(0.05)
+
+    assert executor.stats()["queued"] == 1
+    with pytest.raises(GradingQueueFullError):
+        await grader.grade(requests[2])
+
+    release.set()
+    await asyncio.gather(running, waiting)
+    assert executor.stats()["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_requests_share_one_debate(fake_engine):
+    """Concurrent requests for the same list coalesce into one debate."""
+    release = threading.Event()
+    engine = fake_engine(release=release)
+    grader = ListGrader(engine=engine, executor=GradingExecutor(max_workers=2))
+    first = ArmyList(
+        faction="Space Marines",
+        units=[
+            Unit(name="Captain", points=80, wargear=["Relic Blade", "Storm Shield"]),
+            Unit(name="Intercessor  Squad", points=90),
+        ],
+    )
+    # Same list with units reordered and whitespace changed
+    second = ArmyList(
+        faction=" Space  Marines",
+        units=[
+            Unit(name="Intercessor Squad", points=90),
+            Unit(name="Captain ", points=80, wargear=["Storm Shield", "Relic Blade"]),
+        ],
+    )
+
+    tasks = [
+        asyncio.create_task(grader.grade(GradeRequest(army_list=army_list)))
+        for army_list in (first, second)
+    ]
+    await asyncio.sleep(0.05)
+    release.set()
+    responses = await asyncio.gather(*tasks)
+
+    assert engine.sessions == 1
+    assert responses[0].metadata["debate_id"] == responses[1].metadata["debate_id"]
+    assert all("processing_time_ms" in r.metadata for r in responses)
+    assert grader._in_flight == {}
+
+
+@pytest.mark.asyncio
+async def test_different_lists_are_not_coalesced(fake_engine):
+    """Lists that differ in content get their own debates."""
+    release = threading.Event()
+    release.set()
+    engine = fake_engine(release=release)
+    grader = ListGrader(engine=engine, executor=GradingExecutor(max_workers=2))
+    lists = [
+        ArmyList(faction="Orks", units=[Unit(name="Boyz", points=points)])
+        for points in (85, 170)
+    ]
+
+    await asyncio.gather(*(grader.grade(GradeRequest(army_list=a)) for a in lists))
+
+    assert engine.sessions == 2
+
+
+@pytest.mark.asyncio
+async def test_joined_requests_only_get_tokens_they_asked_for(fake_engine):
+    """A request joining a token-streaming debate receives no token events."""
+    release = threading.Event()
+    grader = ListGrader(
+        engine=fake_engine(release=release, events=True),
+        executor=GradingExecutor(max_workers=1),
+    )
+    request = GradeRequest(
+        army_list=ArmyList(faction="Orks", units=[Unit(name="Boyz", points=85)])
+    )
+    streamed, joined = [], []
+
+    streaming = asyncio.create_task(
+        grader.grade(request, on_event=streamed.append, stream_tokens=True)
+    )
+    await asyncio.sleep(0.05)
+    joining = asyncio.create_task(grader.grade(request, on_event=joined.append))
+    await asyncio.sleep(0.05)
+    release.set()
+    await asyncio.gather(streaming, joining)
+
+    assert [e.type for e in streamed] == [
+        DebateEventType.TOKEN,
+        DebateEventType.ARGUMENT,
+        DebateEventType.VOTE,
+    ]
+    assert [e.type for e in joined] == [
+        DebateEventType.ARGUMENT,
+        DebateEventType.VOTE,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_abandoned_debate_frees_its_executor_slot(fake_engine):
+    """Cancelling the only caller stops the debate instead of finishing it."""
+    release = threading.Event()
+    engine = fake_engine(release=release)
+    executor = GradingExecutor(max_workers=1)
+    grader = ListGrader(engine=engine, executor=executor)
+    request = GradeRequest(
+        army_list=ArmyList(faction="Orks", units=[Unit(name="Boyz", points=85)])
+    )
+
+    grading = asyncio.create_task(grader.grade(request))
+    await asyncio.sleep(0.05)
+    grading.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await grading
+    for _ in range(100):
+        if executor.stats()["running"] == 0:
+            break
+        await asyncio.sleep(0.01)
+
+    assert engine.cancelled == 1
+    assert executor.stats()["running"] == 0
+    assert grader._in_flight == {}
+    release.set()
+
+
+@pytest.mark.asyncio
+async def test_shared_debate_outlives_one_cancelled_caller(fake_engine):
+    """A coalesced debate keeps running while another caller still waits."""
+    release = threading.Event()
+    engine = fake_engine(release=release, events=True)
+    grader = ListGrader(engine=engine, executor=GradingExecutor(max_workers=1))
+    request = GradeRequest(
+        army_list=ArmyList(faction="Orks", units=[Unit(name="Boyz", points=85)])
+    )
+    abandoned, kept = [], []
+
+    leaving = asyncio.create_task(grader.grade(request, on_event=abandoned.append))
+    staying = asyncio.create_task(grader.grade(request, on_event=kept.append))
+    await asyncio.sleep(0.05)
+    leaving.cancel()
+    await asyncio.sleep(0.05)
+    release.set()
+    response = await staying
+
+    assert leaving.cancelled()
+    assert engine.cancelled == 0
+    assert [e.type for e in kept] == [DebateEventType.ARGUMENT, DebateEventType.VOTE]
+    assert response.council_verdict["prediction"] == "Player 1 wins"
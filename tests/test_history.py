@@ -0,0 +1,131 @@
+"""Unit tests for the incremental debate history."""
+
+from unittest.mock import patch
+
+from vindicta_oracle.history import EMPTY_HISTORY, DebateHistory, estimate_tokens
+from vindicta_oracle.models import AgentRole, Argument, ArgumentType
+
+
+def make_round(round_num: int, words: int = 5) -> list[Argument]:
+    """One argument per role, each ``words`` sentences long."""
+    return [
+        Argument(
+            agent_role=role,
+            round=round_num,
+            argument_type=ArgumentType.CLAIM,
+            content=" ".join(f"{role.value} point {i}." for i in range(words)),
+        )
+        for role in AgentRole
+    ]
+
+
+class TestRendering:
+    """Tests for the unbudgeted history."""
+
+    def test_empty_history(self):
+        """With no rounds, agents are told they open the debate."""
+        assert DebateHistory().render([], 1) == EMPTY_HISTORY
+
+    def test_matches_verbatim_format(self):
+        """Without a budget every argument is included as written."""
+        rounds = [make_round(1), make_round(2)]
+        text = DebateHistory().render(rounds, 3)
+
+        expected = "\n\n".join(
+            f"[{arg.agent_role.value.upper().replace('_', '-')}]: {arg.content}"
+            for round_args in rounds
+            for arg in round_args
+        )
+        assert text == expected
+
+    def test_upto_limits_rounds(self):
+        """Only the first ``upto`` rounds are rendered."""
+        rounds = [make_round(1), make_round(2)]
+        history = DebateHistory()
+
+        assert history.render(rounds, 1) == DebateHistory().render(rounds[:1], 1)
+
+    def test_rounds_are_formatted_once(self):
+        """Each round is formatted a single time however often it is read."""
+        rounds = [make_round(1)]
+        history = DebateHistory()
+
+        with patch.object(
+            DebateHistory, "_append", autospec=True, side_effect=DebateHistory._append
+        ) as append:
+            for _ in range(5):
+                history.render(rounds, 2)
+            rounds.append(make_round(2))
+            for _ in range(5):
+                history.render(rounds, 3)
+
+        assert append.call_count == 2
+        assert len(history) == 2
+
+    def test_agents_share_the_rendered_text(self):
+        """Reads of the same rounds return the identical cached string."""
+        rounds = [make_round(1)]
+        history = DebateHistory()
+
+        assert history.render(rounds, 2) is history.render(rounds, 2)
+
+
+class TestTokenBudget:
+    """Tests for keeping the history under a token budget."""
+
+    def test_older_rounds_are_condensed(self):
+        """Old rounds shrink to their first sentence; the latest stays verbatim."""
+        rounds = [make_round(n, words=20) for n in (1, 2, 3)]
+        unbounded = DebateHistory().render(rounds, 4)
+        history = DebateHistory(token_budget=estimate_tokens(unbounded) // 2)
+
+        text = history.render(rounds, 4)
+
+        assert estimate_tokens(text) <= history.token_budget
+        assert "[HOME, round 1]: home point 0." in text
+        assert "home point 1." not in text.split("[HOME]:")[0]
+        assert text.endswith(rounds[-1][-1].content)
+
+    def test_rounds_omitted_when_condensing_is_not_enough(self):
+        """Condensed rounds are dropped oldest first if still over budget."""
+        rounds = [make_round(n, words=20) for n in range(1, 6)]
+        latest = DebateHistory().render(rounds[-1:], 2)
+        history = DebateHistory(token_budget=estimate_tokens(latest) + 60)
+
+        text = history.render(rounds, 6)
+
+        assert text.startswith("(")
+        assert "earlier round(s) omitted" in text
+        assert "round 1]" not in text
+        assert text.endswith(rounds[-1][-1].content)
+
+    def test_recent_rounds_are_never_condensed(self):
+        """Rounds inside ``recent_rounds`` stay verbatim even over budget."""
+        rounds = [make_round(n, words=20) for n in (1, 2)]
+        history = DebateHistory(token_budget=1, recent_rounds=2)
+
+        assert history.render(rounds, 3) == DebateHistory().render(rounds, 3)
+
+
+class TestSummary:
+    """Tests for replacing early rounds with a rolling summary."""
+
+    def test_summary_replaces_covered_rounds(self):
+        """Summarized rounds are swapped for the summary text."""
+        rounds = [make_round(1), make_round(2), make_round(3)]
+        history = DebateHistory()
+        history.render(rounds, 4)
+
+        history.set_summary("[HOME]: still winning.", 2)
+        text = history.render(rounds, 4)
+
+        assert text.startswith("Summary of rounds 1-2:\n[HOME]: still winning.")
+        assert text.endswith(DebateHistory().render(rounds[2:], 2))
+
+    def test_summary_ignored_for_earlier_rounds(self):
+        """Asking for fewer rounds than the summary spans stays verbatim."""
+        rounds = [make_round(1), make_round(2)]
+        history = DebateHistory()
+        history.set_summary("summary", 2)
+
+        assert history.render(rounds, 1) == DebateHistory().render(rounds, 1)
@@ -0,0 +1,162 @@
+"""Unit tests for durable grading jobs."""
+
+import asyncio
+import threading
+from uuid import uuid4
+
+import pytest
+
+from vindicta_oracle import jobs
+from vindicta_oracle.executor import GradingExecutor
+from vindicta_oracle.grader import ListGrader
+from vindicta_oracle.jobs import JobRunner, JobStore
+from vindicta_oracle.models import (
+    ArmyList,
+    DebateEvent,
+    DebateEventType,
+    GradeRequest,
+    JobStatus,
+    Unit,
+)
+from vindicta_oracle.pool import EnginePool
+
+
+@pytest.fixture
+def request_payload():
+    """A minimal grading request."""
+    return GradeRequest(
+        army_list=ArmyList(faction="Orks", units=[Unit(name="Boyz", points=85)])
+    )
+
+
+class TestJobStore:
+    """Tests for job persistence."""
+
+    def test_jobs_survive_reopen(self, tmp_path, request_payload):
+        """Jobs, their requests and events are durable on disk."""
+        path = tmp_path / "jobs.sqlite"
+        store = JobStore(path)
+        job = store.create(request_payload)
+        store.append_event(
+            job.id,
+            DebateEvent(type=DebateEventType.VOTE, debate_id=uuid4(), data={}),
+        )
+        store.close()
+
+        reopened = JobStore(path)
+        assert reopened.get(job.id).status == JobStatus.QUEUED
+        assert reopened.request(job.id) == request_payload
+        assert [seq for seq, _ in reopened.events(job.id)] == [1]
+        assert [j.id for j in reopened.unfinished()] == [job.id]
+
+    def test_events_after_sequence(self, request_payload):
+        """Event reads resume after a given sequence number."""
+        store = JobStore()
+        job = store.create(request_payload)
+        for _ in range(3):
+            store.append_event(
+                job.id,
+                DebateEvent(type=DebateEventType.ARGUMENT, debate_id=uuid4(), data={}),
+            )
+
+        assert [seq for seq, _ in store.events(job.id, after=1)] == [2, 3]
+
+    def test_missing_job(self):
+        """Unknown jobs read as None."""
+        assert JobStore().get(uuid4()) is None
+
+
+class TestJobRunner:
+    """Tests for background job execution."""
+
+    @pytest.mark.asyncio
+    async def test_job_records_events_and_result(self, request_payload, fake_engine):
+        """A finished job has its result and every progress event."""
+        runner = JobRunner(JobStore())
+        grader = ListGrader(
+            engine=fake_engine(events=True), executor=GradingExecutor(max_workers=1)
+        )
+
+        job = runner.submit(request_payload, grader)
+        assert job.status == JobStatus.QUEUED
+        await asyncio.gather(*runner._tasks)
+
+        finished = runner.store.get(job.id)
+        assert finished.status == JobStatus.SUCCEEDED
+        assert finished.result.council_verdict["prediction"] == "Player 1 wins"
+        assert [e.type for _, e in runner.store.events(job.id)] == [
+            DebateEventType.ARGUMENT,
+            DebateEventType.VOTE,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_job_records_error(self, request_payload, fake_engine):
+        """Grading errors mark the job failed instead of escaping."""
+        runner = JobRunner(JobStore())
+        grader = ListGrader(
+            engine=fake_engine(error=ConnectionError("Ollama unavailable")),
+            executor=GradingExecutor(max_workers=1),
+        )
+
+        job = runner.submit(request_payload, grader)
+        await asyncio.gather(*runner._tasks)
+
+        failed = runner.store.get(job.id)
+        assert failed.status == JobStatus.FAILED
+        assert "Ollama unavailable" in failed.error
+
+    @pytest.mark.asyncio
+    async def test_full_executor_keeps_job_queued(
+        self, request_payload, monkeypatch, fake_engine
+    ):
+        """A job finding the executor full waits and retries instead of failing."""
+        monkeypatch.setattr(jobs, "QUEUE_FULL_RETRY_DELAY", 0.01)
+        release = threading.Event()
+        executor = GradingExecutor(max_workers=1, max_queue=0)
+        busy = ListGrader(engine=fake_engine(release=release), executor=executor)
+        runner = JobRunner(JobStore())
+        grader = ListGrader(engine=fake_engine(events=True), executor=executor)
+        other = GradeRequest(
+            army_list=ArmyList(faction="Orks", units=[Unit(name="Nobz", points=90)])
+        )
+
+        blocking = asyncio.create_task(busy.grade(other))
+        await asyncio.sleep(0.02)
+        job = runner.submit(request_payload, grader)
+        await asyncio.sleep(0.05)
+
+        assert runner.store.get(job.id).status == JobStatus.QUEUED
+        release.set()
+        await blocking
+        await asyncio.wait_for(asyncio.gather(*runner._tasks), timeout=5)
+        assert runner.store.get(job.id).status == JobStatus.SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_resume_reruns_unfinished_jobs(self, request_payload, fake_engine):
+        """Jobs left queued by a previous process are run again."""
+        store = JobStore()
+        job = store.create(request_payload)
+        store.update(job.id, JobStatus.RUNNING)
+        runner = JobRunner(store)
+        grader = ListGrader(
+            engine=fake_engine(events=True), executor=GradingExecutor(max_workers=1)
+        )
+
+        assert runner.resume(grader) == 1
+        await asyncio.gather(*runner._tasks)
+
+        assert store.get(job.id).status == JobStatus.SUCCEEDED
+
+    @pytest.mark.asyncio
+    async def test_resume_fails_jobs_without_a_grader(self, request_payload):
+        """Jobs whose routing profile is gone are failed, not resumed."""
+        store = JobStore()
+        job = store.create(
+            request_payload.model_copy(update={"routing_profile": "removed"})
+        )
+        pool = EnginePool()
+
+        assert JobRunner(store).resume(pool.grader_for) == 0
+        failed = store.get(job.id)
+        assert failed.status == JobStatus.FAILED
+        assert "removed" in failed.error
@@ -0,0 +1,274 @@
+"""Unit tests for the pooled Ollama clients."""
+
+import asyncio
+import time
+from concurrent.futures import CancelledError
+from typing import ClassVar
+from unittest.mock import patch
+
+import pytest
+
+from vindicta_oracle import ollama_client
+from vindicta_oracle.cache import ResponseCache
+from vindicta_oracle.models import AgentRole
+from vindicta_oracle.ollama_client import (
+    AsyncOllamaClient,
+    GenerationBudget,
+    OllamaClient,
+    OllamaConfig,
+    generation_budget,
+)
+from vindicta_oracle.telemetry import collect_telemetry
+
+STATS = {
+    "prompt_eval_count": 12,
+    "eval_count": 3,
+    "prompt_eval_duration": 4_000_000,
+    "eval_duration": 6_000_000,
+    "load_duration": 1_000_000,
+    "total_duration": 12_000_000,
+}
+
+
+class FakeAsyncClient:
+    """Stand-in for ``ollama.AsyncClient`` that tracks concurrency."""
+
+    instances: ClassVar[list["FakeAsyncClient"]] = []
+
+    def __init__(self, host=None, **kwargs):
+        self.host = host
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+        FakeAsyncClient.instances.append(self)
+
+    async def chat(self, model, messages, options=None, stream=False, **kwargs):
+        if stream:
+            return self._stream(messages[-1]["content"])
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.calls.append(
+            {"model": model, "messages": messages, "options": options, **kwargs}
+        )
+        await asyncio.sleep(0.02)
+        self.active -= 1
+        return {"message": {"content": f"reply to {messages[-1]['content']}"}, **STATS}
+
+    async def _stream(self, prompt):
+        for word in ["reply", " to", f" {prompt}"]:
+            await asyncio.sleep(0)
+            yield {"message": {"content": word}}
+        yield {"message": {"content": ""}, "done": True, **STATS}
+
+
+class SlowAsyncClient(FakeAsyncClient):
+    """Fake client whose "slow" prompts take seconds to answer.
+
+    Streams for "trickle" send one chunk, then stall for seconds.
+    """
+
+    async def chat(self, model, messages, options=None, stream=False, **kwargs):
+        if messages[-1]["content"] == "slow":
+            await asyncio.sleep(5)
+        return await super().chat(model, messages, options, stream, **kwargs)
+
+    async def _stream(self, prompt):
+        if prompt == "trickle":
+            yield {"message": {"content": "reply"}}
+            await asyncio.sleep(5)
+        async for part in super()._stream(prompt):
+            yield part
+
+
+@pytest.fixture
+def fake_pool():
+    """Give each test a fresh connection pool backed by FakeAsyncClient."""
+    FakeAsyncClient.instances = []
+    with (
+        patch.object(ollama_client, "_pool", None),
+        patch.object(ollama_client.ollama, "AsyncClient", FakeAsyncClient),
+    ):
+        yield
+
+
+def test_num_parallel_defaults_from_environment(monkeypatch):
+    """OLLAMA_NUM_PARALLEL sizes the default in-flight limit."""
+    monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "3")
+    assert OllamaConfig().num_parallel == 3
+
+
+def test_sync_facade_returns_content(fake_pool):
+    """OllamaClient.generate blocks until the pooled request completes."""
+    client = OllamaClient(OllamaConfig(model="mistral", max_tokens=64))
+
+    assert client.generate("system", "hello") == "reply to hello"
+    call = FakeAsyncClient.instances[0].calls[0]
+    assert call["model"] == "mistral"
+    assert call["options"]["num_predict"] == 64
+
+
+def test_per_call_format_and_max_tokens(fake_pool):
+    """Structured-output requests pass the format and their own token limit."""
+    client = OllamaClient(OllamaConfig(max_tokens=64))
+
+    client.generate("system", "hello", format="json", max_tokens=256)
+
+    call = FakeAsyncClient.instances[0].calls[0]
+    assert call["format"] == "json"
+    assert call["options"]["num_predict"] == 256
+
+
+def test_per_call_stop_sequences(fake_pool):
+    """Stop sequences are sent as an option only when given."""
+    client = OllamaClient()
+
+    client.generate("system", "a")
+    client.generate("system", "b", stop=["\n[HOME]:"])
+
+    first, second = FakeAsyncClient.instances[0].calls
+    assert "stop" not in first["options"]
+    assert second["options"]["stop"] == ["\n[HOME]:"]
+
+
+@pytest.mark.parametrize("streamed", [False, True])
+def test_calls_are_recorded_for_the_caller(fake_pool, streamed):
+    """Stats from the final response reach the caller's collector."""
+    client = OllamaClient(OllamaConfig(model="mistral"))
+
+    with collect_telemetry(AgentRole.ARBITER, "vote") as calls:
+        if streamed:
+            list(client.stream("system", "hello"))
+        else:
+            client.generate("system", "hello")
+
+    (call,) = calls
+    assert call.agent_role == AgentRole.ARBITER
+    assert call.phase == "vote"
+    assert call.model == "mistral"
+    assert call.prompt_tokens == 12
+    assert call.decode_ms == 6.0
+
+
+def test_stopped_streams_are_recorded(fake_pool):
+    """Closing a stream early records the time and tokens received so far."""
+    with patch.object(ollama_client.ollama, "AsyncClient", SlowAsyncClient):
+        client = OllamaClient(OllamaConfig(model="mistral"))
+        with collect_telemetry(AgentRole.HOME, "vote") as calls:
+            stream = client.stream("system", "trickle")
+            assert next(stream) == "reply"
+            stream.close()
+
+    (call,) = calls
+    assert call.stopped
+    assert call.model == "mistral"
+    assert call.completion_tokens == 1
+    assert call.total_ms > 0
+    assert call.prompt_tokens == 0
+
+
+def test_cancelled_generations_are_recorded(fake_pool):
+    """A generation cancelled through its budget is recorded as stopped."""
+    with patch.object(ollama_client.ollama, "AsyncClient", SlowAsyncClient):
+        client = OllamaClient(OllamaConfig(num_parallel=1))
+        budget = GenerationBudget(60)
+        with collect_telemetry(AgentRole.CHAOS, "vote") as calls:
+            with generation_budget(budget):
+                request = client.aio.submit("system", "slow")
+            while budget.started is None:
+                time.sleep(0.01)
+            time.sleep(0.02)
+            budget.cancel()
+
+    with pytest.raises(CancelledError):
+        request.result(timeout=1)
+    (call,) = calls
+    assert call.stopped
+    assert call.completion_tokens == 0
+    assert call.total_ms >= 20
+    assert budget.recorder.calls is calls
+
+
+def test_cache_hits_are_recorded_as_cached(fake_pool):
+    """Calls answered from the cache are recorded without stats."""
+    client = OllamaClient(cache=ResponseCache())
+    client.generate("system", "hello")
+
+    with collect_telemetry() as calls:
+        client.generate("system", "hello")
+
+    assert calls[0].cached
+    assert calls[0].prompt_tokens == 0
+
+
+def test_clients_share_one_connection_pool(fake_pool):
+    """Every client for the same host reuses the same AsyncClient."""
+    OllamaClient().generate("system", "a")
+    OllamaClient().generate("system", "b")
+
+    assert len(FakeAsyncClient.instances) == 1
+
+
+@pytest.mark.asyncio
+async def test_in_flight_requests_are_limited(fake_pool):
+    """The semaphore caps concurrent requests at num_parallel."""
+    client = AsyncOllamaClient(OllamaConfig(num_parallel=2))
+
+    replies = await asyncio.gather(
+        *(client.generate("system", str(i)) for i in range(6))
+    )
+
+    assert replies == [f"reply to {i}" for i in range(6)]
+    assert FakeAsyncClient.instances[0].peak == 2
+
+
+def test_sync_stream_yields_chunks(fake_pool):
+    """OllamaClient.stream yields chunks in order as they arrive."""
+    chunks = list(OllamaClient().stream("system", "hello"))
+
+    assert chunks == ["reply", " to", " hello"]
+
+
+@pytest.mark.asyncio
+async def test_async_stream_yields_chunks(fake_pool):
+    """AsyncOllamaClient.stream yields chunks without blocking the loop."""
+    client = AsyncOllamaClient()
+
+    chunks = [chunk async for chunk in client.stream("system", "hi")]
+
+    assert "".join(chunks) == "reply to hi"
+
+
+def test_budget_runs_only_while_holding_a_slot(fake_pool):
+    """Queued requests don't use their budget; cancelling frees the slot."""
+    with patch.object(ollama_client.ollama, "AsyncClient", SlowAsyncClient):
+        client = OllamaClient(OllamaConfig(num_parallel=1))
+        first, second = GenerationBudget(60), GenerationBudget(60)
+        with generation_budget(first):
+            slow = client.aio.submit("system", "slow")
+        with generation_budget(second):
+            queued = client.aio.submit("system", "hello")
+
+        while first.started is None:
+            time.sleep(0.01)
+        assert second.started is None
+
+        first.cancel()
+
+        with pytest.raises(CancelledError):
+            slow.result(timeout=1)
+        assert queued.result(timeout=1) == "reply to hello"
+        assert second.started is not None
+
+
+def test_budget_is_shared_by_successive_generations(fake_pool):
+    """Slot time used by earlier generations stays spent for later ones."""
+    client = OllamaClient()
+    budget = GenerationBudget(60)
+
+    with generation_budget(budget):
+        client.generate("system", "first")
+        client.generate("system", "retry")
+    budget.mark_queued()
+
+    assert budget.used >= 0.04
+    assert budget.remaining() is None
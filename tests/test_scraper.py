@@ -0,0 +1,128 @@
+"""Unit tests for concurrent rules scraping."""
+
+import asyncio
+import time
+from collections import defaultdict
+from itertools import pairwise
+
+import pytest
+
+from vindicta_oracle.rag_pipeline.scraper import ScrapeLimits, scrape_urls
+
+
+class FakeCrawler:
+    """Crawler that tracks how many fetches run at once, overall and per host."""
+
+    def __init__(self, fail: tuple[str, ...] = (), delay: float = 0.02):
+        self.fail = fail
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.host_active: dict[str, int] = defaultdict(int)
+        self.host_peak: dict[str, int] = defaultdict(int)
+        self.starts: dict[str, list[float]] = defaultdict(list)
+
+    async def fetch_markdown(self, url: str) -> str:
+        host = url.split("/")[2]
+        self.starts[host].append(time.monotonic())
+        self.active += 1
+        self.host_active[host] += 1
+        self.peak = max(self.peak, self.active)
+        self.host_peak[host] = max(self.host_peak[host], self.host_active[host])
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        self.host_active[host] -= 1
+        if url in self.fail:
+            raise ConnectionError(f"refused: {url}")
+        return f"# Page\n\nRules from {url}"
+
+
+def make_urls(hosts: int, pages: int) -> list[str]:
+    """``pages`` URLs on each of ``hosts`` hosts."""
+    return [
+        f"https://host{h}.example/page/{p}" for p in range(pages) for h in range(hosts)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_limits_are_respected():
+    """Fetches stay within the global and per-host caps."""
+    crawler = FakeCrawler()
+    limits = ScrapeLimits(
+        max_concurrency=4, per_host_connections=2, per_host_interval=0
+    )
+
+    result = await scrape_urls(make_urls(3, 6), crawler=crawler, limits=limits)
+
+    assert result.success_count == 18
+    assert crawler.peak == 4
+    assert max(crawler.host_peak.values()) <= 2
+
+
+@pytest.mark.asyncio
+async def test_requests_to_a_host_are_spaced():
+    """Requests to one host start at least ``per_host_interval`` apart."""
+    crawler = FakeCrawler(delay=0)
+    limits = ScrapeLimits(per_host_connections=4, per_host_interval=0.05)
+
+    await scrape_urls(make_urls(1, 3), crawler=crawler, limits=limits)
+
+    starts = crawler.starts["host0.example"]
+    assert all(b - a >= 0.045 for a, b in pairwise(starts))
+
+
+@pytest.mark.asyncio
+async def test_results_keep_url_order_and_collect_errors():
+    """Chunks follow the input order; failed pages land in the errors."""
+    urls = make_urls(2, 2)
+    crawler = FakeCrawler(fail=(urls[1],))
+    limits = ScrapeLimits(per_host_interval=0)
+
+    result = await scrape_urls(urls, crawler=crawler, limits=limits)
+
+    assert [chunk.url for chunk in result.chunks] == [urls[0], urls[2], urls[3]]
+    assert result.errors == [
+        {
+            "url": urls[1],
+            "error_type": "ConnectionError",
+            "message": f"refused: {urls[1]}",
+        }
+    ]
+
+
+def test_rejects_invalid_limits():
+    """Concurrency caps below 1 are a configuration error."""
+    with pytest.raises(ValueError):
+        ScrapeLimits(max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_busy_host_does_not_block_other_hosts():
+    """Pages queued for one host don't hold the global slots."""
+    crawler = FakeCrawler(delay=0.05)
+    limits = ScrapeLimits(
+        max_concurrency=2, per_host_connections=1, per_host_interval=0
+    )
+    urls = [f"https://busy.example/page/{p}" for p in range(6)]
+    urls.append("https://idle.example/page/0")
+
+    start = time.monotonic()
+    await scrape_urls(urls, crawler=crawler, limits=limits)
+
+    assert crawler.starts["idle.example"][0] - start < 0.04
+
+
+@pytest.mark.asyncio
+async def test_spacing_holds_when_global_slots_are_scarce():
+    """Waiting for a global slot doesn't use up a host's spacing."""
+    crawler = FakeCrawler(delay=0.05)
+    limits = ScrapeLimits(
+        max_concurrency=1, per_host_connections=2, per_host_interval=0.1
+    )
+    urls = [f"https://other.example/page/{p}" for p in range(2)]
+    urls += [f"https://host0.example/page/{p}" for p in range(4)]
+
+    await scrape_urls(urls, crawler=crawler, limits=limits)
+
+    starts = crawler.starts["host0.example"]
+    assert all(b - a >= 0.095 for a, b in pairwise(starts))
@@ -0,0 +1,225 @@
+"""Unit tests for rules storage batching, dedup and versioning."""
+
+import importlib
+import sys
+import types
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel, Field
+
+from vindicta_oracle.rag_pipeline.scraper import ScrapedChunk, compute_content_hash
+
+STORAGE = "vindicta_oracle.rag_pipeline.storage"
+
+
+class RulesSegment(BaseModel):
+    """Stand-in for ``vindicta_foundation.models.rag.RulesSegment``."""
+
+    id: UUID = Field(default_factory=uuid4)
+    url: str
+    content_markdown: str
+    content_hash: str
+    version: int = 1
+    embedding: list[float] | None = None
+    timestamp: datetime | None = None
+
+
+def foundation_stubs():
+    """Modules standing in for the parts of vindicta_foundation storage uses."""
+    rag = types.ModuleType("vindicta_foundation.models.rag")
+    rag.RulesSegment = RulesSegment
+    scraper = types.ModuleType("vindicta_foundation.rag_pipeline.scraper")
+    scraper.ScrapedChunk = ScrapedChunk
+    return {
+        "vindicta_foundation": types.ModuleType("vindicta_foundation"),
+        "vindicta_foundation.models": types.ModuleType("vindicta_foundation.models"),
+        "vindicta_foundation.models.rag": rag,
+        "vindicta_foundation.rag_pipeline": types.ModuleType(
+            "vindicta_foundation.rag_pipeline"
+        ),
+        "vindicta_foundation.rag_pipeline.scraper": scraper,
+    }
+
+
+@pytest.fixture
+def rules_storage(monkeypatch):
+    """The ``RulesStorage`` class, even without vindicta_foundation installed."""
+    try:
+        importlib.import_module("vindicta_foundation")
+    except ImportError:
+        for name, module in foundation_stubs().items():
+            monkeypatch.setitem(sys.modules, name, module)
+    else:
+        yield importlib.import_module(STORAGE).RulesStorage
+        return
+
+    # Import storage against the stand-ins, then forget that import
+    previous = sys.modules.pop(STORAGE, None)
+    try:
+        yield importlib.import_module(STORAGE).RulesStorage
+    finally:
+        sys.modules.pop(STORAGE, None)
+        if previous is not None:
+            sys.modules[STORAGE] = previous
+
+
+def make_chunk(url, text):
+    return ScrapedChunk(
+        url=url, content_markdown=text, content_hash=compute_content_hash(text)
+    )
+
+
+class FakeStore:
+    """In-memory vector store recording upserts and ``get`` filters."""
+
+    def __init__(self):
+        self.records = {}
+        self.upserts = []
+        self.gets = []
+
+    def upsert(self, ids, documents, metadatas, embeddings):
+        self.upserts.append(list(ids))
+        for id_, doc, meta in zip(ids, documents, metadatas):
+            self.records[id_] = (doc, meta)
+
+    def get(self, ids=None, where=None, include=None):
+        self.gets.append(where)
+        matches = list(self.records.values())
+        for key, condition in (where or {}).items():
+            matches = [(d, m) for d, m in matches if m.get(key) in condition["$in"]]
+        return {
+            "documents": [doc for doc, _ in matches],
+            "metadatas": [meta for _, meta in matches],
+        }
+
+
+class BatchEmbedder:
+    """Embedder counting single and batched calls."""
+
+    def __init__(self):
+        self.batches = []
+
+    def embed(self, text):
+        return [float(len(text))]
+
+    def embed_batch(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+class SingleEmbedder:
+    """Embedder without ``embed_batch``."""
+
+    def __init__(self):
+        self.texts = []
+
+    def embed(self, text):
+        self.texts.append(text)
+        return [float(len(text))]
+
+
+class TestStoreChunks:
+    """Tests for batched storage through the vector store."""
+
+    def test_duplicates_within_a_batch_are_stored_once(self, rules_storage):
+        """A repeated chunk is embedded and upserted once, returned twice."""
+        store, embedder = FakeStore(), BatchEmbedder()
+        storage = rules_storage(store, embedder)
+        chunks = [
+            make_chunk("https://a", "Fights first"),
+            make_chunk("https://b", "Fights first"),
+            make_chunk("https://a", "Lone operative"),
+        ]
+
+        segments = storage.store_chunks(chunks)
+
+        assert embedder.batches == [["Fights first", "Lone operative"]]
+        assert len(store.upserts) == 1
+        assert len(store.upserts[0]) == 2
+        assert segments[0] is segments[1]
+        assert str(segments[1].url).startswith("https://a")
+        assert [s.version for s in segments] == [1, 1, 2]
+
+    def test_versions_continue_across_batches(self, rules_storage):
+        """Later batches and calls see the versions stored before them."""
+        store = FakeStore()
+        storage = rules_storage(store, BatchEmbedder(), batch_size=2)
+
+        first = storage.store_chunks(
+            [make_chunk("https://a", f"rule {n}") for n in range(3)]
+        )
+        second = storage.store_chunks(
+            [make_chunk("https://a", "rule 1"), make_chunk("https://a", "rule 3")]
+        )
+
+        assert [s.version for s in first] == [1, 2, 3]
+        assert [s.version for s in second] == [2, 4]
+        assert [len(ids) for ids in store.upserts] == [2, 1, 1]
+
+    def test_provider_without_embed_batch(self, rules_storage):
+        """Providers lacking ``embed_batch`` embed one text at a time."""
+        store, embedder = FakeStore(), SingleEmbedder()
+        storage = rules_storage(store, embedder)
+
+        segments = storage.store_chunks(
+            [make_chunk("https://a", "Deep strike"), make_chunk("https://a", "Scout")]
+        )
+
+        assert embedder.texts == ["Deep strike", "Scout"]
+        assert [s.embedding for s in segments] == [[11.0], [5.0]]
+        assert len(store.upserts) == 1
+
+    def test_rejects_empty_batches(self, rules_storage):
+        """Batches must hold at least one chunk."""
+        with pytest.raises(ValueError):
+            rules_storage(FakeStore(), BatchEmbedder(), batch_size=0)
+
+
+class TestIndexedStorage:
+    """Tests for lookups answered by the dedup index."""
+
+    def seeded_store(self, rules_storage):
+        store = FakeStore()
+        rules_storage(store, BatchEmbedder()).store_chunks(
+            [make_chunk("https://a", "rule 0"), make_chunk("https://a", "rule 1")]
+        )
+        store.gets.clear()
+        store.upserts.clear()
+        return store
+
+    def test_index_skips_store_lookups(self, rules_storage):
+        """Known hashes and URL versions don't query the store per batch."""
+        store = self.seeded_store(rules_storage)
+        storage = rules_storage.with_index(store, BatchEmbedder(), batch_size=1)
+        loads = len(store.gets)
+
+        segments = storage.store_chunks(
+            [
+                make_chunk("https://a", "rule 1"),
+                make_chunk("https://a", "rule 2"),
+                make_chunk("https://a", "rule 3"),
+            ]
+        )
+
+        assert len(store.gets) == loads
+        assert [s.version for s in segments] == [2, 3, 4]
+        assert len(store.upserts) == 2
+
+    def test_bloom_index_confirms_hits_in_store(self, rules_storage):
+        """With a Bloom filter, possible duplicates are checked in the store."""
+        store = self.seeded_store(rules_storage)
+        storage = rules_storage.with_index(store, BatchEmbedder(), bloom_capacity=100)
+        loads = len(store.gets)
+
+        segments = storage.store_chunks(
+            [make_chunk("https://a", "rule 0"), make_chunk("https://a", "rule 2")]
+        )
+
+        lookups = store.gets[loads:]
+        assert lookups == [{"content_hash": {"$in": [compute_content_hash("rule 0")]}}]
+        assert segments[0].content_markdown == "rule 0"
+        assert segments[0].version == 1
+        assert segments[1].version == 3
+        assert [len(ids) for ids in store.upserts] == [1]
@@ -0,0 +1,126 @@
+"""Unit tests for per-call LLM telemetry."""
+
+import pytest
+
+from vindicta_oracle.models import AgentRole, CallTelemetry
+from vindicta_oracle.telemetry import (
+    LOAD_STALL_MS,
+    CallProgress,
+    collect_telemetry,
+    current_recorder,
+    summarize_telemetry,
+)
+
+STATS = {
+    "prompt_eval_count": 400,
+    "eval_count": 100,
+    "prompt_eval_duration": 200_000_000,
+    "eval_duration": 2_000_000_000,
+    "load_duration": 5_000_000,
+    "total_duration": 2_300_000_000,
+}
+
+
+def make_call(role, phase="respond", round_num=1, **fields) -> CallTelemetry:
+    """A call with round-number stats for aggregation tests."""
+    defaults = {
+        "prompt_tokens": 400,
+        "completion_tokens": 100,
+        "prefill_ms": 200.0,
+        "decode_ms": 2000.0,
+    }
+    return CallTelemetry(
+        agent_role=role,
+        phase=phase,
+        round=round_num,
+        model="llama3.2",
+        **{**defaults, **fields},
+    )
+
+
+class TestCollection:
+    """Tests for recording calls inside ``collect_telemetry``."""
+
+    def test_records_ollama_stats(self):
+        """Counts are copied and nanosecond durations become milliseconds."""
+        with collect_telemetry(AgentRole.CHAOS, "respond", 2) as calls:
+            current_recorder().record("llama3.2", STATS)
+
+        (call,) = calls
+        assert call.agent_role == AgentRole.CHAOS
+        assert call.round == 2
+        assert call.prompt_tokens == 400
+        assert call.completion_tokens == 100
+        assert call.prefill_ms == 200.0
+        assert call.decode_ms == 2000.0
+        assert call.load_ms == 5.0
+
+    def test_nested_blocks_take_over_recording(self):
+        """Calls go to the innermost block; the outer one resumes after it."""
+        with collect_telemetry(phase="vote") as outer:
+            with collect_telemetry(phase="summary") as inner:
+                current_recorder().record("m", None, cached=True)
+            current_recorder().record("m", STATS)
+
+        assert [call.phase for call in inner] == ["summary"]
+        assert inner[0].cached
+        assert [call.phase for call in outer] == ["vote"]
+        assert current_recorder() is None
+
+    def test_stopped_calls_use_client_side_estimates(self):
+        """Chunks received count as tokens; prefill lasts until the first."""
+        progress = CallProgress()
+        assert progress.stats() is None
+        progress.start()
+        progress.token()
+        progress.token()
+
+        with collect_telemetry(AgentRole.HOME, "vote") as calls:
+            current_recorder().record("llama3.2", progress.stats(), stopped=True)
+
+        (call,) = calls
+        assert call.stopped
+        assert call.completion_tokens == 2
+        assert call.total_ms == pytest.approx(call.prefill_ms + call.decode_ms)
+        assert summarize_telemetry(calls)["debate"]["stopped_calls"] == 1
+
+
+class TestSummary:
+    """Tests for aggregating calls into grade metadata."""
+
+    def test_groups_by_agent_round_and_phase(self):
+        """Each call counts towards its agent, round and phase."""
+        calls = [
+            make_call(AgentRole.HOME, round_num=1),
+            make_call(AgentRole.HOME, round_num=2),
+            make_call(AgentRole.CHAOS, round_num=1),
+            make_call(AgentRole.HOME, phase="vote", round_num=None),
+            make_call(None, phase="summary", round_num=1),
+        ]
+
+        summary = summarize_telemetry(calls)
+
+        assert summary["debate"]["calls"] == 5
+        assert summary["by_agent"]["home"]["calls"] == 3
+        assert summary["by_agent"]["council"]["calls"] == 1
+        assert summary["by_round"]["1"]["calls"] == 2
+        assert summary["by_phase"]["vote"]["completion_tokens"] == 100
+
+    def test_throughput_and_stalls(self):
+        """Rates are per second of prefill or decode; slow loads are stalls."""
+        calls = [
+            make_call(AgentRole.HOME),
+            make_call(AgentRole.HOME, load_ms=LOAD_STALL_MS * 4),
+        ]
+
+        totals = summarize_telemetry(calls)["debate"]
+
+        assert totals["prefill_tokens_per_sec"] == 2000.0
+        assert totals["decode_tokens_per_sec"] == 50.0
+        assert totals["load_stalls"] == 1
+
+    def test_cached_calls_have_no_rate(self):
+        """Groups without measured time report no throughput."""
+        totals = summarize_telemetry([make_call(None, prefill_ms=0, decode_ms=0)])
+
+        assert totals["debate"]["decode_tokens_per_sec"] is None
@@ -0,0 +1,86 @@
+"""Unit tests for the incremental vote reader."""
+
+import pytest
+from pydantic import ValidationError
+
+from vindicta_oracle.vote_reader import VoteLimits, VoteReader, read_vote_fields
+
+VOTE = (
+    "WINNER: Player 1\n"
+    "PROBABILITY: 65%\n"
+    "REASONING: Bolters beat Boyz at 3.5 inches. The Captain holds. Orks fold."
+)
+
+
+def feed_all(reader: VoteReader, text: str, size: int = 4) -> int:
+    """Feed ``text`` in chunks; returns how many chunks were needed."""
+    for count, start in enumerate(range(0, len(text), size), 1):
+        if reader.feed(text[start : start + size]):
+            return count
+    return -1
+
+
+class TestVoteReader:
+    """Tests for detecting a complete vote."""
+
+    def test_completes_at_sentence_limit(self):
+        """Reasoning is cut after ``max_sentences`` sentences."""
+        reader = VoteReader(VoteLimits(max_sentences=2, max_chars=None))
+
+        assert feed_all(reader, VOTE) > 0
+        assert reader.text.endswith(
+            "Bolters beat Boyz at 3.5 inches. The Captain holds."
+        )
+
+    def test_completes_at_char_limit(self):
+        """Reasoning is cut at ``max_chars`` characters."""
+        reader = VoteReader(VoteLimits(max_sentences=None, max_chars=12))
+
+        assert feed_all(reader, VOTE) > 0
+        assert reader.text.endswith("REASONING: Bolters beat")
+
+    def test_incomplete_without_every_field(self):
+        """Long reasoning alone doesn't finish a vote missing its winner."""
+        reader = VoteReader(VoteLimits(max_sentences=1))
+
+        assert feed_all(reader, "PROBABILITY: 65%\nREASONING: One. Two. ") == -1
+        assert not reader.complete
+
+    def test_incomplete_until_winner_names_a_side(self):
+        """A WINNER line without a readable side doesn't count."""
+        reader = VoteReader(VoteLimits(max_sentences=1))
+
+        assert (
+            feed_all(reader, "WINNER: TBD\nPROBABILITY: 65%\nREASONING: A. B. ") == -1
+        )
+
+    def test_unfinished_sentence_is_not_counted(self):
+        """A final sentence counts only once whitespace follows it."""
+        reader = VoteReader(VoteLimits(max_sentences=1))
+
+        assert not reader.feed("WINNER: Draw\nPROBABILITY: 50%\nREASONING: Even.")
+        assert reader.feed(" More")
+        assert reader.text.endswith("REASONING: Even.")
+
+    def test_limits_need_at_least_one_bound(self):
+        """Disabling both limits is rejected."""
+        with pytest.raises(ValidationError):
+            VoteLimits(max_sentences=None, max_chars=None)
+
+
+class TestReadVoteFields:
+    """Tests for reading a finished vote's fields."""
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("WINNER: Player 1\nPROBABILITY: 65%", ("Player 1 wins", 0.65)),
+            ("**WINNER:** [Player 2]\nPROBABILITY: 0.7", ("Player 2 wins", 0.7)),
+            ("WINNER: Draw\nREASONING: Player 2 stalls.", ("Draw", None)),
+            ("I think player 2 wins, 80%", (None, None)),
+            ("WINNER: unclear\nPROBABILITY: 140%", (None, 1.0)),
+        ],
+    )
+    def test_fields(self, text, expected):
+        """Values come from the field lines only."""
+        assert read_vote_fields(text) == expected